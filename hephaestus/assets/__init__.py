@@ -0,0 +1,6 @@
+"""Hephaestus build-time asset pipeline."""
+from .bundler import bundle_document
+from .images import optimize_directory
+from .precompress import precompress_directory
+
+__all__ = ["bundle_document", "optimize_directory", "precompress_directory"]
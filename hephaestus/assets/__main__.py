@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Hephaestus asset pipeline CLI.
+
+Usage:
+    python -m hephaestus.assets bundle [--ui-dir DIR]
+    python -m hephaestus.assets images [--ui-dir DIR] [--force] [--no-webp] [--widths W ...]
+    python -m hephaestus.assets precompress [--ui-dir DIR] [--force] [--no-brotli]
+    python -m hephaestus.assets clean [--ui-dir DIR]
+"""
+import argparse
+import sys
+from pathlib import Path
+
+from hephaestus.assets.bundler import bundle_document, format_manifest
+from hephaestus.assets.images import DEFAULT_WIDTHS, format_report, optimize_directory
+from hephaestus.assets.precompress import format_summary, precompress_directory, remove_variants
+
+# The ui directory sits next to the hephaestus package
+DEFAULT_UI_DIR = Path(__file__).parent.parent.parent / "ui"
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Hephaestus UI asset pipeline")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    bundle = subparsers.add_parser("bundle", help="Bundle index.html scripts/styles into hashed files")
+    bundle.add_argument("--ui-dir", default=str(DEFAULT_UI_DIR), help="UI directory to process")
+    bundle.add_argument("--document", default="index.html", help="Document whose assets are bundled")
+
+    images = subparsers.add_parser("images", help="Build resized/recompressed variants of ui/images")
+    images.add_argument("--ui-dir", default=str(DEFAULT_UI_DIR), help="UI directory to process")
+    images.add_argument("--widths", type=int, nargs="+", default=list(DEFAULT_WIDTHS), help="Variant widths")
+    images.add_argument("--force", action="store_true", help="Rebuild variants even if current")
+    images.add_argument("--no-webp", action="store_true", help="Only build variants in the original format")
+
+    precompress = subparsers.add_parser("precompress", help="Build .gz/.br variants of text assets")
+    precompress.add_argument("--ui-dir", default=str(DEFAULT_UI_DIR), help="UI directory to process")
+    precompress.add_argument("--force", action="store_true", help="Rebuild variants even if current")
+    precompress.add_argument("--no-brotli", action="store_true", help="Only build gzip variants")
+
+    clean = subparsers.add_parser("clean", help="Remove precompressed variants")
+    clean.add_argument("--ui-dir", default=str(DEFAULT_UI_DIR), help="UI directory to process")
+
+    return parser.parse_args()
+
+
+def main():
+    """Main entry point."""
+    args = parse_args()
+
+    if args.command == "bundle":
+        manifest = bundle_document(args.ui_dir, args.document)
+        print(format_manifest(manifest, args.ui_dir))
+    elif args.command == "images":
+        images_dir = Path(args.ui_dir) / "images"
+        manifest = optimize_directory(images_dir, widths=args.widths, use_webp=not args.no_webp, force=args.force)
+        print(format_report(manifest, images_dir))
+    elif args.command == "precompress":
+        summary = precompress_directory(args.ui_dir, use_brotli=not args.no_brotli, force=args.force)
+        print(format_summary(summary, args.ui_dir))
+    elif args.command == "clean":
+        removed = remove_variants(args.ui_dir)
+        print(f"Removed {removed} precompressed variants from {args.ui_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,320 @@
+"""
+Build-time bundling of the scripts and stylesheets referenced by index.html.
+
+Consecutive ``<script src>`` tags (and consecutive stylesheet ``<link>``
+tags) are concatenated into bundles written to ``ui/dist`` under
+content-hashed filenames, e.g. ``dist/index-2.1f0c9a7b3e2d4c5a.js``. Because
+the name changes whenever the content does, the server can mark bundles as
+immutable and browsers never need to revalidate them.
+
+Only runs that can be merged without changing behaviour are bundled:
+
+* a run is broken by inline scripts or any markup other than whitespace and
+  comments, so execution order relative to inline code is preserved;
+* scripts with extra attributes (``defer``, ``async``, ``type="module"``...)
+  and stylesheets with an ``id``/``media`` (e.g. the theme stylesheet that is
+  swapped at runtime) are left alone;
+* a script that declares the same top-level ``const``/``let``/``class`` as an
+  earlier one in the run starts a new bundle, since a duplicate declaration
+  inside one script is a SyntaxError that would take the whole bundle down;
+* scripts opening with a directive prologue (``"use strict"``) are left
+  alone: inside a bundle the directive would either be ignored or, for the
+  first file, make every other file in the bundle strict;
+* stylesheets using ``@import`` are not merged, and relative ``url()``
+  references are rewritten so they still resolve from ``dist/``.
+
+Bundling does change error isolation: separate ``<script>`` tags run
+independently, but an uncaught exception thrown while a bundled file runs
+its top-level code stops the rest of that bundle, so the files after it in
+the same bundle never execute. Files cannot be wrapped to contain this,
+because their top-level declarations have to stay global.
+
+The rewritten document is written to ``dist/index.html`` and
+``dist/manifest.json`` records the size and mtime of every source. The server
+only serves the rewritten document while all sources are unchanged, so
+editing any file falls back to the original tags until the next build. A
+build whose rewrite would differ from the source in anything but the
+replaced tags (and the comments and whitespace between them) fails instead.
+"""
+import hashlib
+import json
+import logging
+import os
+import posixpath
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+DIST_DIRECTORY = "dist"
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+# Hex digits of content hash used in bundle filenames
+HASH_LENGTH = 16
+
+# Tokens that matter when scanning a document for bundleable tags
+TOKEN_PATTERN = re.compile(
+    r"<!--.*?-->"
+    r"|<script\b(?P<script_attrs>[^>]*)>(?P<script_body>.*?)</script\s*>"
+    r"|<link\b(?P<link_attrs>[^>]*)>",
+    re.IGNORECASE | re.DOTALL,
+)
+ATTRIBUTE_PATTERN = re.compile(r"""([\w:-]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+)))?""")
+TOP_LEVEL_DECLARATION = re.compile(r"^(?:const|let|class)\s+([A-Za-z_$][\w$]*)", re.MULTILINE)
+# A string-literal statement before any code, after optional comments
+DIRECTIVE_PROLOGUE = re.compile(
+    r"""\A(?:\s|//[^\n]*|/\*.*?\*/)*(["'])[^"'\\\n]*\1\s*(?:;|\n|\Z)""",
+    re.DOTALL,
+)
+CSS_URL_PATTERN = re.compile(r"""url\(\s*(['"]?)([^'")]+)\1\s*\)""", re.IGNORECASE)
+
+
+def _parse_attributes(text: str) -> Dict[str, str]:
+    """Parse tag attributes into a lowercase-keyed dict"""
+    attributes = {}
+    for match in ATTRIBUTE_PATTERN.finditer(text):
+        name = match.group(1).lower()
+        value = next((group for group in match.groups()[1:] if group is not None), "")
+        attributes[name] = value
+    return attributes
+
+
+def _local_path(ui_dir: Path, reference: str) -> Optional[str]:
+    """Return the ui-relative path of a local asset reference, or None"""
+    if not reference or re.match(r"^[a-z][a-z0-9+.-]*:|^//", reference, re.IGNORECASE):
+        return None
+    if "?" in reference or "#" in reference:
+        return None
+    relative = posixpath.normpath(reference.lstrip("/"))
+    if relative.startswith("..") or not (ui_dir / relative).is_file():
+        return None
+    return relative
+
+
+def _bundleable(match: "re.Match", ui_dir: Path) -> Optional[Tuple[str, str]]:
+    """Classify a token as (kind, ui-relative path) if it may join a bundle"""
+    if match.group("script_attrs") is not None:
+        attributes = _parse_attributes(match.group("script_attrs"))
+        if match.group("script_body").strip():
+            return None
+        if set(attributes) - {"src", "type"}:
+            return None
+        if attributes.get("type", "text/javascript").lower() not in ("text/javascript", "application/javascript"):
+            return None
+        path = _local_path(ui_dir, attributes.get("src", ""))
+        if not path or DIRECTIVE_PROLOGUE.match((ui_dir / path).read_text(encoding="utf-8", errors="replace")):
+            return None
+        return "js", path
+
+    if match.group("link_attrs") is not None:
+        attributes = _parse_attributes(match.group("link_attrs").rstrip("/"))
+        if attributes.get("rel", "").lower() != "stylesheet":
+            return None
+        if set(attributes) - {"rel", "href", "type"}:
+            return None
+        path = _local_path(ui_dir, attributes.get("href", ""))
+        if not path or b"@import" in (ui_dir / path).read_bytes():
+            return None
+        return "css", path
+    return None
+
+
+def find_runs(html: str, ui_dir: Path) -> List[Dict[str, Any]]:
+    """
+    Find runs of adjacent bundleable tags in a document.
+
+    Returns:
+        List of runs with their kind, source paths and (start, end) span
+    """
+    runs = []
+    current = None
+    position = 0
+    # Text since the previous tag; comments are skipped but not what surrounds them
+    pending = []
+
+    for match in TOKEN_PATTERN.finditer(html):
+        pending.append(html[position:match.start()])
+        position = match.end()
+        if match.group(0).startswith("<!--"):
+            continue
+        gap = "".join(pending)
+        pending = []
+
+        classified = _bundleable(match, ui_dir)
+        if current is not None and (gap.strip() or classified is None or classified[0] != current["kind"]):
+            runs.append(current)
+            current = None
+        if classified is None:
+            continue
+
+        kind, path = classified
+        names = set()
+        if kind == "js":
+            source = (ui_dir / path).read_text(encoding="utf-8", errors="replace")
+            names = set(TOP_LEVEL_DECLARATION.findall(source))
+        if current is not None and names & current["declarations"]:
+            runs.append(current)
+            current = None
+        if current is None:
+            current = {"kind": kind, "sources": [], "start": match.start(), "declarations": set()}
+        current["declarations"] |= names
+        current["sources"].append(path)
+        current["end"] = match.end()
+
+    if current is not None:
+        runs.append(current)
+    return runs
+
+
+def _without_tags(html: str, ui_dir: Path, paths: set) -> str:
+    """Document text without comments, whitespace and the tags loading paths"""
+    pieces = []
+    position = 0
+    for match in TOKEN_PATTERN.finditer(html):
+        if not match.group(0).startswith("<!--"):
+            classified = _bundleable(match, ui_dir)
+            if classified is None or classified[1] not in paths:
+                continue
+        pieces.append(html[position:match.start()])
+        position = match.end()
+    pieces.append(html[position:])
+    return re.sub(r"\s+", "", "".join(pieces))
+
+
+def _rewrite_css_urls(css: str, source: str) -> str:
+    """Rewrite relative url() references in a stylesheet so they resolve from dist/"""
+    source_dir = posixpath.dirname(source)
+
+    def rewrite(match):
+        quote, reference = match.group(1), match.group(2).strip()
+        if re.match(r"^(?:[a-z][a-z0-9+.-]*:|/|#)", reference, re.IGNORECASE):
+            return match.group(0)
+        target = posixpath.normpath(posixpath.join(source_dir, reference))
+        relative = posixpath.relpath(target, DIST_DIRECTORY)
+        return f"url({quote}{relative}{quote})"
+
+    return CSS_URL_PATTERN.sub(rewrite, css)
+
+
+def _bundle_contents(ui_dir: Path, kind: str, sources: List[str]) -> bytes:
+    """Concatenate sources into one bundle body"""
+    parts = []
+    for source in sources:
+        text = (ui_dir / source).read_text(encoding="utf-8")
+        if kind == "js":
+            # Trailing empty statement stops a file that ends without a
+            # semicolon from running into the next one
+            parts.append(f"/* {source} */\n{text}\n;\n")
+        else:
+            parts.append(f"/* {source} */\n{_rewrite_css_urls(text, source)}\n")
+    return "".join(parts).encode("utf-8")
+
+
+def _source_state(ui_dir: Path, relative: str) -> List[int]:
+    """Record size and mtime of a source so the server can detect edits"""
+    stat_result = (ui_dir / relative).stat()
+    return [stat_result.st_size, stat_result.st_mtime_ns]
+
+
+def bundle_document(ui_dir: Union[str, Path], document: str = "index.html") -> Dict[str, Any]:
+    """
+    Bundle the scripts and stylesheets of one document and write the manifest.
+
+    Args:
+        ui_dir: UI directory containing the document
+        document: Document path relative to ui_dir
+
+    Returns:
+        The manifest that was written
+    """
+    ui_dir = Path(ui_dir)
+    dist_dir = ui_dir / DIST_DIRECTORY
+    dist_dir.mkdir(exist_ok=True)
+
+    html = (ui_dir / document).read_text(encoding="utf-8")
+    stem = Path(document).stem
+    runs = find_runs(html, ui_dir)
+
+    bundles = {}
+    sources = {document: _source_state(ui_dir, document)}
+    pieces = []
+    position = 0
+    for index, run in enumerate(runs):
+        contents = _bundle_contents(ui_dir, run["kind"], run["sources"])
+        digest = hashlib.blake2b(contents, digest_size=HASH_LENGTH // 2).hexdigest()
+        bundle_name = f"{DIST_DIRECTORY}/{stem}-{index}.{digest}.{run['kind']}"
+        bundle_path = ui_dir / bundle_name
+        if not bundle_path.exists():
+            bundle_path.write_bytes(contents)
+
+        if run["kind"] == "js":
+            tag = f'<script src="{bundle_name}"></script>'
+        else:
+            tag = f'<link rel="stylesheet" href="{bundle_name}">'
+        pieces.append(html[position:run["start"]])
+        pieces.append(tag)
+        position = run["end"]
+
+        bundles[bundle_name] = run["sources"]
+        for source in run["sources"]:
+            sources[source] = _source_state(ui_dir, source)
+    pieces.append(html[position:])
+    rewritten = "".join(pieces)
+
+    # The rewrite may only swap source tags for bundle tags; anything else
+    # would change the page, so leave no manifest that serves it
+    bundled = {source for run in runs for source in run["sources"]}
+    if _without_tags(html, ui_dir, bundled) != _without_tags(rewritten, ui_dir, set(bundles)):
+        (dist_dir / MANIFEST_NAME).unlink(missing_ok=True)
+        raise ValueError(f"Bundling {document} would change more than its script and stylesheet tags")
+
+    output_name = f"{DIST_DIRECTORY}/{Path(document).name}"
+    (ui_dir / output_name).write_text(rewritten, encoding="utf-8")
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "generated": datetime.now().isoformat(),
+        "documents": {
+            document: {
+                "file": output_name,
+                "sources": sources,
+            }
+        },
+        "bundles": bundles,
+    }
+
+    # Replace the manifest atomically so the server never reads a partial file
+    manifest_path = dist_dir / MANIFEST_NAME
+    tmp_path = manifest_path.with_name(MANIFEST_NAME + ".tmp")
+    tmp_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    os.replace(tmp_path, manifest_path)
+
+    _remove_stale_bundles(dist_dir, set(bundles))
+    logger.info(f"Bundled {sum(len(s) for s in bundles.values())} files from {document} "
+                f"into {len(bundles)} bundles")
+    return manifest
+
+
+def _remove_stale_bundles(dist_dir: Path, current: set) -> None:
+    """Delete bundles (and their compressed variants) from earlier builds"""
+    for path in dist_dir.iterdir():
+        name = f"{DIST_DIRECTORY}/{path.name}"
+        base = name
+        for suffix in (".gz", ".br"):
+            if base.endswith(suffix):
+                base = base[:-len(suffix)]
+        if re.search(r"\.[0-9a-f]{%d}\.(?:js|css)$" % HASH_LENGTH, base) and base not in current:
+            path.unlink()
+
+
+def format_manifest(manifest: Dict[str, Any], ui_dir: Union[str, Path]) -> str:
+    """Render a bundling summary for CLI output"""
+    ui_dir = Path(ui_dir)
+    lines = [f"Bundles under {ui_dir / DIST_DIRECTORY}"]
+    for bundle_name, sources in manifest["bundles"].items():
+        size = (ui_dir / bundle_name).stat().st_size
+        lines.append(f"  {bundle_name}  ({len(sources)} files, {size} bytes)")
+    return "\n".join(lines)
@@ -0,0 +1,195 @@
+"""
+Responsive, recompressed variants of the UI's images.
+
+For every PNG/JPEG in ``ui/images`` this writes downscaled copies at a few
+standard widths plus a recompressed full-size copy into
+``ui/images/optimized``: PNGs are quantized to a 256 colour palette, JPEGs
+are re-encoded progressively, and each width also gets a WebP copy when
+Pillow was built with WebP support. ``optimized/manifest.json`` lists the
+variants of each image with the source's size and mtime; the UI server
+picks a variant per request from ``Accept`` and a ``?w=`` width and falls
+back to the original once the source changes.
+
+Requires Pillow; without it the pipeline logs a warning and does nothing.
+"""
+import io
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+try:
+    from PIL import Image, features
+except ImportError:
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+IMAGE_EXTENSIONS = {".png": "image/png", ".jpg": "image/jpeg", ".jpeg": "image/jpeg"}
+
+# Widths generated for each image (never wider than the original)
+DEFAULT_WIDTHS = (64, 128, 256, 512)
+
+OUTPUT_DIRECTORY = "optimized"
+MANIFEST_NAME = "manifest.json"
+
+JPEG_QUALITY = 82
+WEBP_QUALITY = 80
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write a file so the server never sees a partial variant"""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def webp_supported() -> bool:
+    """Whether the installed Pillow can write WebP"""
+    return Image is not None and features.check("webp")
+
+
+def _encode(image: "Image.Image", content_type: str) -> bytes:
+    """Encode an image in the given format with lossy-but-invisible settings"""
+    buffer = io.BytesIO()
+    if content_type == "image/png":
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+        method = Image.Quantize.FASTOCTREE if image.mode == "RGBA" else Image.Quantize.MEDIANCUT
+        image.quantize(colors=256, method=method).save(buffer, "PNG", optimize=True)
+    elif content_type == "image/jpeg":
+        image.convert("RGB").save(buffer, "JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True)
+    else:
+        image.save(buffer, "WEBP", quality=WEBP_QUALITY, method=6)
+    return buffer.getvalue()
+
+
+def optimize_image(source: Path, output_dir: Path, widths=DEFAULT_WIDTHS,
+                   use_webp: bool = True) -> Dict[str, Any]:
+    """
+    Write the variants of one image.
+
+    Args:
+        source: Image to process
+        output_dir: Directory the variants are written to
+        widths: Target widths; the original width is always included
+        use_webp: Also write WebP variants if Pillow supports it
+
+    Returns:
+        Manifest entry with the original width and the variants written
+        (file, width, type, bytes)
+    """
+    source_type = IMAGE_EXTENSIONS[source.suffix.lower()]
+    source_size = source.stat().st_size
+    types = [source_type]
+    if use_webp and webp_supported():
+        types.append("image/webp")
+
+    variants = []
+    with Image.open(source) as original:
+        original.load()
+        full_width, full_height = original.size
+        for width in sorted({w for w in widths if w < full_width} | {full_width}):
+            if width == full_width:
+                image = original
+            else:
+                height = max(1, round(full_height * width / full_width))
+                image = original.resize((width, height), Image.Resampling.LANCZOS)
+
+            for content_type in types:
+                data = _encode(image, content_type)
+                # A full-size variant is only useful if it beats the original
+                if width == full_width and len(data) >= source_size:
+                    continue
+                extension = ".webp" if content_type == "image/webp" else source.suffix.lower()
+                filename = f"{source.stem}-{width}w{extension}"
+                _write_atomic(output_dir / filename, data)
+                variants.append({
+                    "file": f"{OUTPUT_DIRECTORY}/{filename}",
+                    "width": width,
+                    "type": content_type,
+                    "bytes": len(data),
+                })
+    return {"width": full_width, "variants": variants}
+
+
+def optimize_directory(images_dir: Union[str, Path], widths=DEFAULT_WIDTHS,
+                       use_webp: bool = True, force: bool = False) -> Dict[str, Any]:
+    """
+    Build variants for every image in a directory and write the manifest.
+
+    Images whose size and mtime match the existing manifest are skipped
+    unless force is set.
+
+    Args:
+        images_dir: Directory holding the images (normally ui/images)
+        widths: Target widths
+        use_webp: Also write WebP variants if Pillow supports it
+        force: Rebuild all variants even if they are current
+
+    Returns:
+        The manifest, mapping image filename to its source state and variants
+    """
+    images_dir = Path(images_dir)
+    output_dir = images_dir / OUTPUT_DIRECTORY
+    manifest_path = output_dir / MANIFEST_NAME
+    if Image is None:
+        logger.warning("Pillow is not installed; skipping image optimization")
+        return {}
+
+    output_dir.mkdir(exist_ok=True)
+    previous = {}
+    if manifest_path.exists() and not force:
+        try:
+            previous = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except ValueError:
+            previous = {}
+
+    manifest = {}
+    for source in sorted(images_dir.iterdir()):
+        if source.suffix.lower() not in IMAGE_EXTENSIONS or not source.is_file():
+            continue
+        stat_result = source.stat()
+        state = [stat_result.st_size, stat_result.st_mtime_ns]
+        entry = previous.get(source.name)
+        if entry and entry.get("source") == state and all(
+                (images_dir / variant["file"]).exists() for variant in entry["variants"]):
+            manifest[source.name] = entry
+            continue
+        try:
+            entry = optimize_image(source, output_dir, widths=widths, use_webp=use_webp)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not optimize {source}: {e}")
+            continue
+        manifest[source.name] = {"source": state, **entry}
+
+    # Drop variants of images that were removed or re-generated with other widths
+    current = {Path(variant["file"]).name for entry in manifest.values() for variant in entry["variants"]}
+    for path in output_dir.iterdir():
+        if path.name != MANIFEST_NAME and path.name not in current:
+            path.unlink()
+
+    _write_atomic(manifest_path, json.dumps(manifest, indent=2).encode("utf-8"))
+    logger.info(f"Optimized {len(manifest)} images under {images_dir}")
+    return manifest
+
+
+def format_report(manifest: Dict[str, Any], images_dir: Optional[Union[str, Path]] = None) -> str:
+    """Render per-image byte savings for CLI output"""
+    if not manifest:
+        return "No images optimized (is Pillow installed?)"
+    lines = []
+    if images_dir is not None:
+        lines.append(f"Images under {images_dir}")
+    lines.append(f"  {'image':<20} {'original':>10} {'best full':>10} {'saved':>7}  smallest variant")
+    for name, entry in manifest.items():
+        original = entry["source"][0]
+        variants = entry["variants"]
+        full = [variant["bytes"] for variant in variants if variant["width"] == entry["width"]]
+        best_full = min(full + [original])
+        saved = (1 - best_full / original) * 100 if original else 0
+        smallest = min(variants, key=lambda variant: variant["bytes"], default=None)
+        smallest_text = f"{smallest['file']} ({smallest['bytes']} bytes)" if smallest else "-"
+        lines.append(f"  {name:<20} {original:>10} {best_full:>10} {saved:>6.1f}%  {smallest_text}")
+    return "\n".join(lines)
@@ -0,0 +1,204 @@
+"""
+Precompressed variants of the UI's text assets.
+
+Writes ``.gz`` (and ``.br`` when the brotli module is installed) siblings
+next to HTML, JavaScript, CSS, JSON and SVG files. The UI server serves
+these bytes directly when the browser's Accept-Encoding allows it, so
+nothing is compressed per request.
+
+``precompressed.json`` at the root of the scanned directory records the
+size and mtime of every source together with the size of each variant, and
+which encodings were skipped because they saved too little. A file is only
+recompressed once its size or mtime no longer match the manifest (in either
+direction, so a source restored with an older mtime is picked up), and the
+server ignores the variants of any file that no longer matches.
+"""
+import gzip
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Text assets worth compressing
+COMPRESSIBLE_EXTENSIONS = {".html", ".js", ".css", ".json", ".svg", ".txt", ".map"}
+
+# Below this size the encoding overhead outweighs the savings
+MIN_SIZE = 1024
+
+# Variants must save at least this fraction of the original size
+MIN_SAVINGS = 0.05
+
+# Directories never scanned for assets
+SKIP_DIRECTORIES = {"__pycache__", "node_modules", ".git"}
+
+MANIFEST_NAME = "precompressed.json"
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write a file so the server never sees a partial variant"""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def _is_current(variant: Path, size: Optional[int]) -> bool:
+    """Check whether a variant recorded in the manifest is still on disk"""
+    if size is None:
+        # Recorded as not worth compressing; nothing should be on disk
+        return not variant.exists()
+    try:
+        return variant.stat().st_size == size
+    except OSError:
+        return False
+
+
+def precompress_file(source: Path, use_brotli: bool = True,
+                     previous: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, Any], Dict[str, int]]:
+    """
+    Build compressed variants of one file.
+
+    Args:
+        source: File to compress
+        use_brotli: Also build a .br variant if brotli is available
+        previous: The file's entry from the last manifest, if any; encodings
+            it records for the same source size and mtime are not rebuilt
+
+    Returns:
+        The file's manifest entry and a mapping of encoding to variant size
+        for variants written
+    """
+    written = {}
+    # Stat before reading so an edit during compression leaves a mismatch
+    stat_result = source.stat()
+    state = [stat_result.st_size, stat_result.st_mtime_ns]
+    recorded = previous["variants"] if previous and previous.get("source") == state else {}
+    encoders = {".gz": lambda data: gzip.compress(data, compresslevel=9, mtime=0)}
+    if use_brotli and brotli is not None:
+        encoders[".br"] = lambda data: brotli.compress(data, quality=11, mode=brotli.MODE_TEXT)
+
+    variants = {}
+    data = None
+    for suffix, encode in encoders.items():
+        variant = source.with_name(source.name + suffix)
+        if suffix in recorded and _is_current(variant, recorded[suffix]):
+            variants[suffix] = recorded[suffix]
+            continue
+        if data is None:
+            data = source.read_bytes()
+        encoded = encode(data)
+        if len(encoded) > len(data) * (1 - MIN_SAVINGS):
+            # Not worth serving; drop any stale variant and remember the verdict
+            variant.unlink(missing_ok=True)
+            variants[suffix] = None
+            continue
+        _write_atomic(variant, encoded)
+        variants[suffix] = len(encoded)
+        written[suffix[1:]] = len(encoded)
+    return {"source": state, "variants": variants}, written
+
+
+def precompress_directory(root: Union[str, Path], use_brotli: bool = True,
+                          force: bool = False) -> Dict[str, Any]:
+    """
+    Build compressed variants for every text asset under a directory.
+
+    Args:
+        root: Directory to scan (normally the ui directory)
+        use_brotli: Also build .br variants if brotli is available
+        force: Rebuild all variants even if they are current
+
+    Returns:
+        Summary with file counts and byte totals
+    """
+    root = Path(root)
+    manifest_path = root / MANIFEST_NAME
+    previous = {}
+    if manifest_path.exists() and not force:
+        try:
+            previous = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except ValueError:
+            previous = {}
+
+    manifest = {}
+    summary = {
+        "files": 0,
+        "variants_written": 0,
+        "original_bytes": 0,
+        "gzip_bytes": 0,
+        "brotli": bool(use_brotli and brotli is not None),
+    }
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRECTORIES]
+        for filename in filenames:
+            source = Path(dirpath) / filename
+            # Skips dangling symlinks (e.g. Terma assets when Terma is absent)
+            if source.suffix.lower() not in COMPRESSIBLE_EXTENSIONS or not source.is_file():
+                continue
+            if source == manifest_path:
+                continue
+            relative = source.relative_to(root).as_posix()
+            try:
+                size = source.stat().st_size
+                if size < MIN_SIZE:
+                    continue
+                entry, written = precompress_file(source, use_brotli=use_brotli, previous=previous.get(relative))
+            except OSError as e:
+                logger.warning(f"Could not precompress {source}: {e}")
+                continue
+
+            manifest[relative] = entry
+            summary["files"] += 1
+            summary["variants_written"] += len(written)
+            summary["original_bytes"] += size
+            summary["gzip_bytes"] += entry["variants"].get(".gz") or size
+
+    _write_atomic(manifest_path, json.dumps(manifest, indent=2).encode("utf-8"))
+    logger.info(f"Precompressed {summary['files']} assets under {root} "
+                f"({summary['variants_written']} variants written)")
+    return summary
+
+
+def remove_variants(root: Union[str, Path]) -> int:
+    """
+    Delete all precompressed variants under a directory.
+
+    Returns:
+        Number of files removed
+    """
+    removed = 0
+    manifest_path = Path(root) / MANIFEST_NAME
+    if manifest_path.exists():
+        manifest_path.unlink()
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRECTORIES]
+        for filename in filenames:
+            base, suffix = os.path.splitext(filename)
+            if suffix in (".gz", ".br") and os.path.splitext(base)[1].lower() in COMPRESSIBLE_EXTENSIONS:
+                os.unlink(os.path.join(dirpath, filename))
+                removed += 1
+    return removed
+
+
+def format_summary(summary: Dict[str, Any], root: Optional[Union[str, Path]] = None) -> str:
+    """Render a precompression summary for CLI output"""
+    original = summary["original_bytes"]
+    compressed = summary["gzip_bytes"]
+    ratio = (compressed / original * 100) if original else 0
+    lines = []
+    if root is not None:
+        lines.append(f"Assets under {root}")
+    lines.append(f"  text assets:      {summary['files']}")
+    lines.append(f"  variants written: {summary['variants_written']}")
+    lines.append(f"  original bytes:   {original}")
+    lines.append(f"  gzip bytes:       {compressed} ({ratio:.1f}%)")
+    lines.append(f"  brotli:           {'yes' if summary['brotli'] else 'not installed'}")
+    return "\n".join(lines)
@@ -44,6 +44,13 @@ class HephaestusComponent(StandardComponentBase):
         logger.info(f"HTTP/WebSocket port: {self.http_port}")
         logger.info(f"MCP DevTools port: {self.mcp_port}")
         
+        # Bundle index.html scripts/styles, then build precompressed variants
+        # (bundles included) before serving them
+        if os.environ.get("HEPHAESTUS_BUNDLE_ASSETS", "true").lower() in ("true", "1", "yes"):
+            await self._bundle_assets()
+        if os.environ.get("HEPHAESTUS_PRECOMPRESS", "true").lower() in ("true", "1", "yes"):
+            await self._precompress_assets()
+        
         # Start main HTTP/WebSocket server in background thread
         self.http_server_thread = self._start_http_server()
         
@@ -53,6 +60,27 @@ class HephaestusComponent(StandardComponentBase):
         self.initialized = True
         logger.info("Hephaestus component initialization completed")
     
+    async def _bundle_assets(self):
+        """Concatenate index.html's scripts and stylesheets into hashed bundles."""
+        try:
+            from hephaestus.assets.bundler import bundle_document
+            manifest = await asyncio.to_thread(bundle_document, self.ui_directory)
+            logger.info(f"Bundled UI assets into {len(manifest['bundles'])} bundles")
+        except Exception as e:
+            # Without a current manifest the server serves the original index.html
+            logger.warning(f"Could not bundle UI assets: {e}")
+    
+    async def _precompress_assets(self):
+        """Build .gz/.br siblings for the UI's text assets."""
+        try:
+            from hephaestus.assets.precompress import precompress_directory
+            summary = await asyncio.to_thread(precompress_directory, self.ui_directory)
+            logger.info(f"Precompressed {summary['files']} UI assets "
+                        f"({summary['variants_written']} variants updated)")
+        except Exception as e:
+            # Compression is an optimization; serve uncompressed files if it fails
+            logger.warning(f"Could not precompress UI assets: {e}")
+    
     def _start_http_server(self):
         """Start the HTTP/WebSocket server in a background thread."""
         def run_server():
@@ -7,6 +7,7 @@ import inspect
 import json
 import os
 import sys
+import time
 from contextlib import asynccontextmanager
 from typing import Any, Dict, List, Optional
 
@@ -27,7 +28,8 @@ from shared.utils.logging_setup import setup_component_logging
 logger = setup_component_logging("hephaestus_mcp")
 
 from hephaestus.mcp.ui_tools_v2 import (
-    ui_capture, ui_interact, ui_sandbox, ui_analyze, ui_list_areas, ui_help, browser_manager
+    ui_capture, ui_interact, ui_sandbox, ui_analyze, ui_list_areas, ui_help, browser_manager,
+    take_page_snapshot
 )
 
 # Debug imports
@@ -50,6 +52,10 @@ hermes_registration: Optional[HermesRegistration] = None
 heartbeat_task: Optional[asyncio.Task] = None
 
 
+# Most tool calls one /execute_batch request may carry
+MAX_BATCH_CALLS = int(os.environ.get("HEPHAESTUS_MCP_MAX_BATCH", "50"))
+
+
 # Tool metadata for MCP
 TOOL_METADATA = {
     "ui_list_areas": {
@@ -207,8 +213,9 @@ async def lifespan(app: FastAPI):
     
     logger.info(f"Starting hephaestus_ui_devtools MCP server on port {MCP_PORT}")
     
-    # Initialize browser manager
+    # Initialize browser manager and keep it healthy in the background
     await browser_manager.initialize()
+    browser_manager.start_watchdog()
     
     # Note: Hermes registration is handled by HephaestusComponent
     # The MCP server runs as a subprocess and doesn't need separate registration
@@ -253,7 +260,12 @@ async def get_capabilities():
         "tools": list(TOOL_METADATA.keys()),
         "metadata": {
             "category": "devtools",
-            "mcp_version": "2.0"
+            "mcp_version": "2.0",
+            "batch": {
+                "endpoint": "/api/mcp/v2/execute_batch",
+                "max_calls": MAX_BATCH_CALLS,
+                "read_only_tools": sorted(READ_ONLY_TOOLS)
+            }
         }
     }
 
@@ -266,43 +278,42 @@ async def get_tools():
     }
 
 
-@mcp_router.post("/execute")
-async def execute_tool(request_data: Dict[str, Any]):
-    """Execute a tool"""
-    tool_name = request_data.get("tool_name")
-    arguments = request_data.get("arguments", {})
-    
-    if not tool_name:
-        raise HTTPException(status_code=400, detail="tool_name is required")
-    
-    # Map tool names to functions
-    tool_functions = {
-        "ui_list_areas": ui_list_areas,
-        "ui_capture": ui_capture,
-        "ui_interact": ui_interact,
-        "ui_sandbox": ui_sandbox,
-        "ui_analyze": ui_analyze,
-        "ui_help": ui_help
-    }
-    
-    if tool_name not in tool_functions:
-        raise HTTPException(status_code=404, detail=f"Tool '{tool_name}' not found")
-    
-    tool_func = tool_functions[tool_name]
+# Map tool names to functions
+TOOL_FUNCTIONS = {
+    "ui_list_areas": ui_list_areas,
+    "ui_capture": ui_capture,
+    "ui_interact": ui_interact,
+    "ui_sandbox": ui_sandbox,
+    "ui_analyze": ui_analyze,
+    "ui_help": ui_help
+}
+
+# Tools that do not change the page; a parallel batch runs them concurrently
+READ_ONLY_TOOLS = {"ui_list_areas", "ui_capture", "ui_analyze", "ui_help"}
+
+# Tools that can read a shared PageSnapshot instead of the live page
+SNAPSHOT_TOOLS = {"ui_capture", "ui_analyze"}
+
+
+def _missing_parameter(tool_name: str, arguments: Dict[str, Any]) -> Optional[str]:
+    """Return the first required parameter of a tool not in arguments"""
+    for param_name, param_info in TOOL_METADATA[tool_name]["parameters"].items():
+        if param_info.get("required", False) and param_name not in arguments:
+            return param_name
+    return None
+
+
+async def _run_tool(tool_name: str, arguments: Dict[str, Any], snapshot=None) -> Dict[str, Any]:
+    """Run one tool, returning its result or error in the /execute format"""
+    tool_func = TOOL_FUNCTIONS[tool_name]
     
     try:
         # Debug logging
         logger.info(f"Executing tool '{tool_name}' with arguments: {arguments}")
         logger.info(f"Tool function type: {type(tool_func)}")
         
-        # Validate required parameters
-        tool_meta = TOOL_METADATA[tool_name]
-        for param_name, param_info in tool_meta["parameters"].items():
-            if param_info.get("required", False) and param_name not in arguments:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Required parameter '{param_name}' not provided"
-                )
+        if snapshot is not None:
+            arguments = dict(arguments, snapshot=snapshot)
         
         # Execute tool - all our tools are async
         result = await tool_func(**arguments)
@@ -324,6 +335,148 @@ async def execute_tool(request_data: Dict[str, Any]):
         }
 
 
+@mcp_router.post("/execute")
+async def execute_tool(request_data: Dict[str, Any]):
+    """Execute a tool"""
+    tool_name = request_data.get("tool_name")
+    arguments = request_data.get("arguments", {})
+    
+    if not tool_name:
+        raise HTTPException(status_code=400, detail="tool_name is required")
+    
+    if tool_name not in TOOL_FUNCTIONS:
+        raise HTTPException(status_code=404, detail=f"Tool '{tool_name}' not found")
+    
+    # Validate required parameters
+    missing = _missing_parameter(tool_name, arguments)
+    if missing:
+        logger.error(f"Error executing tool '{tool_name}': required parameter '{missing}' not provided")
+        return {
+            "status": "error",
+            "result": None,
+            "error": f"Required parameter '{missing}' not provided"
+        }
+    
+    return await _run_tool(tool_name, arguments)
+
+
+@mcp_router.post("/execute_batch")
+async def execute_batch(request_data: Dict[str, Any]):
+    """
+    Execute an ordered list of tool calls in one request
+    
+    Request body:
+        calls: List of {"tool_name": ..., "arguments": {...}}
+        parallel: Run consecutive read-only calls (ui_capture, ui_analyze,
+            ui_list_areas, ui_help) concurrently (default False)
+        fail_fast: Skip the calls after the first failed one (default True);
+            reads already running alongside it still finish. False runs
+            every call
+        snapshot: Read the page once and let the capture/analyze calls
+            share it, until a call that changes the page (default False)
+    
+    Every call is checked before any runs. Results come back in call order,
+    each in the /execute format plus its index, tool_name and duration_ms;
+    skipped calls have status "skipped".
+    """
+    calls = request_data.get("calls")
+    parallel = bool(request_data.get("parallel", False))
+    fail_fast = bool(request_data.get("fail_fast", True))
+    use_snapshot = bool(request_data.get("snapshot", False))
+    
+    if not isinstance(calls, list) or not calls:
+        raise HTTPException(status_code=400, detail="calls must be a non-empty list")
+    if len(calls) > MAX_BATCH_CALLS:
+        raise HTTPException(status_code=400, detail=f"A batch may hold at most {MAX_BATCH_CALLS} calls")
+    
+    for index, call in enumerate(calls):
+        if not isinstance(call, dict) or not call.get("tool_name"):
+            raise HTTPException(status_code=400, detail=f"calls[{index}]: tool_name is required")
+        tool_name = call["tool_name"]
+        if tool_name not in TOOL_FUNCTIONS:
+            raise HTTPException(status_code=404, detail=f"calls[{index}]: Tool '{tool_name}' not found")
+        arguments = call.setdefault("arguments", {})
+        if not isinstance(arguments, dict):
+            raise HTTPException(status_code=400, detail=f"calls[{index}]: arguments must be an object")
+        missing = _missing_parameter(tool_name, arguments)
+        if missing:
+            raise HTTPException(
+                status_code=400,
+                detail=f"calls[{index}]: Required parameter '{missing}' not provided"
+            )
+    
+    async def run_call(index, snapshot):
+        call = calls[index]
+        call_started = time.perf_counter()
+        outcome = await _run_tool(
+            call["tool_name"], call["arguments"],
+            snapshot if call["tool_name"] in SNAPSHOT_TOOLS else None
+        )
+        outcome.update({
+            "index": index,
+            "tool_name": call["tool_name"],
+            "duration_ms": round((time.perf_counter() - call_started) * 1000, 1)
+        })
+        return outcome
+    
+    started = time.perf_counter()
+    results = []
+    snapshot = None
+    snapshots = 0
+    failed = False
+    
+    while len(results) < len(calls) and not (failed and fail_fast):
+        # The next call alone, or with the read-only calls that follow it
+        start = len(results)
+        end = start + 1
+        if parallel and calls[start]["tool_name"] in READ_ONLY_TOOLS:
+            while end < len(calls) and calls[end]["tool_name"] in READ_ONLY_TOOLS:
+                end += 1
+        group = range(start, end)
+        
+        if use_snapshot and snapshot is None and any(calls[i]["tool_name"] in SNAPSHOT_TOOLS for i in group):
+            try:
+                snapshot = await take_page_snapshot()
+                snapshots += 1
+            except Exception as e:
+                # Each call then reads the live page and reports its own error
+                logger.warning(f"Could not snapshot the page for a batch: {e}")
+        
+        if len(group) > 1:
+            outcomes = await asyncio.gather(*(run_call(i, snapshot) for i in group))
+        else:
+            outcomes = [await run_call(start, snapshot)]
+        results.extend(outcomes)
+        failed = failed or any(outcome["status"] != "success" for outcome in outcomes)
+        
+        # The page may have changed; later reads need a fresh snapshot
+        if any(calls[i]["tool_name"] not in READ_ONLY_TOOLS for i in group):
+            snapshot = None
+    
+    for index in range(len(results), len(calls)):
+        results.append({
+            "status": "skipped",
+            "result": None,
+            "error": None,
+            "index": index,
+            "tool_name": calls[index]["tool_name"],
+            "duration_ms": 0
+        })
+    
+    return {
+        "status": "error" if failed else "success",
+        "results": results,
+        "summary": {
+            "total": len(calls),
+            "succeeded": sum(1 for r in results if r["status"] == "success"),
+            "failed": sum(1 for r in results if r["status"] == "error"),
+            "skipped": sum(1 for r in results if r["status"] == "skipped"),
+            "snapshots": snapshots,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 1)
+        }
+    }
+
+
 # Health check endpoints
 @app.get("/health")
 async def health_check():
@@ -349,7 +502,8 @@ async def ready_check():
         "version": "0.1.0",
         "checks": {
             "browser": browser_ready
-        }
+        },
+        "page_pool": browser_manager.stats()
     }
 
 
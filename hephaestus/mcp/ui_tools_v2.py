@@ -9,6 +9,8 @@ import asyncio
 import json
 import os
 import re
+import time
+from contextlib import asynccontextmanager
 from typing import Any, Dict, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
@@ -25,6 +27,18 @@ global_config = GlobalConfig.get_instance()
 HEPHAESTUS_PORT = global_config.config.hephaestus.port
 HEPHAESTUS_URL = f"http://localhost:{HEPHAESTUS_PORT}"
 
+# Pages kept loaded for the tools, each in its own browser context
+DEFAULT_POOL_SIZE = int(os.environ.get("HEPHAESTUS_UI_POOL_SIZE", str(min(4, os.cpu_count() or 1))))
+
+# Longest a tool call waits for a free page, in seconds
+DEFAULT_POOL_TIMEOUT = float(os.environ.get("HEPHAESTUS_UI_POOL_TIMEOUT", "30"))
+
+# Seconds between watchdog passes over the browser and idle pages (0 disables)
+DEFAULT_WATCHDOG_INTERVAL = float(os.environ.get("HEPHAESTUS_UI_WATCHDOG_INTERVAL", "5"))
+
+# Longest an idle page may take to answer the watchdog, in seconds
+WATCHDOG_PROBE_TIMEOUT = 5.0
+
 # Component areas within Hephaestus UI
 UI_COMPONENTS = {
     "hephaestus": {
@@ -126,19 +140,65 @@ class FrameworkDetectedError(UIToolsError):
 
 
 class BrowserManager:
-    """Manages browser instance for Hephaestus UI"""
+    """
+    Manages browser instance for Hephaestus UI
+    
+    Tools lease a page from a pool of pages already showing the UI, each in
+    its own browser context, so concurrent calls never share a DOM:
     
-    def __init__(self):
+        async with browser_manager.lease() as page:
+            ...
+    
+    A lease taken with dirty=True (the call changes the page) reloads the
+    page before it is handed out again, so every call starts from the UI
+    as served.
+    
+    Health is tracked from Playwright events rather than probed per call:
+    a page that crashes or closes leaves the pool at once, and a browser
+    disconnect marks the pool for relaunch. While the browser is up and the
+    pool full, checkout() takes an idle page without locks or round trips.
+    The watchdog (start_watchdog()) relaunches and refills in the
+    background and probes idle pages for hung renderers, so requests
+    rarely pay for recovery.
+    """
+    
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE, pool_timeout: float = DEFAULT_POOL_TIMEOUT):
         self.playwright = None
         self.browser: Optional[Browser] = None
-        self.context: Optional[BrowserContext] = None
-        self.page: Optional[Page] = None
+        self.pool_size = max(1, pool_size)
+        self.pool_timeout = pool_timeout
+        # Pool page -> its context; idle pages wait in _idle
+        self._pages: Dict[Page, BrowserContext] = {}
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._resetting = set()
+        self._connected = False
+        self._watchdog: Optional[asyncio.Task] = None
         self._initialization_lock = asyncio.Lock()
         self._restart_attempts = 0
         self._max_restart_attempts = 3
+        # Pool metrics
+        self.checkouts = 0
+        self.waited = 0
+        self.waiting = 0
+        self.wait_ms_total = 0.0
+        self.wait_ms_max = 0.0
+        self.timeouts = 0
+        self.resets = 0
+        self.replaced = 0
+        self.slow_checkouts = 0
+        self.launches = 0
+        self.crashes = 0
+        self.disconnects = 0
+        self.watchdog_repairs = 0
+        self.watchdog_error = None
+    
+    @property
+    def healthy(self) -> bool:
+        """Browser up and pool full, as last reported by Playwright events"""
+        return self._connected and len(self._pages) >= self.pool_size
     
     async def initialize(self, force_restart: bool = False):
-        """Initialize the browser with automatic recovery"""
+        """Start the browser and fill the page pool, with automatic recovery"""
         async with self._initialization_lock:
             if force_restart:
                 await self._cleanup_browser()
@@ -147,8 +207,14 @@ class BrowserManager:
                 self.playwright = await async_playwright().start()
             
             if not self.browser or not self.browser.is_connected():
+                # Pages of a crashed browser are gone with it
+                self._pages.clear()
+                self._drain_idle()
                 try:
                     self.browser = await self.playwright.chromium.launch(headless=True)
+                    self.browser.on("disconnected", self._on_disconnected)
+                    self._connected = True
+                    self.launches += 1
                     self._restart_attempts = 0
                 except Exception as e:
                     if self._restart_attempts < self._max_restart_attempts:
@@ -157,55 +223,246 @@ class BrowserManager:
                         return await self.initialize(force_restart=True)
                     raise UIToolsError(f"Failed to start browser after {self._max_restart_attempts} attempts: {str(e)}")
             
-            if not self.context:
-                self.context = await self.browser.new_context()
+            missing = self.pool_size - len(self._pages)
+            if missing > 0:
+                await asyncio.gather(*(self._open_page() for _ in range(missing)))
+    
+    async def _open_page(self):
+        """Add a page showing Hephaestus UI to the pool"""
+        context = await self.browser.new_context()
+        try:
+            page = await context.new_page()
+            page.on("crash", self._on_page_gone)
+            page.on("close", self._on_page_gone)
+            # Always navigate to Hephaestus UI
+            await page.goto(HEPHAESTUS_URL, wait_until="networkidle", timeout=15000)
+        except:
+            try:
+                await context.close()
+            except:
+                pass
+            raise
+        self._pages[page] = context
+        self._idle.put_nowait(page)
+    
+    def _on_disconnected(self, browser: Browser):
+        if browser is self.browser:
+            self._connected = False
+            self.disconnects += 1
+    
+    def _on_page_gone(self, page: Page):
+        # Crashed, or closed by something other than _discard_page()
+        context = self._pages.pop(page, None)
+        if context:
+            self.crashes += 1
+            asyncio.get_running_loop().create_task(self._close_context(context))
+    
+    async def _close_context(self, context: BrowserContext):
+        try:
+            await context.close()
+        except:
+            pass
+    
+    def _drain_idle(self):
+        # Callers already waiting keep waiting on the same queue for new pages
+        while not self._idle.empty():
+            self._idle.get_nowait()
+    
+    async def _discard_page(self, page: Page):
+        """Remove a page from the pool and close its context"""
+        context = self._pages.pop(page, None)
+        if context:
+            await self._close_context(context)
+    
+    async def checkout(self) -> Page:
+        """
+        Take a page from the pool, waiting up to pool_timeout for a free one
+        
+        Prefer lease(); a page taken here must be given back with checkin().
+        """
+        started = time.perf_counter()
+        deadline = started + self.pool_timeout
+        self.checkouts += 1
+        queued = False
+        slow = False
+        
+        while True:
+            if not self.healthy:
+                # Relaunch the browser or refill the pool first
+                if not slow:
+                    slow = True
+                    self.slow_checkouts += 1
+                await self.initialize()
+            try:
+                page = self._idle.get_nowait()
+            except asyncio.QueueEmpty:
+                if not queued:
+                    queued = True
+                    self.waited += 1
+                self.waiting += 1
+                try:
+                    page = await asyncio.wait_for(self._idle.get(), max(0.0, deadline - time.perf_counter()))
+                except asyncio.TimeoutError:
+                    self.timeouts += 1
+                    raise UIToolsError(
+                        f"No browser page free after {self.pool_timeout}s "
+                        f"(pool size {self.pool_size}); try again or raise HEPHAESTUS_UI_POOL_SIZE"
+                    )
+                finally:
+                    self.waiting -= 1
             
-            if not self.page or not self.page.is_closed():
-                self.page = await self.context.new_page()
-                # Always navigate to Hephaestus UI
-                await self.page.goto(HEPHAESTUS_URL, wait_until="networkidle", timeout=15000)
-    
-    async def get_page(self) -> Page:
-        """Get the page for Hephaestus UI"""
-        await self.initialize()
+            if page not in self._pages:
+                # Crashed or closed while idle
+                continue
+            # page.url is tracked locally, so this costs no round trip
+            if page.url.startswith(HEPHAESTUS_URL):
+                break
+            # Check we're still on Hephaestus
+            try:
+                await page.goto(HEPHAESTUS_URL, wait_until="networkidle", timeout=15000)
+                break
+            except:
+                self.replaced += 1
+                await self._discard_page(page)
         
-        # Check if page is still valid
+        wait_ms = (time.perf_counter() - started) * 1000
+        self.wait_ms_total += wait_ms
+        self.wait_ms_max = max(self.wait_ms_max, wait_ms)
+        return page
+    
+    def checkin(self, page: Page, dirty: bool = False):
+        """Give back a page from checkout(); dirty pages are reloaded first"""
+        if page not in self._pages:
+            # Replaced, or opened before a browser restart
+            return
+        if dirty:
+            self.resets += 1
+            task = asyncio.get_running_loop().create_task(self._reset_page(page))
+            self._resetting.add(task)
+            task.add_done_callback(self._resetting.discard)
+        else:
+            self._idle.put_nowait(page)
+    
+    async def _reset_page(self, page: Page):
         try:
-            await self.page.evaluate("() => true")
-            # Check we're still on Hephaestus
-            if not self.page.url.startswith(HEPHAESTUS_URL):
-                await self.page.goto(HEPHAESTUS_URL, wait_until="networkidle", timeout=15000)
+            await page.goto(HEPHAESTUS_URL, wait_until="networkidle", timeout=15000)
         except:
-            # Page is dead, reinitialize
-            await self.initialize(force_restart=True)
+            # The next checkout opens a replacement
+            await self._discard_page(page)
+            return
+        if page in self._pages:
+            self._idle.put_nowait(page)
+    
+    def start_watchdog(self, interval: float = DEFAULT_WATCHDOG_INTERVAL):
+        """Check the browser and idle pages every interval seconds in the background"""
+        if interval > 0 and (self._watchdog is None or self._watchdog.done()):
+            self._watchdog = asyncio.get_running_loop().create_task(self._watch(interval))
+    
+    async def _watch(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self._watchdog_pass()
+                self.watchdog_error = None
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Hephaestus may be down; checkouts will report it
+                self.watchdog_error = str(e)
+    
+    async def _watchdog_pass(self):
+        """Relaunch or refill ahead of requests, and replace hung idle pages"""
+        if not self.healthy:
+            self.watchdog_repairs += 1
+            await self.initialize()
+        
+        # Idle pages are taken out one at a time, so at most one is missing
+        for _ in range(self._idle.qsize()):
+            try:
+                page = self._idle.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if page not in self._pages:
+                continue
+            try:
+                await asyncio.wait_for(page.evaluate("() => true"), WATCHDOG_PROBE_TIMEOUT)
+            except asyncio.CancelledError:
+                self._idle.put_nowait(page)
+                raise
+            except Exception:
+                self.replaced += 1
+                await self._discard_page(page)
+                continue
+            self._idle.put_nowait(page)
         
-        return self.page
+        if not self.healthy:
+            self.watchdog_repairs += 1
+            await self.initialize()
+    
+    @asynccontextmanager
+    async def lease(self, dirty: bool = False):
+        """Hold a pooled page for the duration of a block"""
+        page = await self.checkout()
+        try:
+            yield page
+        finally:
+            self.checkin(page, dirty=dirty)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Pool size, use and queue-wait metrics"""
+        idle = self._idle.qsize()
+        return {
+            "size": self.pool_size,
+            "open": len(self._pages),
+            "idle": idle,
+            "in_use": len(self._pages) - idle - len(self._resetting),
+            "resetting": len(self._resetting),
+            "waiting": self.waiting,
+            "checkouts": self.checkouts,
+            # Checkouts that found no idle page and queued
+            "waited": self.waited,
+            "wait_ms_avg": round(self.wait_ms_total / self.checkouts, 1) if self.checkouts else 0,
+            "wait_ms_max": round(self.wait_ms_max, 1),
+            "timeouts": self.timeouts,
+            "resets": self.resets,
+            "replaced": self.replaced,
+            # Health, from Playwright events and the watchdog
+            "healthy": self.healthy,
+            "slow_checkouts": self.slow_checkouts,
+            "launches": self.launches,
+            "disconnects": self.disconnects,
+            "crashes": self.crashes,
+            "watchdog": {
+                "running": self._watchdog is not None and not self._watchdog.done(),
+                "repairs": self.watchdog_repairs,
+                "error": self.watchdog_error
+            }
+        }
     
     async def _cleanup_browser(self):
         """Clean up browser resources"""
-        if self.page:
-            try:
-                await self.page.close()
-            except:
-                pass
-            self.page = None
+        self._connected = False
+        for task in list(self._resetting):
+            task.cancel()
+        self._resetting.clear()
         
-        if self.context:
-            try:
-                await self.context.close()
-            except:
-                pass
-            self.context = None
+        for page in list(self._pages):
+            await self._discard_page(page)
+        self._drain_idle()
         
         if self.browser:
+            # Cleared first so the disconnect is not counted as a crash
+            browser, self.browser = self.browser, None
             try:
-                await self.browser.close()
+                await browser.close()
             except:
                 pass
-            self.browser = None
     
     async def cleanup(self):
         """Clean up all browser resources"""
+        if self._watchdog is not None:
+            self._watchdog.cancel()
+            self._watchdog = None
         await self._cleanup_browser()
         
         if self.playwright:
@@ -235,14 +492,27 @@ def list_ui_areas() -> Dict[str, Any]:
     }
 
 
+def _unknown_area_error(component: str) -> ComponentNotFoundError:
+    valid = ", ".join(sorted(UI_COMPONENTS.keys()))
+    return ComponentNotFoundError(
+        f"Unknown UI area '{component}'. Valid areas: {valid}\n"
+        f"Use 'hephaestus' for the main UI or see list_ui_areas() for all options."
+    )
+
+
+def _area_not_found_error(component: str) -> ComponentNotFoundError:
+    tried = ", ".join(UI_COMPONENTS[component]["selectors"])
+    return ComponentNotFoundError(
+        f"Could not find '{component}' area in the UI.\n"
+        f"Tried selectors: {tried}\n"
+        f"The component may not be visible or loaded yet."
+    )
+
+
 async def find_component_element(page: Page, component: str) -> Optional[Any]:
     """Try to find a component area using multiple selectors"""
     if component not in UI_COMPONENTS:
-        valid = ", ".join(sorted(UI_COMPONENTS.keys()))
-        raise ComponentNotFoundError(
-            f"Unknown UI area '{component}'. Valid areas: {valid}\n"
-            f"Use 'hephaestus' for the main UI or see list_ui_areas() for all options."
-        )
+        raise _unknown_area_error(component)
     
     selectors = UI_COMPONENTS[component]["selectors"]
     
@@ -255,12 +525,70 @@ async def find_component_element(page: Page, component: str) -> Optional[Any]:
             continue
     
     # If no element found, provide helpful error
-    tried = ", ".join(selectors)
-    raise ComponentNotFoundError(
-        f"Could not find '{component}' area in the UI.\n"
-        f"Tried selectors: {tried}\n"
-        f"The component may not be visible or loaded yet."
-    )
+    raise _area_not_found_error(component)
+
+
+class PageSnapshot:
+    """
+    The Hephaestus page read once, shared by several read-only tool calls
+    
+    ui_capture and ui_analyze normally query the live page on every call.
+    Given a snapshot they work on its HTML instead, so a batch of reads
+    costs one page.content() round trip. A snapshot does not follow later
+    changes to the page (interactions, sandbox runs).
+    """
+    
+    def __init__(self, html: str, title: str, url: str, viewport: Optional[Dict[str, int]]):
+        self.html = html
+        self.title = title
+        self.url = url
+        self.viewport = viewport
+        self._soup = None
+    
+    @property
+    def soup(self) -> BeautifulSoup:
+        if self._soup is None:
+            self._soup = BeautifulSoup(self.html, 'html.parser')
+        return self._soup
+    
+    def find_component_element(self, component: str) -> Tag:
+        """Snapshot counterpart of find_component_element()"""
+        if component not in UI_COMPONENTS:
+            raise _unknown_area_error(component)
+        
+        for selector in UI_COMPONENTS[component]["selectors"]:
+            try:
+                element = self.soup.select_one(selector)
+                if element:
+                    return element
+            except:
+                continue
+        
+        raise _area_not_found_error(component)
+    
+    def select_one(self, selector: str) -> Optional[Tag]:
+        try:
+            return self.soup.select_one(selector)
+        except:
+            return None
+    
+    @staticmethod
+    def describe(element: Tag) -> str:
+        """Tag name, id and classes, as ui_capture reports found_with_selector"""
+        classes = element.get("class") or []
+        return (element.name.upper() + ('#' + element["id"] if element.get("id") else '') +
+                ('.' + '.'.join(classes) if classes else ''))
+
+
+async def take_page_snapshot() -> PageSnapshot:
+    """Read a pooled Hephaestus page into a PageSnapshot"""
+    async with browser_manager.lease() as page:
+        return PageSnapshot(
+            html=await page.content(),
+            title=await page.title(),
+            url=page.url,
+            viewport=page.viewport_size
+        )
 
 
 def _detect_dangerous_patterns(content: str) -> List[str]:
@@ -361,7 +689,8 @@ async def ui_list_areas() -> Dict[str, Any]:
 async def ui_capture(
     area: str = "hephaestus",
     selector: Optional[str] = None,
-    include_screenshot: bool = False
+    include_screenshot: bool = False,
+    snapshot: Optional[PageSnapshot] = None
 ) -> Dict[str, Any]:
     """
     Capture UI state from Hephaestus UI
@@ -371,33 +700,50 @@ async def ui_capture(
               Use 'hephaestus' for the entire UI
         selector: Optional CSS selector for specific element within the area
         include_screenshot: Whether to include a visual screenshot
+        snapshot: Read this PageSnapshot instead of the live page
     
     Returns:
         Structured data about the UI state
     """
-    await browser_manager.initialize()
-    page = await browser_manager.get_page()
-    
+    if snapshot is not None and not include_screenshot:
+        return await _capture(None, area, selector, include_screenshot, snapshot)
+    async with browser_manager.lease() as page:
+        return await _capture(page, area, selector, include_screenshot, snapshot)
+
+
+async def _capture(
+    page: Optional[Page],
+    area: str,
+    selector: Optional[str],
+    include_screenshot: bool,
+    snapshot: Optional[PageSnapshot]
+) -> Dict[str, Any]:
+    """ui_capture on a leased page, or on a snapshot (the page then only takes the screenshot)"""
     result = {
         "area": area,
         "ui_url": HEPHAESTUS_URL,
-        "title": await page.title(),
-        "current_url": page.url,
-        "viewport": page.viewport_size,
+        "title": snapshot.title if snapshot else await page.title(),
+        "current_url": snapshot.url if snapshot else page.url,
+        "viewport": snapshot.viewport if snapshot else page.viewport_size,
     }
     
     # Get HTML content for the specified area
     if area == "hephaestus":
         # Capture entire UI
-        html = await page.content()
+        html = snapshot.html if snapshot else await page.content()
         result["description"] = "Entire Hephaestus UI"
     else:
         # Find the component area
         try:
-            element = await find_component_element(page, area)
-            html = await element.inner_html()
+            if snapshot:
+                element = snapshot.find_component_element(area)
+                html = element.decode_contents()
+                result["found_with_selector"] = PageSnapshot.describe(element)
+            else:
+                element = await find_component_element(page, area)
+                html = await element.inner_html()
+                result["found_with_selector"] = await element.evaluate("el => el.tagName + (el.id ? '#' + el.id : '') + (el.className ? '.' + el.className.split(' ').join('.') : '')")
             result["description"] = UI_COMPONENTS[area]["description"]
-            result["found_with_selector"] = await element.evaluate("el => el.tagName + (el.id ? '#' + el.id : '') + (el.className ? '.' + el.className.split(' ').join('.') : '')")
         except ComponentNotFoundError as e:
             result["error"] = str(e)
             result["available_areas"] = list(UI_COMPONENTS.keys())
@@ -407,8 +753,11 @@ async def ui_capture(
     if selector:
         result["selector"] = selector
         try:
-            element = await page.wait_for_selector(selector, timeout=5000)
-            html = await element.inner_html()
+            if snapshot:
+                html = snapshot.select_one(selector).decode_contents()
+            else:
+                element = await page.wait_for_selector(selector, timeout=5000)
+                html = await element.inner_html()
         except:
             result["error"] = f"Selector '{selector}' not found within {area}"
             return result
@@ -468,7 +817,7 @@ async def ui_capture(
                 "id": link.get("id")
             })
     
-    # Include screenshot if requested
+    # Include screenshot if requested (always of the live page)
     if include_screenshot:
         screenshot = await page.screenshot(full_page=False)
         result["screenshot"] = {
@@ -499,9 +848,19 @@ async def ui_interact(
     Returns:
         Result of the interaction including any changes
     """
-    await browser_manager.initialize()
-    page = await browser_manager.get_page()
-    
+    async with browser_manager.lease(dirty=True) as page:
+        return await _interact(page, area, action, selector, value, capture_changes)
+
+
+async def _interact(
+    page: Page,
+    area: str,
+    action: str,
+    selector: str,
+    value: Optional[str],
+    capture_changes: bool
+) -> Dict[str, Any]:
+    """ui_interact on a leased page"""
     result = {
         "area": area,
         "action": action,
@@ -622,9 +981,17 @@ async def ui_sandbox(
     Returns:
         Result of sandbox testing including validation
     """
-    await browser_manager.initialize()
-    page = await browser_manager.get_page()
-    
+    async with browser_manager.lease(dirty=True) as page:
+        return await _sandbox(page, area, changes, preview)
+
+
+async def _sandbox(
+    page: Page,
+    area: str,
+    changes: List[Dict[str, Any]],
+    preview: bool
+) -> Dict[str, Any]:
+    """ui_sandbox on a leased page"""
     result = {
         "area": area,
         "changes": changes,
@@ -760,7 +1127,8 @@ async def ui_sandbox(
 
 async def ui_analyze(
     area: str = "hephaestus",
-    deep_scan: bool = False
+    deep_scan: bool = False,
+    snapshot: Optional[PageSnapshot] = None
 ) -> Dict[str, Any]:
     """
     Analyze UI structure and patterns
@@ -768,13 +1136,24 @@ async def ui_analyze(
     Args:
         area: UI area to analyze
         deep_scan: Whether to perform deep analysis
+        snapshot: Read this PageSnapshot instead of the live page
     
     Returns:
         Analysis of UI structure, patterns, and recommendations
     """
-    await browser_manager.initialize()
-    page = await browser_manager.get_page()
-    
+    if snapshot is not None:
+        return await _analyze(None, area, deep_scan, snapshot)
+    async with browser_manager.lease() as page:
+        return await _analyze(page, area, deep_scan, None)
+
+
+async def _analyze(
+    page: Optional[Page],
+    area: str,
+    deep_scan: bool,
+    snapshot: Optional[PageSnapshot]
+) -> Dict[str, Any]:
+    """ui_analyze on a leased page or on a snapshot"""
     result = {
         "area": area,
         "ui_url": HEPHAESTUS_URL,
@@ -783,11 +1162,14 @@ async def ui_analyze(
     
     # Get HTML for the area
     if area == "hephaestus":
-        html = await page.content()
+        html = snapshot.html if snapshot else await page.content()
     else:
         try:
-            element = await find_component_element(page, area)
-            html = await element.inner_html()
+            if snapshot:
+                html = snapshot.find_component_element(area).decode_contents()
+            else:
+                element = await find_component_element(page, area)
+                html = await element.inner_html()
         except ComponentNotFoundError as e:
             result["error"] = str(e)
             return result
@@ -1171,5 +1553,7 @@ __all__ = [
     "ui_sandbox",
     "ui_analyze",
     "ui_help",
-    "browser_manager"
+    "browser_manager",
+    "PageSnapshot",
+    "take_page_snapshot"
 ]
\ No newline at end of file
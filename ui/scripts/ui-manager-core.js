@@ -283,11 +283,8 @@ class UIManagerCore {
             htmlPanel.innerHTML = `<div style="padding: 20px; text-align: center;">Loading ${componentId} component...</div>`;
             this.activatePanel('html');
             
-            // Add cache busting parameter
-            const cacheBuster = `?t=${new Date().getTime()}`;
-            
-            // Load component HTML directly
-            fetch(`/components/${componentId}/${componentId}-component.html${cacheBuster}`)
+            // Load component HTML directly, revalidating via ETag instead of cache busting
+            fetch(`/components/${componentId}/${componentId}-component.html`, { cache: 'no-cache' })
                 .then(response => {
                     if (!response.ok) {
                         throw new Error(`Failed to load ${componentId} template: ${response.status}`);
@@ -338,11 +335,8 @@ class UIManagerCore {
             htmlPanel.innerHTML = '<div style="padding: 20px; text-align: center;">Loading Athena component...</div>';
             this.activatePanel('html');
             
-            // Add cache busting parameter
-            const cacheBuster = `?t=${new Date().getTime()}`;
-            
-            // Load component HTML directly
-            fetch(`components/athena/athena-component.html${cacheBuster}`)
+            // Load component HTML directly, revalidating via ETag instead of cache busting
+            fetch(`components/athena/athena-component.html`, { cache: 'no-cache' })
                 .then(response => {
                     if (!response.ok) {
                         throw new Error(`Failed to load Athena template: ${response.status}`);
@@ -355,7 +349,7 @@ class UIManagerCore {
                     
                     // Load the component script manually
                     const script = document.createElement('script');
-                    script.src = `scripts/athena/athena-component.js${cacheBuster}`;
+                    script.src = `scripts/athena/athena-component.js`;
                     script.onload = () => {
                         console.log('Athena script loaded successfully');
                         // Initialize component if available
@@ -456,7 +450,6 @@ class UIManagerCore {
         }
         
         // Fetch Athena HTML template using standardized nested structure
-        const cacheBuster = `?t=${new Date().getTime()}`;
         fetch(`components/athena/athena-component.html`)
             .then(response => {
                 if (!response.ok) {
@@ -573,7 +566,6 @@ class UIManagerCore {
         }
         
         // Fetch Ergon HTML template using standardized nested structure
-        const cacheBuster = `?t=${new Date().getTime()}`;
         fetch(`components/ergon/ergon-component.html`)
             .then(response => {
                 if (!response.ok) {
@@ -1099,8 +1091,7 @@ class UIManagerCore {
     // For Ergon, we'll use direct HTML loading since the component implementation is completely different
     if (componentId === 'ergon') {
       // Directly load the HTML
-      const cacheBuster = `?t=${new Date().getTime()}`;
-      fetch(`components/ergon/ergon-component.html${cacheBuster}`)
+      fetch(`components/ergon/ergon-component.html`, { cache: 'no-cache' })
         .then(response => {
           if (!response.ok) {
             throw new Error(`Failed to load Ergon template: ${response.status}`);
@@ -1168,8 +1159,7 @@ class UIManagerCore {
         console.log('Loading Athena component from nested structure');
         
         // First load the HTML
-        const cacheBuster = `?t=${new Date().getTime()}`;
-        fetch(`components/athena/athena-component.html${cacheBuster}`)
+        fetch(`components/athena/athena-component.html`, { cache: 'no-cache' })
           .then(response => {
             if (!response.ok) {
               throw new Error(`Failed to load Athena template: ${response.status}`);
@@ -0,0 +1,76 @@
+"""
+Bundle manifest lookup for the Tekton UI server
+
+`python -m hephaestus.assets bundle` writes bundled copies of documents such
+as index.html to ui/dist along with dist/manifest.json, which records the
+size and mtime of every file that went into them. The server serves the
+bundled copy only while all of those sources are unchanged; once any of them
+is edited it falls back to the original document until the next build.
+"""
+
+import json
+import os
+import re
+import threading
+
+MANIFEST_PATH = os.path.join("dist", "manifest.json")
+
+# Bundles are named <document>-<n>.<16 hex digit content hash>.<js|css>
+HASHED_ASSET_PATTERN = re.compile(r"[\\/]dist[\\/][^\\/]+\.[0-9a-f]{16}\.(?:js|css)$")
+
+
+def is_hashed_asset(path):
+    """True if path is a content-hashed bundle whose contents never change"""
+    return HASHED_ASSET_PATTERN.search(path) is not None
+
+
+class AssetManifest:
+    """Reads dist/manifest.json and maps documents to their bundled copies"""
+
+    def __init__(self, directory):
+        self.directory = os.path.abspath(directory)
+        self.path = os.path.join(self.directory, MANIFEST_PATH)
+        self._lock = threading.Lock()
+        self._mtime_ns = None
+        self._documents = {}
+
+    def _load(self):
+        """Return the manifest's documents, re-reading the file when it changes"""
+        try:
+            mtime_ns = os.stat(self.path).st_mtime_ns
+        except OSError:
+            return {}
+
+        with self._lock:
+            if mtime_ns != self._mtime_ns:
+                try:
+                    with open(self.path, 'r', encoding='utf-8') as f:
+                        self._documents = json.load(f).get("documents", {})
+                except (OSError, ValueError):
+                    self._documents = {}
+                self._mtime_ns = mtime_ns
+            return self._documents
+
+    def document_path(self, file_path):
+        """Return the bundled copy of a document, or None
+
+        Args:
+            file_path: Absolute path of the requested document
+
+        Returns:
+            Absolute path of the bundled document if the manifest lists one
+            and none of its sources changed since it was built, else None
+        """
+        relative = os.path.relpath(os.path.abspath(file_path), self.directory).replace(os.sep, "/")
+        entry = self._load().get(relative)
+        if entry is None:
+            return None
+
+        for source, (size, mtime_ns) in entry.get("sources", {}).items():
+            try:
+                stat_result = os.stat(os.path.join(self.directory, source))
+            except OSError:
+                return None
+            if stat_result.st_size != size or stat_result.st_mtime_ns != mtime_ns:
+                return None
+        return os.path.join(self.directory, entry["file"])
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Cold full-UI load benchmark for the Hephaestus UI server
+
+Fetches every HTML, JavaScript and CSS file under the ui directory the way
+a browser with an empty cache would (six parallel connections, no
+validators), once without and once with Accept-Encoding. Reports the bytes
+transferred and the time to the last byte of the last asset.
+
+Usage:
+    python -m hephaestus.assets precompress
+    python3 ui/server/server.py --port 8080 &
+    python3 ui/server/benchmarks/full_load.py --url http://localhost:8080
+"""
+
+import argparse
+import http.client
+import json
+import os
+import queue
+import threading
+import time
+from urllib.parse import quote, urlparse
+
+UI_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+ASSET_EXTENSIONS = (".html", ".js", ".css")
+
+
+def list_ui_assets(ui_dir):
+    """Return URL paths for every text asset under the ui directory"""
+    paths = []
+    for dirpath, dirnames, filenames in os.walk(ui_dir):
+        dirnames[:] = [d for d in dirnames if d not in ("server", "__pycache__")]
+        for filename in sorted(filenames):
+            full_path = os.path.join(dirpath, filename)
+            if filename.endswith(ASSET_EXTENSIONS) and os.path.isfile(full_path):
+                relative = os.path.relpath(full_path, ui_dir).replace(os.sep, "/")
+                paths.append("/" + quote(relative))
+    return sorted(paths)
+
+
+def load_all(host, port, paths, connections, accept_encoding=None):
+    """Fetch all paths over parallel connections and return the load summary"""
+    work = queue.Queue()
+    for path in paths:
+        work.put(path)
+
+    totals = {"bytes": 0, "requests": 0, "errors": 0, "encoded": 0}
+    lock = threading.Lock()
+    headers = {"Accept-Encoding": accept_encoding} if accept_encoding else {}
+
+    def worker():
+        while True:
+            try:
+                path = work.get_nowait()
+            except queue.Empty:
+                return
+            conn = http.client.HTTPConnection(host, port, timeout=30)
+            try:
+                conn.request("GET", path, headers=headers)
+                response = conn.getresponse()
+                body = response.read()
+                with lock:
+                    totals["requests"] += 1
+                    totals["bytes"] += len(body)
+                    if response.status >= 400:
+                        totals["errors"] += 1
+                    if response.getheader("Content-Encoding"):
+                        totals["encoded"] += 1
+            except Exception:
+                with lock:
+                    totals["errors"] += 1
+            finally:
+                conn.close()
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(connections)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    totals["time_to_last_byte_ms"] = (time.perf_counter() - started) * 1000
+    totals["accept_encoding"] = accept_encoding or "identity"
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold full-UI load benchmark")
+    parser.add_argument("--url", default="http://localhost:8080", help="Base URL of the running server")
+    parser.add_argument("--ui-dir", default=UI_DIR, help="UI directory whose assets are requested")
+    parser.add_argument("--connections", type=int, default=6, help="Parallel connections (browsers use 6)")
+    parser.add_argument("--rounds", type=int, default=3, help="Loads per encoding; the best round is reported")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    target = urlparse(args.url)
+    host = target.hostname or "localhost"
+    port = target.port or 80
+    paths = list_ui_assets(args.ui_dir)
+
+    results = []
+    for accept_encoding in (None, "gzip, deflate, br"):
+        rounds = [load_all(host, port, paths, args.connections, accept_encoding) for _ in range(args.rounds)]
+        results.append(min(rounds, key=lambda r: r["time_to_last_byte_ms"]))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{len(paths)} assets, {args.connections} connections, best of {args.rounds}")
+    print(f"{'accept-encoding':>18} {'requests':>9} {'encoded':>8} {'errors':>7} {'bytes':>11} {'TTLB ms':>9}")
+    for r in results:
+        print(f"{r['accept_encoding']:>18} {r['requests']:>9} {r['encoded']:>8} {r['errors']:>7} "
+              f"{r['bytes']:>11} {r['time_to_last_byte_ms']:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
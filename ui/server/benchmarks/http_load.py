@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+HTTP load benchmark for the Hephaestus UI server
+
+Runs a closed-loop load test against a running server: each simulated client
+issues GET requests back to back for a fixed duration. Results are reported
+per concurrency level as requests/sec and latency percentiles.
+
+Usage:
+    python3 ui/server/server.py --port 8080 --server-mode threaded &
+    python3 ui/server/benchmarks/http_load.py --url http://localhost:8080 \\
+        --concurrency 1 16 64 --duration 10
+
+    # Large-file throughput (compare against a server started with --no-sendfile)
+    python3 ui/server/benchmarks/http_load.py --path /images/icon.png --concurrency 1 16
+"""
+
+import argparse
+import http.client
+import json
+import threading
+import time
+from urllib.parse import urlparse
+
+# Representative mix of what a tab requests while loading the UI
+DEFAULT_PATHS = [
+    "/index.html",
+    "/scripts/main.js",
+    "/scripts/ui-manager-core.js",
+    "/scripts/terminal-chat-enhanced.js",
+    "/scripts/hermes-connector.js",
+    "/styles/main.css",
+    "/styles/themes/dark-blue.css",
+    "/components/rhetor/rhetor-component.html",
+    "/components/hermes/hermes-component.html",
+    "/health",
+]
+
+
+def percentile(samples, pct):
+    """Return the pct percentile of a list of samples (nearest rank)"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def fetch(host, port, path, headers=None, timeout=30):
+    """Issue one GET request and return (status, body_bytes, elapsed_seconds)"""
+    start = time.perf_counter()
+    conn = http.client.HTTPConnection(host, port, timeout=timeout)
+    try:
+        conn.request("GET", path, headers=headers or {})
+        response = conn.getresponse()
+        body = response.read()
+        return response.status, len(body), time.perf_counter() - start
+    finally:
+        conn.close()
+
+
+def run_level(host, port, paths, concurrency, duration, headers=None):
+    """Run one concurrency level and return its summary"""
+    latencies = []
+    errors = [0]
+    transferred = [0]
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def client(offset):
+        local_latencies = []
+        local_errors = 0
+        local_bytes = 0
+        i = offset
+        while time.perf_counter() < deadline:
+            path = paths[i % len(paths)]
+            i += 1
+            try:
+                status, size, elapsed = fetch(host, port, path, headers)
+                if status >= 400:
+                    local_errors += 1
+                local_latencies.append(elapsed)
+                local_bytes += size
+            except Exception:
+                local_errors += 1
+        with lock:
+            latencies.extend(local_latencies)
+            errors[0] += local_errors
+            transferred[0] += local_bytes
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=client, args=(n,), daemon=True) for n in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - started
+
+    return {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": errors[0],
+        "bytes": transferred[0],
+        "requests_per_sec": len(latencies) / wall if wall else 0.0,
+        "mb_per_sec": transferred[0] / wall / (1024 * 1024) if wall else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "max_ms": max(latencies) * 1000 if latencies else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Hephaestus UI server HTTP load benchmark")
+    parser.add_argument("--url", default="http://localhost:8080", help="Base URL of the running server")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 16, 64],
+                        help="Concurrent client counts to test")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per concurrency level")
+    parser.add_argument("--path", dest="paths", action="append", default=None,
+                        help="Path to request (repeatable, defaults to a UI load mix)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    target = urlparse(args.url)
+    host = target.hostname or "localhost"
+    port = target.port or 80
+    paths = args.paths or DEFAULT_PATHS
+
+    results = [run_level(host, port, paths, level, args.duration) for level in args.concurrency]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'clients':>8} {'requests':>9} {'errors':>7} {'req/s':>9} {'MB/s':>8} "
+          f"{'p50 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    for r in results:
+        print(f"{r['concurrency']:>8} {r['requests']:>9} {r['errors']:>7} {r['requests_per_sec']:>9.1f} "
+              f"{r['mb_per_sec']:>8.1f} {r['p50_ms']:>8.2f} {r['p99_ms']:>8.2f} {r['max_ms']:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Proxy connection pooling benchmark for the Hephaestus UI server
+
+Starts a local keep-alive stub backend and measures the latency of proxied
+API calls with and without connection pooling.
+
+Without --url the backend leg of proxy_api_request is measured in-process:
+each call acquires a connection from a ConnectionPool (max_size 0 behaves
+like the old connect-per-request code), sends the request, reads the
+response and releases the connection.
+
+With --url the calls go through a running Hephaestus server whose Ergon
+port points at the stub. Run it once per pool setting:
+
+    python3 ui/server/benchmarks/proxy_pool.py --stub-port 8102 --serve-only &
+    ERGON_PORT=8102 python3 ui/server/server.py --port 8080 --proxy-pool-size 0 &
+    python3 ui/server/benchmarks/proxy_pool.py --url http://localhost:8080
+    # restart the server without --proxy-pool-size and run again
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from connection_pool import ConnectionPool
+from http_load import percentile, run_level
+
+STUB_BODY = json.dumps({"status": "ok", "response": "stub backend reply"}).encode("utf-8")
+
+
+class StubBackendHandler(BaseHTTPRequestHandler):
+    """Keep-alive backend answering every request with a small JSON body"""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without TCP_NODELAY the
+    # second one waits for a delayed ACK on reused connections
+    disable_nagle_algorithm = True
+
+    def _reply(self):
+        length = int(self.headers.get("Content-Length", 0))
+        if length:
+            self.rfile.read(length)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(STUB_BODY)))
+        self.end_headers()
+        self.wfile.write(STUB_BODY)
+
+    do_GET = _reply
+    do_POST = _reply
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_backend(port=0):
+    """Start the stub backend in a daemon thread and return the server"""
+    server = ThreadingHTTPServer(("127.0.0.1", port), StubBackendHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run_pool_level(port, pool_size, concurrency, duration):
+    """Drive proxied-style calls through a ConnectionPool for one setting"""
+    pool = ConnectionPool("127.0.0.1", port, max_size=pool_size)
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def client():
+        local_latencies = []
+        local_errors = 0
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                pooled, response = pool.request("POST", "/api/message", body=b'{"message": "ping"}',
+                                                headers={"Content-Type": "application/json"})
+                response.read()
+                pool.release(pooled, reusable=not response.will_close)
+                local_latencies.append(time.perf_counter() - start)
+            except Exception:
+                local_errors += 1
+        with lock:
+            latencies.extend(local_latencies)
+            errors[0] += local_errors
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=client, daemon=True) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - started
+    pool.close()
+
+    stats = pool.stats()
+    return {
+        "pool_size": pool_size,
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": errors[0],
+        "connections": stats["created"],
+        "requests_per_sec": len(latencies) / wall if wall else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Proxy connection pooling benchmark")
+    parser.add_argument("--stub-port", type=int, default=0, help="Port for the stub backend (0 picks one)")
+    parser.add_argument("--serve-only", action="store_true", help="Only run the stub backend")
+    parser.add_argument("--url", default=None,
+                        help="Measure through a running Hephaestus server proxying to the stub")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 16], help="Concurrent clients")
+    parser.add_argument("--pool-sizes", type=int, nargs="+", default=[0, 16],
+                        help="Pool sizes to compare in-process (0 = no pooling)")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds per run")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    stub = start_stub_backend(args.stub_port)
+    stub_port = stub.server_address[1]
+    if args.serve_only:
+        print(f"Stub backend listening on 127.0.0.1:{stub_port}")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            return
+
+    if args.url:
+        target = urlparse(args.url)
+        results = [run_level(target.hostname or "localhost", target.port or 80, ["/api/terminal/bench"],
+                             level, args.duration) for level in args.concurrency]
+        columns = ("concurrency", "requests", "errors", "requests_per_sec", "p50_ms", "p99_ms")
+    else:
+        results = [run_pool_level(stub_port, size, level, args.duration)
+                   for size in args.pool_sizes for level in args.concurrency]
+        columns = ("pool_size", "concurrency", "requests", "errors", "connections",
+                   "requests_per_sec", "p50_ms", "p99_ms")
+    stub.shutdown()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(" ".join(f"{column:>16}" for column in columns))
+    for r in results:
+        print(" ".join(f"{r[column]:>16.2f}" if isinstance(r[column], float) else f"{r[column]:>16}"
+                       for column in columns))
+
+
+if __name__ == "__main__":
+    main()
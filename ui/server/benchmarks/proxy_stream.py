@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Streaming proxy benchmark for the Hephaestus UI server
+
+Starts a stub Ergon backend that answers POST /terminal/stream with a
+server-sent event stream (one event every --interval seconds, chunked) and
+GET /terminal/large with a large chunked body. It then measures, through a
+running Hephaestus server whose Ergon port points at the stub, the time to
+the first body byte and to the last byte of each response.
+
+    python3 ui/server/benchmarks/proxy_stream.py --stub-port 8102 --serve-only &
+    ERGON_PORT=8102 python3 ui/server/server.py --port 8080 --buffer-proxy &
+    python3 ui/server/benchmarks/proxy_stream.py --url http://localhost:8080
+    # restart the server without --buffer-proxy and run again
+"""
+
+import argparse
+import http.client
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from http_load import percentile
+
+
+class StreamingStubHandler(BaseHTTPRequestHandler):
+    """Stub backend producing chunked responses over time"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    events = 20
+    interval = 0.05
+    large_bytes = 32 * 1024 * 1024
+
+    def _send_chunk(self, data):
+        self.wfile.write(b"%x\r\n%b\r\n" % (len(data), data))
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        if length:
+            self.rfile.read(length)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for n in range(self.events):
+            time.sleep(self.interval)
+            self._send_chunk(f"data: {json.dumps({'chunk': f'token {n} '})}\n\n".encode("utf-8"))
+        self._send_chunk(b'data: {"done": true}\n\n')
+        self.wfile.write(b"0\r\n\r\n")
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        piece = b"x" * (256 * 1024)
+        for _ in range(self.large_bytes // len(piece)):
+            self._send_chunk(piece)
+        self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_backend(port=0):
+    """Start the streaming stub in a daemon thread and return the server"""
+    server = ThreadingHTTPServer(("127.0.0.1", port), StreamingStubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def timed_request(host, port, method, path, body=None):
+    """Return (status, bytes, seconds to first body byte, seconds to last byte)"""
+    start = time.perf_counter()
+    conn = http.client.HTTPConnection(host, port, timeout=60)
+    try:
+        conn.request(method, path, body=body, headers={"Content-Type": "application/json"})
+        response = conn.getresponse()
+        first_byte = None
+        total = 0
+        while True:
+            data = response.read1(65536)
+            if not data:
+                break
+            if first_byte is None:
+                first_byte = time.perf_counter() - start
+            total += len(data)
+        return response.status, total, first_byte or 0.0, time.perf_counter() - start
+    finally:
+        conn.close()
+
+
+def measure(host, port, method, path, requests, body=None):
+    """Run sequential requests and summarise their timings"""
+    samples = [timed_request(host, port, method, path, body) for _ in range(requests)]
+    first_bytes = [s[2] for s in samples]
+    totals = [s[3] for s in samples]
+    return {
+        "request": f"{method} {path}",
+        "requests": requests,
+        "errors": sum(1 for s in samples if s[0] >= 400),
+        "bytes": samples[-1][1] if samples else 0,
+        "ttfb_p50_ms": percentile(first_bytes, 50) * 1000,
+        "total_p50_ms": percentile(totals, 50) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Streaming proxy benchmark")
+    parser.add_argument("--stub-port", type=int, default=0, help="Port for the stub backend (0 picks one)")
+    parser.add_argument("--serve-only", action="store_true", help="Only run the stub backend")
+    parser.add_argument("--url", default="http://localhost:8080", help="Hephaestus server proxying to the stub")
+    parser.add_argument("--requests", type=int, default=5, help="Requests per measurement")
+    parser.add_argument("--events", type=int, default=20, help="Events per streamed response")
+    parser.add_argument("--interval", type=float, default=0.05, help="Seconds between streamed events")
+    parser.add_argument("--large-mb", type=int, default=32, help="Size of the large response in MB")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    StreamingStubHandler.events = args.events
+    StreamingStubHandler.interval = args.interval
+    StreamingStubHandler.large_bytes = args.large_mb * 1024 * 1024
+
+    if args.serve_only:
+        stub = start_stub_backend(args.stub_port)
+        print(f"Stub backend listening on 127.0.0.1:{stub.server_address[1]}")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            return
+
+    target = urlparse(args.url)
+    host, port = target.hostname or "localhost", target.port or 80
+    body = json.dumps({"message": "hello", "context_id": "bench", "streaming": True}).encode("utf-8")
+    results = [
+        measure(host, port, "POST", "/api/terminal/stream", args.requests, body),
+        measure(host, port, "GET", "/api/terminal/large", args.requests),
+    ]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'request':>26} {'requests':>9} {'errors':>7} {'bytes':>10} {'TTFB ms':>9} {'total ms':>9}")
+    for r in results:
+        print(f"{r['request']:>26} {r['requests']:>9} {r['errors']:>7} {r['bytes']:>10} "
+              f"{r['ttfb_p50_ms']:>9.1f} {r['total_p50_ms']:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
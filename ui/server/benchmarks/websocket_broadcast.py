@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+WebSocket fan-out benchmark for topic broadcasts
+
+Connects --subscribers in-process clients to a WebSocketReactor over socket
+pairs and publishes --messages events to all of them, either serialised and
+framed once per subscriber (as sending through each client would) or with
+websocket_router.broadcast, which encodes once and queues the same frame
+bytes for every subscriber. Reports deliveries per second until the last
+byte reached the clients, and the publishing thread's CPU per event.
+
+    python3 ui/server/benchmarks/websocket_broadcast.py
+"""
+
+import argparse
+import json
+import os
+import selectors
+import socket
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from websocket_frames import OP_TEXT, encode_frame
+from websocket_reactor import WebSocketReactor
+from websocket_router import ReactorWebSocket, broadcast
+
+MODES = ("per-client", "broadcast")
+
+
+def make_event(size):
+    """An EVENT message as WebSocketServer.publish sends it"""
+    return {"type": "EVENT", "source": "hermes", "target": "UI", "timestamp": "2026-01-01T00:00:00.000000",
+            "payload": {"topic": "hermes.events", "event": {"component": "ergon", "data": "x" * size}}}
+
+
+def drain(sockets, expected, done):
+    """Read from every client socket until expected bytes have arrived"""
+    selector = selectors.DefaultSelector()
+    for sock in sockets:
+        selector.register(sock, selectors.EVENT_READ)
+    received = 0
+    while received < expected:
+        for key, _ in selector.select(timeout=5):
+            received += len(key.fileobj.recv(262144))
+    done.set()
+    selector.close()
+
+
+def run_case(mode, subscribers, messages, size):
+    """Publish messages to subscribers in one mode and time the fan-out"""
+    reactor = WebSocketReactor(max_pending=64 * 1024 * 1024, high_watermark=32 * 1024 * 1024).start()
+    clients = []
+    websockets = []
+    for n in range(subscribers):
+        server_side, client_side = socket.socketpair()
+        client_side.setblocking(False)
+        clients.append(client_side)
+        websockets.append(ReactorWebSocket(reactor.add(server_side, ("bench", n))))
+    while len(reactor.connections) < subscribers:
+        time.sleep(0.01)
+
+    event = make_event(size)
+    frame_length = len(encode_frame(OP_TEXT, json.dumps(event).encode("utf-8")))
+    done = threading.Event()
+    reader = threading.Thread(target=drain, args=(clients, frame_length * subscribers * messages, done))
+    reader.start()
+
+    cpu_start = time.thread_time()
+    start = time.perf_counter()
+    for _ in range(messages):
+        if mode == "broadcast":
+            broadcast(websockets, event)
+        else:
+            for websocket in websockets:
+                websocket.connection.send_text(json.dumps(event))
+    publish_cpu = time.thread_time() - cpu_start
+    done.wait()
+    elapsed = time.perf_counter() - start
+    reader.join()
+
+    reactor.stop()
+    for sock in clients:
+        sock.close()
+    return {
+        "mode": mode,
+        "subscribers": subscribers,
+        "messages": messages,
+        "frame_bytes": frame_length,
+        "deliveries_per_sec": subscribers * messages / elapsed,
+        "elapsed_ms": elapsed * 1000,
+        "publish_cpu_us_per_event": publish_cpu / messages * 1e6,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="WebSocket topic fan-out benchmark")
+    parser.add_argument("--subscribers", type=int, nargs="+", default=[10, 100, 1000],
+                        help="Subscriber counts to measure")
+    parser.add_argument("--messages", type=int, default=200, help="Events published per run")
+    parser.add_argument("--size", type=int, default=200, help="Event data bytes")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = [run_case(mode, subscribers, args.messages, args.size)
+               for subscribers in args.subscribers for mode in MODES]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'mode':>11} {'subscribers':>12} {'messages':>9} {'frame B':>8} {'deliveries/s':>13} "
+          f"{'elapsed ms':>11} {'publish CPU us/event':>21}")
+    for r in results:
+        print(f"{r['mode']:>11} {r['subscribers']:>12} {r['messages']:>9} {r['frame_bytes']:>8} "
+              f"{r['deliveries_per_sec']:>13.0f} {r['elapsed_ms']:>11.1f} {r['publish_cpu_us_per_event']:>21.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+WebSocket frame decoding microbenchmark
+
+Decodes masked client frames of each --sizes with the previous decoder
+(per-byte unmask loop, buffer resliced after every frame) and with
+websocket_frames.decode_frame (bulk unmask, parsing at an offset), and
+reports the time per frame. A second measurement drains a buffer holding
+--burst small frames, which is where reslicing per frame went quadratic.
+
+    python3 ui/server/benchmarks/websocket_codec.py
+"""
+
+import argparse
+import json
+import os
+import struct
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import websocket_frames
+from websocket_frames import decode_frame
+from websocket_load import mask_frame
+
+
+def previous_decode_frame(data):
+    """The decoder the server used before websocket_frames, for comparison"""
+    if len(data) < 2:
+        return None, None, 0
+    opcode = data[0] & 0x0F
+    masked = (data[1] & 0x80) != 0
+    payload_length = data[1] & 0x7F
+    header_length = 2
+    if payload_length == 126:
+        payload_length = struct.unpack("!H", data[2:4])[0]
+        header_length = 4
+    elif payload_length == 127:
+        payload_length = struct.unpack("!Q", data[2:10])[0]
+        header_length = 10
+    mask_key = None
+    if masked:
+        mask_key = data[header_length:header_length + 4]
+        header_length += 4
+    if len(data) < header_length + payload_length:
+        return None, None, 0
+    payload = data[header_length:header_length + payload_length]
+    if masked and mask_key:
+        payload = bytearray(payload)
+        for i in range(len(payload)):
+            payload[i] ^= mask_key[i % 4]
+    return opcode, payload, header_length + payload_length
+
+
+def drain_previous(buffer):
+    buffer = bytearray(buffer)
+    while buffer:
+        opcode, payload, consumed = previous_decode_frame(buffer)
+        if opcode is None:
+            break
+        buffer = buffer[consumed:]
+
+
+def drain_offset(buffer):
+    offset = 0
+    while True:
+        frame = decode_frame(buffer, offset)
+        if frame is None:
+            break
+        offset = frame[3]
+
+
+def time_per_call(func, budget=1.0):
+    """Return seconds per call, repeating func for about budget seconds"""
+    timer = timeit.Timer(func)
+    number, elapsed = timer.autorange()
+    repeats = max(1, min(5, int(budget / elapsed))) if elapsed else 5
+    return min(timer.repeat(repeat=repeats, number=number)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description="WebSocket frame decoding microbenchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1024, 64 * 1024, 1024 * 1024],
+                        help="Payload sizes in bytes")
+    parser.add_argument("--burst", type=int, default=2000, help="Small frames in the burst buffer")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = []
+    for size in args.sizes:
+        payload = os.urandom(size)
+        frame = bytearray(mask_frame(0x2, payload))
+        assert bytes(previous_decode_frame(frame)[1]) == payload
+        assert decode_frame(frame)[2] == payload
+        previous = time_per_call(lambda: previous_decode_frame(frame))
+        current = time_per_call(lambda: decode_frame(frame))
+        results.append({"case": f"1 frame x {size} B", "previous_ms": previous * 1000,
+                        "current_ms": current * 1000, "speedup": previous / current,
+                        "mb_per_sec": size / current / 1e6})
+
+    burst = bytearray(b"".join(mask_frame(0x1, os.urandom(128)) for _ in range(args.burst)))
+    previous = time_per_call(lambda: drain_previous(burst))
+    current = time_per_call(lambda: drain_offset(burst))
+    results.append({"case": f"{args.burst} frames x 128 B", "previous_ms": previous * 1000,
+                    "current_ms": current * 1000, "speedup": previous / current,
+                    "mb_per_sec": len(burst) / current / 1e6})
+
+    if args.json:
+        print(json.dumps({"numpy": websocket_frames.numpy is not None, "results": results}, indent=2))
+        return
+
+    print(f"NumPy unmasking: {'yes' if websocket_frames.numpy is not None else 'no'}")
+    print(f"{'case':>22} {'previous ms':>12} {'current ms':>11} {'speedup':>8} {'MB/s':>9}")
+    for r in results:
+        print(f"{r['case']:>22} {r['previous_ms']:>12.3f} {r['current_ms']:>11.3f} "
+              f"{r['speedup']:>7.0f}x {r['mb_per_sec']:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
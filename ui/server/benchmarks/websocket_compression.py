@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+permessage-deflate benchmark for /ws chat streams
+
+Builds the message sequences the UI server sends - a simulated LLM reply
+streamed in 5-character chunks the way WebSocketServer.handle_llm_request
+does, and echo responses to UI commands - and encodes them as server frames
+under several deflate settings. Reports bytes on the wire per message, the
+server's compression time and the client's decompression time per message,
+and the deflate memory each connection holds between messages.
+
+    python3 ui/server/benchmarks/websocket_compression.py
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from websocket_deflate import MEM_LEVEL, PerMessageDeflate
+from websocket_frames import OP_TEXT, RSV1, encode_frame
+
+REPLY = ("I received your message: \"How do I create an agent that summarises my inbox?\". This is a "
+         "simulated response as I'm not connected to an LLM. To use a real LLM, you should connect to the "
+         "Ergon API which is configured with the appropriate LLM integration.\n\nThis is a simulated "
+         "response from the Ergon AI assistant. In a real implementation, I would help with agent "
+         "creation, automation, and tool configuration.")
+
+
+def llm_stream(context="ergon", target="UI", chunk_size=5):
+    """Messages of one streamed LLM reply, as handle_llm_request sends them"""
+    def message(type_, source, payload):
+        return json.dumps({"type": type_, "source": source, "target": target,
+                           "timestamp": datetime.now().isoformat(), "payload": payload})
+    yield message("UPDATE", "SYSTEM", {"status": "typing", "isTyping": True, "context": context})
+    for i in range(0, len(REPLY), chunk_size):
+        yield message("UPDATE", context, {"chunk": REPLY[i:i + chunk_size], "context": context})
+    yield message("UPDATE", context, {"done": True, "context": context})
+    yield message("UPDATE", "SYSTEM", {"status": "typing", "isTyping": False, "context": context})
+
+
+def echo_stream(count=50):
+    """Echo responses to UI commands, as answer_websocket_message sends them"""
+    for n in range(count):
+        message = json.dumps({"type": "COMMAND", "source": "UI", "target": "SERVER",
+                              "payload": {"command": f"status {n}"}})
+        yield json.dumps({"type": "RESPONSE", "source": "SERVER", "target": "UI",
+                          "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                          "payload": {"message": f"Received: {message[:50]}...", "status": "ok"}})
+
+
+def compressor_memory(window_bits):
+    """Approximate bytes zlib keeps for a compressor between messages"""
+    return (1 << (window_bits + 2)) + (1 << (MEM_LEVEL + 9))
+
+
+def run_case(name, messages, settings):
+    """Encode messages under one setting and decode them as a client would"""
+    payloads = [m.encode("utf-8") for m in messages]
+    raw = sum(len(encode_frame(OP_TEXT, p)) for p in payloads)
+    if settings is None:
+        return {"stream": name, "setting": "off", "messages": len(payloads), "wire_bytes": raw,
+                "bytes_per_message": raw / len(payloads), "ratio": 1.0,
+                "compress_us": 0.0, "decompress_us": 0.0, "memory_bytes": 0}
+
+    label, takeover, window_bits = settings
+    server = PerMessageDeflate(takeover, takeover, window_bits)
+    client = PerMessageDeflate(takeover, takeover, 15, window_bits)
+
+    frames = []
+    start = time.perf_counter()
+    for payload in payloads:
+        compressed = server.compress(payload)
+        if compressed is None:
+            frames.append((0, encode_frame(OP_TEXT, payload)))
+        else:
+            frames.append((RSV1, encode_frame(OP_TEXT, compressed, rsv=RSV1)))
+    compress_time = time.perf_counter() - start
+
+    # The client inflates server messages with the server's window; its own
+    # decompress() reads the "client" window, so the roles swap here
+    start = time.perf_counter()
+    for (rsv, frame), payload in zip(frames, payloads):
+        body = frame[2:] if frame[1] < 126 else frame[4:]
+        if rsv:
+            body = client.decompress(body)
+        assert body == payload
+    decompress_time = time.perf_counter() - start
+
+    wire = sum(len(frame) for _, frame in frames)
+    return {
+        "stream": name,
+        "setting": label,
+        "messages": len(payloads),
+        "wire_bytes": wire,
+        "bytes_per_message": wire / len(payloads),
+        "ratio": wire / raw,
+        "compress_us": compress_time / len(payloads) * 1e6,
+        "decompress_us": decompress_time / len(payloads) * 1e6,
+        "memory_bytes": compressor_memory(window_bits) if takeover else 0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="permessage-deflate benchmark for /ws chat streams")
+    parser.add_argument("--replies", type=int, default=20, help="Streamed LLM replies per run")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    streams = {
+        "llm stream": [m for _ in range(args.replies) for m in llm_stream()],
+        "echo": list(echo_stream()),
+    }
+    settings = [
+        None,
+        ("takeover, 15-bit window", True, 15),
+        ("takeover, 12-bit window", True, 12),
+        ("takeover, 9-bit window", True, 9),
+        ("no context takeover", False, 15),
+    ]
+    results = [run_case(name, messages, setting) for name, messages in streams.items() for setting in settings]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'stream':>11} {'setting':>24} {'msgs':>5} {'B/msg':>7} {'ratio':>6} "
+          f"{'compress us':>12} {'inflate us':>11} {'memory KB':>10}")
+    for r in results:
+        print(f"{r['stream']:>11} {r['setting']:>24} {r['messages']:>5} {r['bytes_per_message']:>7.1f} "
+              f"{r['ratio']:>6.2f} {r['compress_us']:>12.1f} {r['decompress_us']:>11.1f} "
+              f"{r['memory_bytes'] / 1024:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+/ws message encoding benchmark
+
+Encodes and decodes representative /ws envelopes - a coalesced LLM UPDATE
+chunk, a command RESPONSE, a typing indicator and a pushed EVENT - with
+stdlib json and with each binary subprotocol codec whose library is
+installed (message_encoding.CODECS), and reports the encoded size, the time
+per encode and decode, and the messages per second one core sustains.
+
+    pip install msgpack cbor2
+    python3 ui/server/benchmarks/websocket_encoding.py
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from message_encoding import CODECS, JSON_CODEC
+
+
+def envelopes():
+    """Messages as WebSocketServer sends them"""
+    timestamp = datetime.now().isoformat()
+    return {
+        "update chunk": {"type": "UPDATE", "source": "ergon", "target": "UI", "timestamp": timestamp,
+                         "payload": {"chunk": "I received your message. This is a simulated response as I'm "
+                                              "not connected to an LLM. To use a real LLM, you should ",
+                                     "context": "ergon"}},
+        "typing": {"type": "UPDATE", "source": "SYSTEM", "target": "UI", "timestamp": timestamp,
+                   "payload": {"status": "typing", "isTyping": True, "context": "ergon"}},
+        "response": {"type": "RESPONSE", "source": "SERVER", "target": "UI", "timestamp": timestamp,
+                     "payload": {"response": "Received command: status", "status": "success"}},
+        "event": {"type": "EVENT", "source": "hermes", "target": "UI", "timestamp": timestamp,
+                  "payload": {"topic": "hermes.events",
+                              "event": {"component": "ergon", "status": "healthy", "port": 8102,
+                                        "uptime": 3612.5, "capabilities": ["agents", "tools", "memory"]}}}}
+
+
+def measure(codec, message, number):
+    """Time encode and decode of one message"""
+    payload = codec.encode(message)
+    assert codec.decode(payload) == message
+    encode = min(timeit.repeat(lambda: codec.encode(message), number=number, repeat=3)) / number
+    decode = min(timeit.repeat(lambda: codec.decode(payload), number=number, repeat=3)) / number
+    return {
+        "encoding": codec.name or "json",
+        "bytes": len(payload),
+        "encode_us": encode * 1e6,
+        "decode_us": decode * 1e6,
+        "messages_per_sec": 1 / (encode + decode),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="/ws message encoding benchmark")
+    parser.add_argument("--number", type=int, default=20000, help="Iterations per timing")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    codecs = [JSON_CODEC] + list(CODECS.values())
+    results = []
+    for name, message in envelopes().items():
+        for codec in codecs:
+            result = measure(codec, message, args.number)
+            result["message"] = name
+            results.append(result)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    if not CODECS:
+        print("No binary codec installed (pip install msgpack cbor2); measuring json only")
+    print(f"{'message':>13} {'encoding':>15} {'bytes':>6} {'encode us':>10} {'decode us':>10} {'msgs/s':>9}")
+    for r in results:
+        print(f"{r['message']:>13} {r['encoding']:>15} {r['bytes']:>6} {r['encode_us']:>10.2f} "
+              f"{r['decode_us']:>10.2f} {r['messages_per_sec']:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+WebSocket connection-scaling benchmark for the Hephaestus UI server
+
+Opens N /ws connections to a running server and measures, for each N:
+
+- idle: server CPU while every connection sits open and silent
+- active: every connection sends a JSON message each --interval seconds
+  and waits for the server's reply; reports round-trip p50/p99 and the
+  server's CPU
+
+Server CPU is read from /proc/<pid>/stat, so pass --server-pid (Linux only);
+without it the CPU column is left empty.
+
+    python3 ui/server/server.py --port 8080 &
+    python3 ui/server/benchmarks/websocket_load.py --url http://localhost:8080 --server-pid $!
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import random
+import struct
+import sys
+import time
+from urllib.parse import urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from http_load import percentile
+
+# Connections opened at once; keeps the listen backlog from overflowing
+CONNECT_BATCH = 50
+
+
+def process_cpu_seconds(pid):
+    """Return user+system CPU seconds used by a process, or None"""
+    if pid is None:
+        return None
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+def mask_frame(opcode, payload):
+    """Encode a masked client frame"""
+    mask = os.urandom(4)
+    length = len(payload)
+    if length <= 125:
+        header = struct.pack("!BB", 0x80 | opcode, 0x80 | length)
+    elif length <= 65535:
+        header = struct.pack("!BBH", 0x80 | opcode, 0x80 | 126, length)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, 0x80 | 127, length)
+    key = (mask * (length // 4 + 1))[:length]
+    masked = (int.from_bytes(payload, "big") ^ int.from_bytes(key, "big")).to_bytes(length, "big")
+    return header + mask + masked
+
+
+async def read_frame(reader):
+    """Read one unmasked server frame and return (opcode, payload)"""
+    first, second = await reader.readexactly(2)
+    length = second & 0x7F
+    if length == 126:
+        length = struct.unpack("!H", await reader.readexactly(2))[0]
+    elif length == 127:
+        length = struct.unpack("!Q", await reader.readexactly(8))[0]
+    return first & 0x0F, await reader.readexactly(length)
+
+
+async def open_websocket(host, port, path="/ws"):
+    """Open a /ws connection and consume the welcome message"""
+    reader, writer = await asyncio.open_connection(host, port)
+    key = base64.b64encode(os.urandom(16)).decode()
+    writer.write((f"GET {path} HTTP/1.1\r\nHost: {host}:{port}\r\nUpgrade: websocket\r\n"
+                  f"Connection: Upgrade\r\nSec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n").encode())
+    status = await reader.readuntil(b"\r\n\r\n")
+    if b" 101 " not in status.split(b"\r\n", 1)[0]:
+        raise ConnectionError(status.split(b"\r\n", 1)[0].decode())
+    await read_frame(reader)
+    return reader, writer
+
+
+async def client_loop(reader, writer, interval, deadline, latencies, errors):
+    """Send a message every interval seconds and time the reply"""
+    await asyncio.sleep(random.random() * interval)
+    message = json.dumps({"type": "COMMAND", "source": "BENCH", "target": "SERVER",
+                          "payload": {"command": "ping"}}).encode()
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            writer.write(mask_frame(0x1, message))
+            opcode, _ = await asyncio.wait_for(read_frame(reader), timeout=10)
+            latencies.append(time.perf_counter() - start)
+        except (asyncio.TimeoutError, ConnectionError, asyncio.IncompleteReadError):
+            errors[0] += 1
+            return
+        await asyncio.sleep(max(0.0, interval - (time.perf_counter() - start)))
+
+
+async def run_level(host, port, connections, duration, interval, server_pid):
+    """Measure one connection count idle and active"""
+    clients = []
+    failed = 0
+    for start in range(0, connections, CONNECT_BATCH):
+        batch = await asyncio.gather(*(open_websocket(host, port)
+                                       for _ in range(min(CONNECT_BATCH, connections - start))),
+                                     return_exceptions=True)
+        for result in batch:
+            if isinstance(result, Exception):
+                failed += 1
+            else:
+                clients.append(result)
+
+    results = []
+    for mode in ("idle", "active"):
+        latencies = []
+        errors = [0]
+        cpu_before = process_cpu_seconds(server_pid)
+        started = time.perf_counter()
+        if mode == "idle":
+            await asyncio.sleep(duration)
+        else:
+            deadline = started + duration
+            await asyncio.gather(*(client_loop(reader, writer, interval, deadline, latencies, errors)
+                                   for reader, writer in clients))
+        wall = time.perf_counter() - started
+        cpu_after = process_cpu_seconds(server_pid)
+        results.append({
+            "connections": len(clients),
+            "failed": failed,
+            "mode": mode,
+            "messages": len(latencies),
+            "errors": errors[0],
+            "p50_ms": percentile(latencies, 50) * 1000,
+            "p99_ms": percentile(latencies, 99) * 1000,
+            "server_cpu_pct": (cpu_after - cpu_before) / wall * 100 if cpu_before is not None else None,
+        })
+
+    for _, writer in clients:
+        writer.close()
+    await asyncio.sleep(0.5)
+    return results
+
+
+async def run(args):
+    target = urlparse(args.url)
+    host, port = target.hostname or "localhost", target.port or 80
+    results = []
+    for connections in args.connections:
+        results.extend(await run_level(host, port, connections, args.duration, args.interval,
+                                       args.server_pid))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="WebSocket connection-scaling benchmark")
+    parser.add_argument("--url", default="http://localhost:8080", help="Hephaestus server")
+    parser.add_argument("--connections", type=int, nargs="+", default=[10, 100, 1000],
+                        help="Connection counts to measure")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds per phase")
+    parser.add_argument("--interval", type=float, default=1.0,
+                        help="Seconds between messages per connection when active")
+    parser.add_argument("--server-pid", type=int, default=None, help="Server process for CPU accounting")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for send jitter")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    results = asyncio.run(run(args))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'connections':>12} {'failed':>7} {'mode':>7} {'messages':>9} {'errors':>7} "
+          f"{'p50 ms':>8} {'p99 ms':>8} {'server CPU %':>13}")
+    for r in results:
+        cpu = f"{r['server_cpu_pct']:.1f}" if r["server_cpu_pct"] is not None else "-"
+        print(f"{r['connections']:>12} {r['failed']:>7} {r['mode']:>7} {r['messages']:>9} {r['errors']:>7} "
+              f"{r['p50_ms']:>8.2f} {r['p99_ms']:>8.2f} {cpu:>13}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+/ws load generator for the Hephaestus UI server
+
+Opens --clients WebSocket clients (ramped up over --ramp seconds) against a
+running server, or against one it launches with run_http_server (--launch).
+Each client sends a seeded mix of REGISTER, COMMAND and LLM_REQUEST messages
+at --rate messages per second (Poisson arrivals) for --duration seconds and
+waits for each reply: the RESPONSE for REGISTER and COMMAND, the done UPDATE
+of the streamed reply for LLM_REQUEST.
+
+Records connect time (TCP connect to welcome message), throughput, and
+latency percentiles per message type plus time to the first LLM chunk. The
+same --seed produces the same message sequence for every client, so runs
+against different server builds compare like with like.
+
+    python3 ui/server/benchmarks/websocket_loadgen.py --launch --clients 200 --output ws.json
+    python3 ui/server/benchmarks/websocket_loadgen.py --url http://localhost:8080 --output ws.csv
+"""
+
+import argparse
+import asyncio
+import base64
+import csv
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from urllib.parse import urlparse
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+SERVER_DIR = os.path.dirname(BENCHMARK_DIR)
+sys.path.insert(0, BENCHMARK_DIR)
+sys.path.insert(0, SERVER_DIR)
+
+from http_load import percentile
+from message_encoding import codec_for, decode_message
+from websocket_load import CONNECT_BATCH, mask_frame, process_cpu_seconds, read_frame
+
+MESSAGE_TYPES = ("register", "command", "llm")
+
+# Seconds to wait for a reply (a simulated LLM reply streams for a second or two)
+REPLY_TIMEOUT = 30
+
+LAUNCH_SCRIPT = """
+import sys
+sys.path.insert(0, {server_dir!r})
+from server import run_http_server, run_websocket_server
+run_websocket_server({port})
+run_http_server({directory!r}, {port})
+"""
+
+
+def parse_mix(spec):
+    """Parse "register=1,command=8,llm=1" into {type: weight}"""
+    mix = {}
+    for item in spec.split(","):
+        name, _, weight = item.partition("=")
+        name = name.strip()
+        if name not in MESSAGE_TYPES:
+            raise argparse.ArgumentTypeError(f"Unknown message type {name!r} (expected {', '.join(MESSAGE_TYPES)})")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def build_message(kind, client_id, n):
+    """The message a UI client sends for one message type"""
+    timestamp = time.strftime("%Y-%m-%dT%H:%M:%S")
+    if kind == "register":
+        return {"type": "REGISTER", "source": client_id, "target": "SYSTEM", "timestamp": timestamp,
+                "payload": {"clientId": client_id, "capabilities": ["UI", "USER_INTERACTION"]}}
+    if kind == "command":
+        return {"type": "COMMAND", "source": client_id, "target": "SERVER", "timestamp": timestamp,
+                "payload": {"command": f"status {n}"}}
+    return {"type": "LLM_REQUEST", "source": client_id, "target": "ergon", "timestamp": timestamp,
+            "payload": {"message": f"Question {n}: how do I create an agent?", "context": "ergon",
+                        "streaming": True}}
+
+
+def launch_server(port, directory):
+    """Start run_http_server in a subprocess and wait until it accepts connections"""
+    script = LAUNCH_SCRIPT.format(server_dir=SERVER_DIR, port=port, directory=directory)
+    process = subprocess.Popen([sys.executable, "-c", script],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 15
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited with status {process.returncode}")
+        try:
+            socket.create_connection(("localhost", port), timeout=0.5).close()
+            return process
+        except OSError:
+            time.sleep(0.1)
+    process.terminate()
+    raise RuntimeError(f"Server did not start listening on port {port}")
+
+
+class LoadClient:
+    """One simulated UI tab"""
+
+    def __init__(self, index, host, port, seed, subprotocol=None):
+        self.client_id = f"loadgen-{index}"
+        self.host = host
+        self.port = port
+        # Per-client generator: the sequence does not depend on scheduling
+        self.random = random.Random(f"{seed}:{index}")
+        self.subprotocol = subprotocol
+        self.codec = codec_for(subprotocol)
+        self.reader = None
+        self.writer = None
+        self.connect_ms = None
+
+    async def connect(self):
+        """Open the connection and wait for the welcome message"""
+        started = time.perf_counter()
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        key = base64.b64encode(os.urandom(16)).decode()
+        protocol = f"Sec-WebSocket-Protocol: {self.subprotocol}\r\n" if self.subprotocol else ""
+        self.writer.write((f"GET /ws HTTP/1.1\r\nHost: {self.host}:{self.port}\r\nUpgrade: websocket\r\n"
+                           f"Connection: Upgrade\r\nSec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n"
+                           f"{protocol}\r\n").encode())
+        status = await self.reader.readuntil(b"\r\n\r\n")
+        if b" 101 " not in status.split(b"\r\n", 1)[0]:
+            raise ConnectionError(status.split(b"\r\n", 1)[0].decode())
+        await self.receive()
+        self.connect_ms = (time.perf_counter() - started) * 1000
+
+    async def send(self, message):
+        self.writer.write(mask_frame(self.codec.opcode, self.codec.encode(message)))
+
+    async def receive(self):
+        opcode, payload = await read_frame(self.reader)
+        if opcode == 0x8:
+            raise ConnectionError("Server closed the connection")
+        if opcode == 0x1:
+            payload = payload.decode("utf-8")
+        return decode_message(self.codec, payload)
+
+    async def exchange(self, kind, n):
+        """Send one message and wait for its reply
+
+        Returns:
+            (latency ms, first LLM chunk ms or None)
+        """
+        started = time.perf_counter()
+        await self.send(build_message(kind, self.client_id, n))
+        first_chunk = None
+        while True:
+            reply = await self.receive()
+            payload = reply.get("payload") or {}
+            if kind != "llm":
+                if reply.get("type") == "RESPONSE":
+                    break
+            elif payload.get("chunk") and first_chunk is None:
+                first_chunk = (time.perf_counter() - started) * 1000
+            elif payload.get("isTyping") is False:
+                # The typing indicator ends every reply, after the done message
+                break
+        return (time.perf_counter() - started) * 1000, first_chunk
+
+    async def run(self, mix, rate, deadline, samples, errors):
+        """Send messages on a Poisson schedule until the deadline"""
+        kinds = list(mix)
+        weights = [mix[kind] for kind in kinds]
+        next_send = time.perf_counter() + self.random.expovariate(rate)
+        n = 0
+        while True:
+            delay = next_send - time.perf_counter()
+            if next_send >= deadline:
+                return
+            if delay > 0:
+                await asyncio.sleep(delay)
+            kind = self.random.choices(kinds, weights)[0]
+            n += 1
+            try:
+                latency, first_chunk = await asyncio.wait_for(self.exchange(kind, n), REPLY_TIMEOUT)
+            except (asyncio.TimeoutError, ConnectionError, asyncio.IncompleteReadError, ValueError):
+                errors[kind] = errors.get(kind, 0) + 1
+                return
+            samples.append((kind, latency, first_chunk, time.perf_counter()))
+            # Keep the schedule; a slow reply delays the next send, not the rate
+            next_send += self.random.expovariate(rate)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+async def run_load(args, host, port):
+    """Connect every client, run the message mix and collect the samples"""
+    clients = [LoadClient(i, host, port, args.seed, args.subprotocol) for i in range(args.clients)]
+    connect_failures = 0
+    connected = []
+    ramp_started = time.perf_counter()
+    for start in range(0, len(clients), CONNECT_BATCH):
+        batch = clients[start:start + CONNECT_BATCH]
+        results = await asyncio.gather(*(c.connect() for c in batch), return_exceptions=True)
+        for client, result in zip(batch, results):
+            if isinstance(result, Exception):
+                connect_failures += 1
+            else:
+                connected.append(client)
+        # Spread the batches over the ramp period
+        target = ramp_started + args.ramp * min(1.0, (start + len(batch)) / len(clients))
+        await asyncio.sleep(max(0.0, target - time.perf_counter()))
+
+    samples = []
+    errors = {}
+    cpu_before = process_cpu_seconds(args.server_pid)
+    started = time.perf_counter()
+    await asyncio.gather(*(c.run(args.mix, args.rate, started + args.duration, samples, errors)
+                           for c in connected))
+    elapsed = time.perf_counter() - started
+    cpu_after = process_cpu_seconds(args.server_pid)
+    for client in connected:
+        client.close()
+    await asyncio.sleep(0.2)
+
+    return summarise(args, clients, connected, connect_failures, samples, errors, elapsed,
+                     (cpu_after - cpu_before) / elapsed * 100 if cpu_before is not None else None)
+
+
+def summarise(args, clients, connected, connect_failures, samples, errors, elapsed, server_cpu):
+    """Build the result rows: connect times, then one row per message type"""
+    connect_ms = [c.connect_ms for c in connected]
+    rows = [{
+        "metric": "connect",
+        "count": len(connected),
+        "errors": connect_failures,
+        "per_sec": None,
+        "p50_ms": percentile(connect_ms, 50),
+        "p95_ms": percentile(connect_ms, 95),
+        "p99_ms": percentile(connect_ms, 99),
+        "max_ms": max(connect_ms) if connect_ms else 0.0,
+        "first_chunk_p50_ms": None,
+        "first_chunk_p99_ms": None,
+    }]
+    for kind in ["all"] + list(args.mix):
+        selected = [s for s in samples if kind == "all" or s[0] == kind]
+        latencies = [s[1] for s in selected]
+        first_chunks = [s[2] for s in selected if s[2] is not None]
+        rows.append({
+            "metric": kind,
+            "count": len(selected),
+            "errors": sum(errors.values()) if kind == "all" else errors.get(kind, 0),
+            "per_sec": len(selected) / elapsed if elapsed else 0.0,
+            "p50_ms": percentile(latencies, 50),
+            "p95_ms": percentile(latencies, 95),
+            "p99_ms": percentile(latencies, 99),
+            "max_ms": max(latencies) if latencies else 0.0,
+            "first_chunk_p50_ms": percentile(first_chunks, 50) if first_chunks else None,
+            "first_chunk_p99_ms": percentile(first_chunks, 99) if first_chunks else None,
+        })
+    return {
+        "config": {
+            "clients": args.clients,
+            "duration": args.duration,
+            "rate": args.rate,
+            "mix": args.mix,
+            "seed": args.seed,
+            "subprotocol": args.subprotocol,
+        },
+        "server_cpu_pct": server_cpu,
+        "elapsed_s": elapsed,
+        "results": rows,
+    }
+
+
+def write_output(summary, path):
+    """Write the summary as JSON, or its result rows as CSV for a .csv path"""
+    with open(path, "w", newline="") as f:
+        if path.endswith(".csv"):
+            writer = csv.DictWriter(f, fieldnames=list(summary["results"][0]))
+            writer.writeheader()
+            writer.writerows(summary["results"])
+        else:
+            json.dump(summary, f, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="/ws load generator")
+    parser.add_argument("--url", default="http://localhost:8080", help="Hephaestus server")
+    parser.add_argument("--launch", action="store_true",
+                        help="Start run_http_server on the --url port for the run")
+    parser.add_argument("--directory", default=os.path.dirname(SERVER_DIR),
+                        help="UI directory the launched server serves")
+    parser.add_argument("--clients", type=int, default=100, help="Concurrent WebSocket clients")
+    parser.add_argument("--ramp", type=float, default=2.0, help="Seconds over which clients connect")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds of message traffic")
+    parser.add_argument("--rate", type=float, default=1.0, help="Messages per second per client")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("register=1,command=8,llm=1"),
+                        help="Message type weights, e.g. register=1,command=8,llm=1")
+    parser.add_argument("--subprotocol", default=None, help="Request a binary encoding, e.g. tekton.msgpack")
+    parser.add_argument("--seed", type=int, default=1, help="Seed for message choice and timing")
+    parser.add_argument("--server-pid", type=int, default=None, help="Server process for CPU accounting")
+    parser.add_argument("--output", default=None, help="Write results to a .json or .csv file")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    target = urlparse(args.url)
+    host, port = target.hostname or "localhost", target.port or 80
+    server = None
+    if args.launch:
+        server = launch_server(port, args.directory)
+        if args.server_pid is None:
+            args.server_pid = server.pid
+    try:
+        summary = asyncio.run(run_load(args, host, port))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=10)
+
+    if args.output:
+        write_output(summary, args.output)
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return
+
+    cpu = f"{summary['server_cpu_pct']:.1f}%" if summary["server_cpu_pct"] is not None else "-"
+    print(f"{args.clients} clients, {args.duration:.0f}s at {args.rate}/s each, seed {args.seed}, "
+          f"server CPU {cpu}")
+    print(f"{'metric':>9} {'count':>7} {'errors':>7} {'per sec':>8} {'p50 ms':>8} {'p95 ms':>8} "
+          f"{'p99 ms':>8} {'max ms':>8} {'1st chunk p50':>14}")
+    for r in summary["results"]:
+        per_sec = f"{r['per_sec']:.1f}" if r["per_sec"] is not None else "-"
+        first = f"{r['first_chunk_p50_ms']:.1f}" if r["first_chunk_p50_ms"] is not None else "-"
+        print(f"{r['metric']:>9} {r['count']:>7} {r['errors']:>7} {per_sec:>8} {r['p50_ms']:>8.2f} "
+              f"{r['p95_ms']:>8.2f} {r['p99_ms']:>8.2f} {r['max_ms']:>8.2f} {first:>14}")
+
+
+if __name__ == "__main__":
+    main()
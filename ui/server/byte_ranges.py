@@ -0,0 +1,59 @@
+"""
+HTTP byte range parsing for the Tekton UI server (RFC 7233)
+"""
+
+# Requests asking for more ranges than this are answered with the full file;
+# legitimate clients (browsers, download managers, media players) ask for a few
+MAX_RANGES = 16
+
+
+def parse_byte_ranges(header, size):
+    """Parse a Range header against a resource of the given size
+
+    Args:
+        header: Value of the Range header, e.g. "bytes=0-499, -500"
+        size: Length of the resource in bytes
+
+    Returns:
+        None if the header is malformed or uses another unit (the Range
+        header must then be ignored and the whole file served), an empty
+        list if no range is satisfiable (416), or a list of inclusive
+        (start, end) byte positions in request order.
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or not spec.strip():
+        return None
+
+    ranges = []
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        first, dash, last = item.partition("-")
+        first, last = first.strip(), last.strip()
+        if not dash or not (first or last):
+            return None
+        if (first and not first.isdigit()) or (last and not last.isdigit()):
+            return None
+
+        if not first:
+            # Suffix range: the last N bytes
+            length = int(last)
+            if length == 0 or size == 0:
+                continue
+            start, end = max(0, size - length), size - 1
+        else:
+            start = int(first)
+            end = int(last) if last else size - 1
+            if last and end < start:
+                return None
+            if start >= size:
+                continue
+            end = min(end, size - 1)
+        if start > end:
+            continue
+        ranges.append((start, end))
+
+    if len(ranges) > MAX_RANGES:
+        return None
+    return ranges
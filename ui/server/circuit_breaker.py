@@ -0,0 +1,147 @@
+"""
+Circuit breakers for the Tekton UI server's API proxy backends
+
+When Ergon or Hermes is down every proxied call used to wait for a connect
+attempt to fail. A CircuitBreaker per backend counts consecutive transport
+failures; after failure_threshold of them it opens and proxied calls are
+answered with 503 immediately. After reset_timeout it lets a single probe
+request through (half-open): success closes the breaker, failure reopens it
+with the timeout doubled, up to max_reset_timeout.
+"""
+
+import os
+import threading
+import time
+
+DEFAULT_FAILURE_THRESHOLD = int(os.environ.get("HEPHAESTUS_BREAKER_FAILURES", "5"))
+DEFAULT_RESET_TIMEOUT = float(os.environ.get("HEPHAESTUS_BREAKER_RESET", "10"))
+DEFAULT_MAX_RESET_TIMEOUT = float(os.environ.get("HEPHAESTUS_BREAKER_MAX_RESET", "60"))
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class BackendUnavailable(Exception):
+    """Raised instead of contacting a backend whose breaker is open"""
+
+    def __init__(self, backend, retry_after):
+        super().__init__(f"{backend} is unavailable (circuit open, retry in {retry_after:.0f}s)")
+        self.backend = backend
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one backend"""
+
+    def __init__(self, name, failure_threshold=DEFAULT_FAILURE_THRESHOLD,
+                 reset_timeout=DEFAULT_RESET_TIMEOUT, max_reset_timeout=DEFAULT_MAX_RESET_TIMEOUT):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.base_reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.probe_in_flight = False
+        self._lock = threading.Lock()
+        self.successes = 0
+        self.failures = 0
+        self.rejected = 0
+        self.times_opened = 0
+
+    def allow(self):
+        """Whether a request may be sent to the backend now
+
+        Every allowed request must be followed by record_success(),
+        record_failure() or abandon().
+        """
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = HALF_OPEN
+            if self.state == HALF_OPEN and not self.probe_in_flight:
+                self.probe_in_flight = True
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self):
+        """The backend answered"""
+        with self._lock:
+            self.successes += 1
+            self.consecutive_failures = 0
+            self.probe_in_flight = False
+            if self.state != CLOSED:
+                self.state = CLOSED
+                self.reset_timeout = self.base_reset_timeout
+
+    def record_failure(self):
+        """The backend could not be reached or did not answer in time"""
+        with self._lock:
+            self.failures += 1
+            self.consecutive_failures += 1
+            if self.state == HALF_OPEN:
+                # The probe failed; back off before trying again
+                self.reset_timeout = min(self.reset_timeout * 2, self.max_reset_timeout)
+                self._open()
+            elif self.state == CLOSED and self.consecutive_failures >= self.failure_threshold:
+                self._open()
+
+    def abandon(self):
+        """An allowed request ended for reasons unrelated to the backend"""
+        with self._lock:
+            self.probe_in_flight = False
+
+    def _open(self):
+        self.state = OPEN
+        self.opened_at = time.monotonic()
+        self.probe_in_flight = False
+        self.times_opened += 1
+
+    def retry_after(self):
+        """Seconds until the next probe is allowed"""
+        with self._lock:
+            if self.state != OPEN:
+                return 0.0
+            return max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+
+    def stats(self):
+        """Return breaker state and counters for the ready endpoint"""
+        retry_after = self.retry_after()
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "failure_threshold": self.failure_threshold,
+                "reset_timeout": self.reset_timeout,
+                "retry_after": round(retry_after, 1),
+                "successes": self.successes,
+                "failures": self.failures,
+                "rejected": self.rejected,
+                "times_opened": self.times_opened,
+            }
+
+
+class CircuitBreakers:
+    """Circuit breakers keyed by backend name"""
+
+    def __init__(self, **options):
+        self.options = options
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def get(self, name):
+        """Return the breaker for a backend, creating it on first use"""
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(name, CircuitBreaker(name, **self.options))
+        return breaker
+
+    def stats(self):
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {breaker.name: breaker.stats() for breaker in breakers}
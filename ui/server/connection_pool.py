@@ -0,0 +1,264 @@
+"""
+Keep-alive connection pooling for the Tekton UI server's API proxy
+
+proxy_api_request used to open a new HTTPConnection to Ergon or Hermes for
+every proxied call. BackendPools keeps a small pool of idle keep-alive
+connections per backend (host, port) so consecutive calls reuse an
+established TCP connection instead of paying connect/teardown each time.
+"""
+
+import http.client
+import os
+import select
+import threading
+import time
+from collections import deque
+
+DEFAULT_POOL_SIZE = int(os.environ.get("HEPHAESTUS_PROXY_POOL_SIZE", "8"))
+DEFAULT_IDLE_TIMEOUT = float(os.environ.get("HEPHAESTUS_PROXY_IDLE_TIMEOUT", "30"))
+
+# Seconds to establish a backend connection; a dead backend must fail fast
+DEFAULT_CONNECT_TIMEOUT = float(os.environ.get("HEPHAESTUS_PROXY_CONNECT_TIMEOUT", "2"))
+
+# Methods that may be replayed on a fresh connection if a reused one turns
+# out to be dead; others are only retried when the request never left
+IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE"))
+
+# Errors raised when a pooled connection was closed by the backend
+STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError,
+                           BrokenPipeError, ConnectionAbortedError)
+
+
+class TimeoutHTTPConnection(http.client.HTTPConnection):
+    """HTTPConnection with separate connect and read timeouts"""
+
+    def __init__(self, host, port, connect_timeout=None, read_timeout=None):
+        super().__init__(host, port, timeout=connect_timeout)
+        self.read_timeout = read_timeout
+
+    def connect(self):
+        super().connect()
+        self.sock.settimeout(self.read_timeout)
+
+
+class PooledConnection:
+    """An HTTPConnection plus the bookkeeping the pool needs"""
+
+    __slots__ = ("connection", "created", "last_used", "requests")
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.created = time.monotonic()
+        self.last_used = self.created
+        self.requests = 0
+
+    def is_healthy(self):
+        """Check an idle connection has not been closed by the backend
+
+        An idle keep-alive socket should have nothing to read; if it polls
+        readable the backend either closed it (EOF) or sent something we
+        cannot interpret, so it must not be reused.
+        """
+        sock = self.connection.sock
+        if sock is None:
+            return False
+        try:
+            # poll() has no FD_SETSIZE limit; select() fails for fds >= 1024,
+            # which are common once /ws holds thousands of sockets
+            if hasattr(select, "poll"):
+                poller = select.poll()
+                poller.register(sock, select.POLLIN)
+                return not poller.poll(0)
+            readable, _, _ = select.select([sock], [], [], 0)
+        except (OSError, ValueError):
+            return False
+        return not readable
+
+    def close(self):
+        self.connection.close()
+
+
+class ConnectionPool:
+    """Thread-safe pool of keep-alive connections to one backend"""
+
+    def __init__(self, host, port, max_size=DEFAULT_POOL_SIZE, idle_timeout=DEFAULT_IDLE_TIMEOUT,
+                 connect_timeout=DEFAULT_CONNECT_TIMEOUT, read_timeout=None):
+        """
+        Args:
+            host: Backend host
+            port: Backend port
+            max_size: Idle connections kept for reuse; 0 disables pooling
+            idle_timeout: Seconds an idle connection may sit in the pool
+            connect_timeout: Seconds to establish a connection (None blocks)
+            read_timeout: Seconds to wait for each read from the backend (None blocks)
+        """
+        self.host = host
+        self.port = port
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self._idle = deque()
+        self._lock = threading.Lock()
+        self.in_use = 0
+        self.created = 0
+        self.reused = 0
+        self.evicted_idle = 0
+        self.evicted_unhealthy = 0
+        self.discarded = 0
+        self.retries = 0
+
+    def acquire(self):
+        """Take a healthy idle connection, or open a new one
+
+        Returns:
+            (PooledConnection, reused) tuple
+        """
+        now = time.monotonic()
+        stale = []
+        pooled = None
+        with self._lock:
+            while self._idle:
+                candidate = self._idle.pop()
+                if now - candidate.last_used > self.idle_timeout:
+                    self.evicted_idle += 1
+                    stale.append(candidate)
+                elif not candidate.is_healthy():
+                    self.evicted_unhealthy += 1
+                    stale.append(candidate)
+                else:
+                    pooled = candidate
+                    self.reused += 1
+                    break
+            if pooled is None:
+                self.created += 1
+            self.in_use += 1
+
+        for candidate in stale:
+            candidate.close()
+        if pooled is not None:
+            return pooled, True
+        return self._new_connection(), False
+
+    def _new_connection(self):
+        connection = TimeoutHTTPConnection(self.host, self.port, connect_timeout=self.connect_timeout,
+                                           read_timeout=self.read_timeout)
+        return PooledConnection(connection)
+
+    def release(self, pooled, reusable=True):
+        """Return a connection after its response was fully read
+
+        Args:
+            pooled: Connection from acquire()
+            reusable: False if the response asked to close or an error occurred
+        """
+        pooled.last_used = time.monotonic()
+        pooled.requests += 1
+        with self._lock:
+            self.in_use -= 1
+            if reusable and pooled.connection.sock is not None and len(self._idle) < self.max_size:
+                self._idle.append(pooled)
+                return
+            if reusable:
+                self.discarded += 1
+        pooled.close()
+
+    def request(self, method, path, body=None, headers=None):
+        """Send a request over a pooled connection
+
+        A reused connection the backend has already closed is retried once on
+        a new connection, for idempotent methods or when sending failed.
+        Streamed (iterator) bodies cannot be replayed and are never retried.
+
+        Returns:
+            (PooledConnection, HTTPResponse); read the response fully, then
+            call release(pooled, not response.will_close)
+        """
+        pooled, reused = self.acquire()
+        replayable = body is None or isinstance(body, (bytes, bytearray, str))
+        sent = False
+        try:
+            pooled.connection.request(method, path, body=body, headers=headers or {})
+            sent = True
+            return pooled, pooled.connection.getresponse()
+        except STALE_CONNECTION_ERRORS:
+            self.release(pooled, reusable=False)
+            if not reused or not replayable or (sent and method not in IDEMPOTENT_METHODS):
+                raise
+        except Exception:
+            self.release(pooled, reusable=False)
+            raise
+
+        # The backend closed the reused connection under us; replay on a new one
+        with self._lock:
+            self.retries += 1
+            self.created += 1
+            self.in_use += 1
+        pooled = self._new_connection()
+        try:
+            pooled.connection.request(method, path, body=body, headers=headers or {})
+            return pooled, pooled.connection.getresponse()
+        except Exception:
+            self.release(pooled, reusable=False)
+            raise
+
+    def close(self):
+        """Close all idle connections"""
+        with self._lock:
+            idle, self._idle = list(self._idle), deque()
+        for pooled in idle:
+            pooled.close()
+
+    def stats(self):
+        """Return pool counters for the health endpoint"""
+        with self._lock:
+            return {
+                "idle": len(self._idle),
+                "in_use": self.in_use,
+                "max_size": self.max_size,
+                "created": self.created,
+                "reused": self.reused,
+                "evicted_idle": self.evicted_idle,
+                "evicted_unhealthy": self.evicted_unhealthy,
+                "discarded": self.discarded,
+                "retries": self.retries,
+            }
+
+
+class BackendPools:
+    """Connection pools keyed by backend (host, port)"""
+
+    def __init__(self, max_size=DEFAULT_POOL_SIZE, idle_timeout=DEFAULT_IDLE_TIMEOUT):
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self._pools = {}
+        self._lock = threading.Lock()
+
+    def get(self, host, port, connect_timeout=DEFAULT_CONNECT_TIMEOUT, read_timeout=None):
+        """Return the pool for a backend, creating it on first use
+
+        The timeouts only apply when the pool is created.
+        """
+        key = (host, port)
+        pool = self._pools.get(key)
+        if pool is None:
+            with self._lock:
+                pool = self._pools.get(key)
+                if pool is None:
+                    pool = ConnectionPool(host, port, max_size=self.max_size, idle_timeout=self.idle_timeout,
+                                          connect_timeout=connect_timeout, read_timeout=read_timeout)
+                    self._pools[key] = pool
+        return pool
+
+    def close(self):
+        """Close idle connections in every pool"""
+        with self._lock:
+            pools = list(self._pools.values())
+        for pool in pools:
+            pool.close()
+
+    def stats(self):
+        """Return per-backend pool counters keyed by "host:port" """
+        with self._lock:
+            pools = list(self._pools.values())
+        return {f"{pool.host}:{pool.port}": pool.stats() for pool in pools}
@@ -0,0 +1,111 @@
+"""
+Responsive image variant selection for the Tekton UI server
+
+`python -m hephaestus.assets images` writes resized and recompressed copies
+of ui/images to ui/images/optimized together with a manifest. For a request
+such as /images/Tekton.png?w=128 the server picks the smallest variant at
+least as wide as requested, in WebP when the browser's Accept header allows
+it. Variants are ignored once the source image changes on disk.
+"""
+
+import json
+import os
+import threading
+
+MANIFEST_PATH = os.path.join("optimized", "manifest.json")
+
+# Widths beyond this are treated as "full size"
+MAX_REQUESTED_WIDTH = 8192
+
+
+def parse_width(query):
+    """Return the ?w= width from a parsed query string dict, or None"""
+    values = query.get("w")
+    if not values:
+        return None
+    try:
+        width = int(values[0])
+    except ValueError:
+        return None
+    return min(width, MAX_REQUESTED_WIDTH) if width > 0 else None
+
+
+def accepts_type(accept, content_type):
+    """Whether an Accept header explicitly lists a content type with q > 0"""
+    for item in (accept or "").split(","):
+        media_type, _, params = item.strip().partition(";")
+        if media_type.strip().lower() != content_type:
+            continue
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    return float(value) > 0
+                except ValueError:
+                    return False
+        return True
+    return False
+
+
+class ImageVariants:
+    """Reads images/optimized/manifest.json and selects variants per request"""
+
+    def __init__(self, images_dir):
+        self.images_dir = os.path.abspath(images_dir)
+        self.path = os.path.join(self.images_dir, MANIFEST_PATH)
+        self._lock = threading.Lock()
+        self._mtime_ns = None
+        self._images = {}
+
+    def _load(self):
+        """Return the manifest, re-reading the file when it changes"""
+        try:
+            mtime_ns = os.stat(self.path).st_mtime_ns
+        except OSError:
+            return {}
+
+        with self._lock:
+            if mtime_ns != self._mtime_ns:
+                try:
+                    with open(self.path, 'r', encoding='utf-8') as f:
+                        self._images = json.load(f)
+                except (OSError, ValueError):
+                    self._images = {}
+                self._mtime_ns = mtime_ns
+            return self._images
+
+    def select(self, name, accept=None, width=None):
+        """Pick the variant to serve for an image request
+
+        Args:
+            name: Image filename relative to the images directory
+            accept: Value of the request's Accept header
+            width: Requested display width in pixels, or None for full size
+
+        Returns:
+            Absolute path of the chosen variant, or None to serve the original
+        """
+        entry = self._load().get(name)
+        if entry is None:
+            return None
+        try:
+            stat_result = os.stat(os.path.join(self.images_dir, name))
+        except OSError:
+            return None
+        if [stat_result.st_size, stat_result.st_mtime_ns] != entry.get("source"):
+            return None
+
+        webp = accepts_type(accept, "image/webp")
+        candidates = [v for v in entry.get("variants", []) if webp or v["type"] != "image/webp"]
+        if not candidates:
+            return None
+
+        # Narrowest width that still covers the request; full size otherwise
+        target = entry.get("width", 0) if width is None else min(width, entry.get("width", width))
+        wide_enough = [v for v in candidates if v["width"] >= target]
+        if not wide_enough:
+            # No recompression at this size beats the original; send it as is
+            return None
+        chosen_width = min(v["width"] for v in wide_enough)
+        best = min((v for v in candidates if v["width"] == chosen_width), key=lambda v: v["bytes"])
+        return os.path.join(self.images_dir, best["file"])
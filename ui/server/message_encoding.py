@@ -0,0 +1,88 @@
+"""
+Message encodings for /ws, negotiated as WebSocket subprotocols
+
+JSON text frames stay the default. A client that lists tekton.msgpack (or
+tekton.cbor) in Sec-WebSocket-Protocol gets the same message objects as
+binary MessagePack (or CBOR) frames instead, which are smaller and faster
+to encode and decode at high message rates. A subprotocol is only offered
+when its library is installed:
+
+    pip install msgpack     # tekton.msgpack
+    pip install cbor2       # tekton.cbor
+
+Whatever was negotiated, text frames from a client are still read as JSON.
+"""
+
+import json
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:
+    cbor2 = None
+
+from websocket_frames import OP_BINARY, OP_TEXT
+
+
+class MessageCodec:
+    """Encodes message objects as the payload of one frame type"""
+
+    def __init__(self, name, opcode, dumps, loads):
+        self.name = name
+        self.opcode = opcode
+        self._dumps = dumps
+        self._loads = loads
+
+    def encode(self, message):
+        """Return the frame payload (bytes) for a message object"""
+        return self._dumps(message)
+
+    def decode(self, payload):
+        """Return the message object in a frame payload"""
+        return self._loads(payload)
+
+    def __repr__(self):
+        return f"MessageCodec({self.name or 'json'})"
+
+
+def _json_dumps(message):
+    return json.dumps(message).encode("utf-8")
+
+
+JSON_CODEC = MessageCodec(None, OP_TEXT, _json_dumps, json.loads)
+
+# Subprotocol name -> codec, for the encodings whose library is installed
+CODECS = {}
+if msgpack is not None:
+    CODECS["tekton.msgpack"] = MessageCodec("tekton.msgpack", OP_BINARY, msgpack.packb, msgpack.unpackb)
+if cbor2 is not None:
+    CODECS["tekton.cbor"] = MessageCodec("tekton.cbor", OP_BINARY, cbor2.dumps, cbor2.loads)
+
+
+def codec_for(protocol):
+    """Return the codec for a negotiated subprotocol (JSON if None)"""
+    return CODECS.get(protocol, JSON_CODEC)
+
+
+def negotiate_subprotocol(header):
+    """Pick the first subprotocol in a Sec-WebSocket-Protocol header we speak
+
+    Returns:
+        The subprotocol name to echo back, or None to use JSON
+    """
+    for protocol in (header or "").split(","):
+        protocol = protocol.strip()
+        if protocol in CODECS:
+            return protocol
+    return None
+
+
+def decode_message(codec, message):
+    """Decode a received message: str as JSON, bytes with the connection's codec"""
+    if isinstance(message, str):
+        return json.loads(message)
+    return codec.decode(message)
@@ -0,0 +1,63 @@
+"""
+Precompressed variant lookup for the Tekton UI server
+
+`python -m hephaestus.assets precompress` writes .gz/.br siblings of the
+UI's text assets together with precompressed.json, which records the size
+and mtime of each source and the size of every variant it produced. A
+variant is only served while its source still has exactly the recorded size
+and mtime, so an edited file, or one restored with an older mtime, never
+serves the bytes of a previous version.
+"""
+
+import json
+import os
+import threading
+
+MANIFEST_PATH = "precompressed.json"
+
+
+class PrecompressedVariants:
+    """Reads precompressed.json and reports the current variants of a file"""
+
+    def __init__(self, directory):
+        self.directory = os.path.abspath(directory)
+        self.path = os.path.join(self.directory, MANIFEST_PATH)
+        self._lock = threading.Lock()
+        self._mtime_ns = None
+        self._files = {}
+
+    def _load(self):
+        """Return the manifest, re-reading the file when it changes"""
+        try:
+            mtime_ns = os.stat(self.path).st_mtime_ns
+        except OSError:
+            return {}
+
+        with self._lock:
+            if mtime_ns != self._mtime_ns:
+                try:
+                    with open(self.path, 'r', encoding='utf-8') as f:
+                        self._files = json.load(f)
+                except (OSError, ValueError):
+                    self._files = {}
+                self._mtime_ns = mtime_ns
+            return self._files
+
+    def variants(self, file_path, size, mtime_ns):
+        """Return the variants built from this exact version of a file
+
+        Args:
+            file_path: Absolute path of the source file
+            size: Current size of the source
+            mtime_ns: Current mtime of the source in nanoseconds
+
+        Returns:
+            Mapping of variant suffix (".gz", ".br") to the variant's size,
+            empty if the manifest has no entry for this size and mtime
+        """
+        relative = os.path.relpath(os.path.abspath(file_path), self.directory).replace(os.sep, "/")
+        entry = self._load().get(relative)
+        if entry is None or entry.get("source") != [size, mtime_ns]:
+            return {}
+        return {suffix: variant_size for suffix, variant_size in entry.get("variants", {}).items()
+                if variant_size is not None}
@@ -0,0 +1,189 @@
+"""
+Streaming helpers for the Tekton UI server's API proxy
+
+Request and response bodies are relayed in bounded pieces instead of being
+read into memory whole, so streamed LLM output from /api/terminal/* reaches
+the browser as Ergon produces it. Chunked request bodies are decoded on the
+way in and re-chunked by http.client on the way to the backend; chunked or
+close-delimited backend responses are re-chunked for HTTP/1.1 clients.
+"""
+
+import threading
+import time
+from collections import deque
+
+# Largest piece of a body held in memory at once
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Request bodies up to this size are read whole so a dead pooled connection
+# can replay them; larger or chunked bodies are streamed
+BUFFERED_BODY_LIMIT = 64 * 1024
+
+# Longest chunk-size or trailer line accepted from a client
+MAX_LINE = 8192
+
+# Number of recent requests kept for time-to-first-byte percentiles
+TIMING_WINDOW = 1024
+
+
+class ChunkedBodyError(ValueError):
+    """Raised for a malformed chunked request body"""
+
+
+class ClientBodyError(Exception):
+    """Raised when the client stops sending a streamed request body
+
+    Deliberately not an OSError: the body is read while it is being sent to
+    the backend, and a client that disconnects or stalls mid-upload must not
+    count as a failure of that backend.
+    """
+
+
+def _read_line(rfile):
+    line = rfile.readline(MAX_LINE + 1)
+    if len(line) > MAX_LINE:
+        raise ChunkedBodyError("Chunk header line too long")
+    if not line:
+        raise ChunkedBodyError("Connection closed inside chunked body")
+    return line
+
+
+def iter_chunked_body(rfile, chunk_size=STREAM_CHUNK_SIZE):
+    """Decode a chunked request body, yielding at most chunk_size bytes at a time"""
+    while True:
+        size_field = _read_line(rfile).split(b";", 1)[0].strip()
+        try:
+            size = int(size_field, 16)
+        except ValueError:
+            raise ChunkedBodyError(f"Invalid chunk size {size_field!r}")
+        if size == 0:
+            break
+        remaining = size
+        while remaining:
+            data = rfile.read(min(remaining, chunk_size))
+            if not data:
+                raise ChunkedBodyError("Connection closed inside chunk")
+            remaining -= len(data)
+            yield data
+        _read_line(rfile)  # CRLF after the chunk data
+
+    # Trailer fields are dropped; they end with an empty line
+    while _read_line(rfile) not in (b"\r\n", b"\n"):
+        pass
+
+
+def iter_sized_body(rfile, length, chunk_size=STREAM_CHUNK_SIZE):
+    """Yield a Content-Length delimited body in bounded pieces"""
+    remaining = length
+    while remaining > 0:
+        data = rfile.read(min(remaining, chunk_size))
+        if not data:
+            raise ClientBodyError("Client closed the connection inside the request body")
+        remaining -= len(data)
+        yield data
+
+
+def _from_client(chunks):
+    """Re-raise socket errors reading a client's body as ClientBodyError"""
+    try:
+        yield from chunks
+    except OSError as e:
+        raise ClientBodyError(f"Error reading the request body from the client: {e}") from e
+
+
+def request_body(rfile, headers):
+    """Return the body to forward for a proxied request
+
+    Returns:
+        (body, length): body is None, bytes for small bodies, or an iterator
+        of bytes; length is the Content-Length to send, or None when the
+        body is sent chunked
+    """
+    if "chunked" in headers.get("Transfer-Encoding", "").lower():
+        return _from_client(iter_chunked_body(rfile)), None
+
+    length = int(headers.get("Content-Length", 0) or 0)
+    if length <= 0:
+        return None, None
+    if length <= BUFFERED_BODY_LIMIT:
+        return rfile.read(length), length
+    return _from_client(iter_sized_body(rfile, length)), length
+
+
+def relay_body(response, write, chunked, chunk_size=STREAM_CHUNK_SIZE):
+    """Copy a backend response body to the client as it arrives
+
+    Args:
+        response: http.client.HTTPResponse whose headers were already read
+        write: Callable writing bytes to the client
+        chunked: Re-encode the body with chunked transfer coding
+        chunk_size: Largest piece read from the backend at once
+
+    Returns:
+        (bytes relayed, perf_counter time of the first body byte or None)
+    """
+    total = 0
+    first_byte = None
+    while True:
+        data = response.read1(chunk_size)
+        if not data:
+            break
+        if first_byte is None:
+            first_byte = time.perf_counter()
+        if chunked:
+            write(b"%x\r\n%b\r\n" % (len(data), data))
+        else:
+            write(data)
+        total += len(data)
+    if chunked:
+        write(b"0\r\n\r\n")
+    return total, first_byte
+
+
+class ProxyTimings:
+    """Rolling time-to-first-byte statistics for proxied requests"""
+
+    def __init__(self, window=TIMING_WINDOW):
+        self._lock = threading.Lock()
+        self._headers_ms = deque(maxlen=window)
+        self._first_byte_ms = deque(maxlen=window)
+        self.requests = 0
+        self.streamed = 0
+        self.bytes = 0
+
+    def record(self, headers_ms, first_byte_ms, size, streamed):
+        """Record one proxied request
+
+        Args:
+            headers_ms: Time until the backend's response headers arrived
+            first_byte_ms: Time until the first body byte arrived, or None
+            size: Body bytes relayed
+            streamed: Whether the body was relayed without a known length
+        """
+        with self._lock:
+            self.requests += 1
+            self.bytes += size
+            if streamed:
+                self.streamed += 1
+            self._headers_ms.append(headers_ms)
+            if first_byte_ms is not None:
+                self._first_byte_ms.append(first_byte_ms)
+
+    @staticmethod
+    def _percentile(samples, pct):
+        if not samples:
+            return 0.0
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(pct / 100.0 * len(ordered)))]
+
+    def stats(self):
+        """Return counters and TTFB percentiles for the health endpoint"""
+        with self._lock:
+            headers_ms = list(self._headers_ms)
+            first_byte_ms = list(self._first_byte_ms)
+            result = {"requests": self.requests, "streamed": self.streamed, "bytes": self.bytes}
+        result["ttfb_headers_ms"] = {"p50": round(self._percentile(headers_ms, 50), 2),
+                                     "p99": round(self._percentile(headers_ms, 99), 2)}
+        result["ttfb_body_ms"] = {"p50": round(self._percentile(first_byte_ms, 50), 2),
+                                  "p99": round(self._percentile(first_byte_ms, 99), 2)}
+        return result
@@ -0,0 +1,263 @@
+"""
+Short-TTL response cache with request coalescing for proxied API GETs
+
+UI panels in every open tab poll Hermes routes such as /api/components and
+/api/status. ResponseCache keeps successful responses for a few seconds per
+configured route (never longer than the backend's Cache-Control allows) and
+coalesces concurrent identical requests so only one reaches the backend
+while the others wait for its answer.
+
+Responses are only shared when they are the same for every client: the
+server never routes requests carrying credentials (Cookie, Authorization)
+through the cache, and a response that sets a cookie, is marked private or
+no-store, or varies on anything but Accept-Encoding is neither stored nor
+handed to coalesced requests, which then ask the backend themselves.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+
+# Route prefix -> TTL seconds, e.g. "/api/components=2,/api/status=1"
+DEFAULT_ROUTES = os.environ.get("HEPHAESTUS_PROXY_CACHE_ROUTES", "/api/components=2,/api/status=1")
+DEFAULT_MAX_ENTRIES = int(os.environ.get("HEPHAESTUS_PROXY_CACHE_ENTRIES", "256"))
+
+# Larger responses are passed through but not stored
+MAX_BODY_BYTES = 1024 * 1024
+
+# Requests carrying these get a response of their own, never a shared one
+CREDENTIAL_HEADERS = ("Authorization", "Cookie")
+
+
+def parse_routes(spec):
+    """Parse "prefix=ttl,prefix=ttl" into a {prefix: ttl} dict"""
+    routes = {}
+    for item in (spec or "").split(","):
+        prefix, _, ttl = item.strip().partition("=")
+        if not prefix:
+            continue
+        try:
+            routes[prefix.strip()] = float(ttl)
+        except ValueError:
+            raise ValueError(f"Invalid proxy cache route {item!r}, expected PREFIX=SECONDS")
+    return routes
+
+
+def parse_cache_control(value):
+    """Parse a Cache-Control header into a {directive: value-or-None} dict"""
+    directives = {}
+    for item in (value or "").split(","):
+        name, _, argument = item.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip('"') if argument else None
+    return directives
+
+
+def has_credentials(headers):
+    """Whether a request carries credentials that may personalize the response"""
+    return any(headers.get(name) is not None for name in CREDENTIAL_HEADERS)
+
+
+def shareable(response):
+    """Whether a backend response may be given to clients other than the requester"""
+    if response.header("set-cookie") is not None:
+        return False
+    if {"private", "no-store"} & set(parse_cache_control(response.header("cache-control"))):
+        return False
+    vary = set()
+    for header, value in response.headers:
+        if header.lower() == "vary":
+            vary.update(field.strip().lower() for field in value.split(",") if field.strip())
+    return vary <= {"accept-encoding"}
+
+
+def backend_ttl(cache_control, route_ttl):
+    """Return how long a backend response may be cached, capped at route_ttl"""
+    directives = parse_cache_control(cache_control)
+    if {"no-store", "no-cache", "private"} & set(directives):
+        return 0
+    for name in ("s-maxage", "max-age"):
+        if directives.get(name) is not None:
+            try:
+                return min(route_ttl, max(0, int(directives[name])))
+            except ValueError:
+                return 0
+    return route_ttl
+
+
+class CachedResponse:
+    """A fully read backend response"""
+
+    __slots__ = ("status", "headers", "body", "stored", "expires")
+
+    def __init__(self, status, headers, body):
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.stored = time.monotonic()
+        self.expires = self.stored
+
+    def header(self, name):
+        for header, value in self.headers:
+            if header.lower() == name:
+                return value
+        return None
+
+    def age(self):
+        return int(time.monotonic() - self.stored)
+
+
+class _Flight:
+    """A backend request in progress that identical requests wait on"""
+
+    __slots__ = ("done", "response", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.response = None
+        self.error = None
+
+
+class RouteCounters:
+    __slots__ = ("hits", "misses", "coalesced", "stored", "bypassed")
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.stored = 0
+        self.bypassed = 0
+
+
+class ResponseCache:
+    """Per-route micro-cache with single-flight coalescing"""
+
+    def __init__(self, routes=None, max_entries=DEFAULT_MAX_ENTRIES):
+        """
+        Args:
+            routes: {path prefix: TTL seconds}; defaults to DEFAULT_ROUTES
+            max_entries: Cached responses kept across all routes (LRU)
+        """
+        self.routes = parse_routes(DEFAULT_ROUTES) if routes is None else dict(routes)
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._flights = {}
+        self._lock = threading.Lock()
+        self._counters = {prefix: RouteCounters() for prefix in self.routes}
+        self.evictions = 0
+
+    def route_for(self, path):
+        """Return the longest configured route prefix matching a path, or None"""
+        path = path.split("?", 1)[0]
+        matches = [prefix for prefix in self.routes if path.startswith(prefix)]
+        return max(matches, key=len) if matches else None
+
+    def fetch(self, route, key, load, bypass=False):
+        """Return a response for key from the cache, an in-flight request or load()
+
+        Args:
+            route: Route prefix from route_for()
+            key: Hashable identity of the request
+            load: Callable returning a CachedResponse from the backend
+            bypass: Skip the cache (the client sent Cache-Control: no-cache)
+
+        Returns:
+            (CachedResponse, outcome) where outcome is "HIT", "MISS",
+            "COALESCED" or "BYPASS"
+        """
+        counters = self._counters[route]
+        if bypass:
+            with self._lock:
+                counters.bypassed += 1
+            return load(), "BYPASS"
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires > time.monotonic():
+                self._entries.move_to_end(key)
+                counters.hits += 1
+                return entry, "HIT"
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                counters.misses += 1
+            else:
+                counters.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            if not shareable(flight.response):
+                # Meant for the leader's client only; fetch our own copy
+                with self._lock:
+                    counters.coalesced -= 1
+                    counters.misses += 1
+                return load(), "MISS"
+            return flight.response, "COALESCED"
+
+        try:
+            response = load()
+            flight.response = response
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+                if flight.response is not None:
+                    self._store(route, key, flight.response, counters)
+            flight.done.set()
+        return response, "MISS"
+
+    def _store(self, route, key, response, counters):
+        """Keep a response if it is cacheable; called with the lock held"""
+        if response.status != 200 or len(response.body) > MAX_BODY_BYTES:
+            return
+        if not shareable(response):
+            return
+        ttl = backend_ttl(response.header("cache-control"), self.routes[route])
+        if ttl <= 0:
+            return
+        response.expires = response.stored + ttl
+        self._entries[key] = response
+        self._entries.move_to_end(key)
+        counters.stored += 1
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, predicate=None):
+        """Drop cached entries whose key matches predicate (all if None)"""
+        with self._lock:
+            for key in [k for k in self._entries if predicate is None or predicate(k)]:
+                del self._entries[key]
+
+    def stats(self):
+        """Return per-route counters and hit ratios for the stats endpoint"""
+        with self._lock:
+            routes = {}
+            total_served = total_requests = 0
+            for prefix, c in self._counters.items():
+                requests = c.hits + c.misses + c.coalesced + c.bypassed
+                served = c.hits + c.coalesced
+                total_served += served
+                total_requests += requests
+                routes[prefix] = {
+                    "ttl": self.routes[prefix],
+                    "hits": c.hits,
+                    "misses": c.misses,
+                    "coalesced": c.coalesced,
+                    "bypassed": c.bypassed,
+                    "stored": c.stored,
+                    "hit_ratio": round(served / requests, 4) if requests else 0.0,
+                }
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "evictions": self.evictions,
+                "hit_ratio": round(total_served / total_requests, 4) if total_requests else 0.0,
+                "routes": routes,
+            }
@@ -0,0 +1,186 @@
+"""
+Route registry for the Tekton UI server's request dispatch
+
+do_GET and do_POST used to walk a chain of startswith checks, and
+proxy_api_request repeated its own chain to choose a backend. A RouteTable
+maps method + path to a Route (handler name, and for proxied API routes the
+backend and path rewrite) with one match of a compiled regex per method.
+Prefix routes are tried longest first, so the most specific route wins.
+
+Each route keeps request counters and recent latencies for the stats
+endpoint.
+"""
+
+import os
+import re
+import threading
+from collections import deque
+
+# Extra proxied API routes as "PREFIX=BACKEND[:REWRITE],...", added to those
+# from GlobalConfig (config.hephaestus.proxy_routes) and the built-in ones
+DEFAULT_PROXY_ROUTES = os.environ.get("HEPHAESTUS_PROXY_ROUTES", "")
+
+# Number of recent requests per route kept for latency percentiles
+LATENCY_WINDOW = 256
+
+
+def parse_proxy_routes(spec):
+    """Parse proxied route config into a {prefix: (backend, rewrite)} dict
+
+    Args:
+        spec: "PREFIX=BACKEND[:REWRITE],..." or a dict mapping a prefix to a
+            backend name or to {"backend": name, "rewrite": prefix}
+
+    Returns:
+        {prefix: (backend, rewrite or None)}
+
+    Raises:
+        ValueError: An entry names no backend or is not in either form
+    """
+    routes = {}
+    if isinstance(spec, dict):
+        for prefix, target in spec.items():
+            if isinstance(target, dict) and isinstance(target.get("backend"), str) and target["backend"]:
+                routes[prefix] = (target["backend"], target.get("rewrite"))
+            elif isinstance(target, str) and target:
+                routes[prefix] = (target, None)
+            else:
+                raise ValueError(f"Invalid proxy route {prefix!r}: {target!r}, expected a backend name "
+                                 f"or {{'backend': NAME, 'rewrite': PREFIX}}")
+        return routes
+    if not isinstance(spec, (str, type(None))):
+        raise ValueError(f"Invalid proxy routes {spec!r}, expected a dict or PREFIX=BACKEND[:REWRITE],...")
+    for item in (spec or "").split(","):
+        prefix, _, target = item.strip().partition("=")
+        if not prefix:
+            continue
+        backend, _, rewrite = target.partition(":")
+        if not backend:
+            raise ValueError(f"Invalid proxy route {item!r}, expected PREFIX=BACKEND[:REWRITE]")
+        routes[prefix.strip()] = (backend.strip(), rewrite.strip() or None)
+    return routes
+
+
+class Route:
+    """A handler registered for a path prefix or an exact path"""
+
+    __slots__ = ("name", "path", "methods", "handler", "exact", "pass_method", "backend", "rewrite",
+                 "requests", "total_ms", "max_ms", "_latencies")
+
+    def __init__(self, path, handler, methods, exact=False, pass_method=False, backend=None, rewrite=None,
+                 name=None):
+        self.name = name or path
+        self.path = path
+        self.methods = tuple(methods)
+        self.handler = handler
+        self.exact = exact
+        self.pass_method = pass_method
+        self.backend = backend
+        self.rewrite = rewrite
+        self.requests = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self._latencies = deque(maxlen=LATENCY_WINDOW)
+
+    def target_path(self, path):
+        """Return the backend path for a proxied request path"""
+        if self.rewrite is None:
+            return path
+        return self.rewrite + path[len(self.path):]
+
+
+class RouteTable:
+    """Declarative method + path -> Route registry"""
+
+    def __init__(self):
+        self._routes = []
+        self._compiled = {}
+        self._lock = threading.Lock()
+
+    def add(self, path, handler, methods=("GET",), exact=False, pass_method=False, backend=None,
+            rewrite=None, name=None):
+        """Register a route
+
+        Args:
+            path: Path prefix, or the whole path (before any query) if exact
+            handler: Name of the request handler method to call
+            methods: HTTP methods the route answers
+            exact: Match the path exactly instead of as a prefix
+            pass_method: Call the handler with the HTTP method as its argument
+            backend: Backend name for proxied API routes
+            rewrite: Replacement for the matched prefix in the backend path
+            name: Name reported in stats (defaults to path)
+
+        Returns:
+            The new Route
+        """
+        route = Route(path, handler, methods, exact, pass_method, backend, rewrite, name)
+        # Replace an earlier registration of the same path, so config can
+        # redirect a built-in route
+        self._routes = [r for r in self._routes if (r.path, r.exact) != (path, exact)] + [route]
+        self._compiled = {}
+        return route
+
+    def _compile(self, method):
+        routes = [r for r in self._routes if method in r.methods]
+        # Longest first; an exact route wins over a prefix of the same length
+        routes.sort(key=lambda r: (len(r.path), r.exact), reverse=True)
+        patterns = []
+        for index, route in enumerate(routes):
+            pattern = re.escape(route.path) + (r"(?=[?#]|$)" if route.exact else "")
+            patterns.append(f"(?P<r{index}>{pattern})")
+        regex = re.compile("|".join(patterns)) if patterns else None
+        compiled = (regex, {f"r{index}": route for index, route in enumerate(routes)})
+        with self._lock:
+            self._compiled[method] = compiled
+        return compiled
+
+    def match(self, method, path):
+        """Return the Route for a request, or None"""
+        compiled = self._compiled.get(method)
+        if compiled is None:
+            compiled = self._compile(method)
+        regex, routes = compiled
+        if regex is None:
+            return None
+        found = regex.match(path)
+        return routes[found.lastgroup] if found else None
+
+    def backends(self):
+        """Return the backend names used by proxied routes"""
+        return sorted({r.backend for r in self._routes if r.backend is not None})
+
+    def record(self, route, elapsed_ms):
+        """Record one request handled by a route"""
+        with self._lock:
+            route.requests += 1
+            route.total_ms += elapsed_ms
+            if elapsed_ms > route.max_ms:
+                route.max_ms = elapsed_ms
+            route._latencies.append(elapsed_ms)
+
+    @staticmethod
+    def _percentile(samples, pct):
+        if not samples:
+            return 0.0
+        return samples[min(len(samples) - 1, int(pct / 100.0 * len(samples)))]
+
+    def stats(self):
+        """Return per-route counters and latency percentiles for the stats endpoint"""
+        with self._lock:
+            snapshot = [(r, r.requests, r.total_ms, r.max_ms, sorted(r._latencies)) for r in self._routes]
+        result = {}
+        for route, requests, total_ms, max_ms, latencies in snapshot:
+            if not requests:
+                continue
+            entry = {
+                "requests": requests,
+                "mean_ms": round(total_ms / requests, 2),
+                "p50_ms": round(self._percentile(latencies, 50), 2),
+                "p99_ms": round(self._percentile(latencies, 99), 2),
+                "max_ms": round(max_ms, 2),
+            }
+            if route.backend is not None:
+                entry["backend"] = route.backend
+            result[route.name] = entry
+        return result
@@ -10,6 +10,7 @@ import json
 import argparse
 import time
 from http.server import HTTPServer, SimpleHTTPRequestHandler
+import socket
 import socketserver
 import asyncio
 import websockets
@@ -20,15 +21,39 @@ import urllib.parse
 from urllib.parse import urlparse
 import http.client
 import random
+import uuid
+import email.utils
+from datetime import timezone
+from concurrent.futures import ThreadPoolExecutor
 
 # Add Tekton root to path if not already present
 tekton_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 if tekton_root not in sys.path:
     sys.path.insert(0, tekton_root)
 
+# Make sibling server modules importable when loaded as ui.server.server
+server_dir = os.path.dirname(os.path.abspath(__file__))
+if server_dir not in sys.path:
+    sys.path.insert(0, server_dir)
+
 # Import shared utilities
 from shared.utils.logging_setup import setup_component_logging
 from shared.utils.global_config import GlobalConfig
+from static_cache import StaticFileCache
+from byte_ranges import parse_byte_ranges
+from asset_manifest import AssetManifest, is_hashed_asset
+from image_variants import ImageVariants, parse_width
+from precompressed_variants import PrecompressedVariants
+from connection_pool import BackendPools, DEFAULT_CONNECT_TIMEOUT
+from circuit_breaker import BackendUnavailable, CircuitBreakers
+from routes import DEFAULT_PROXY_ROUTES, RouteTable, parse_proxy_routes
+from websocket_reactor import WebSocketReactor
+from websocket_router import Topics, WebSocketRouter
+from websocket_deflate import DEFAULT_DEFLATE, negotiate_deflate
+from message_encoding import JSON_CODEC, codec_for, decode_message, negotiate_subprotocol
+from stream_coalescer import ChunkCoalescer
+from proxy_stream import ChunkedBodyError, ClientBodyError, ProxyTimings, relay_body, request_body
+from response_cache import CachedResponse, ResponseCache, has_credentials, parse_cache_control, parse_routes
 
 # Configure logging
 logger = setup_component_logging("hephaestus")
@@ -36,17 +61,162 @@ logger = setup_component_logging("hephaestus")
 # Get global configuration instance
 global_config = GlobalConfig.get_instance()
 
+# Browser caching for static files: "validate" sends ETag/Last-Modified and
+# answers conditional requests with 304, "no-store" disables caching (dev mode)
+CACHE_MODES = ("validate", "no-store")
+DEFAULT_CACHE_MODE = os.environ.get("HEPHAESTUS_CACHE_MODE", "validate")
+
+# Precompressed siblings (built by `python -m hephaestus.assets precompress`),
+# in order of preference when the client accepts several equally
+PRECOMPRESSED_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+COMPRESSIBLE_TYPES = ("application/javascript", "application/json", "image/svg+xml")
+
+# Connection-level headers that apply to one hop and are never forwarded by the proxy
+HOP_BY_HOP_HEADERS = frozenset(("connection", "keep-alive", "proxy-authenticate", "proxy-authorization",
+                                "te", "trailer", "transfer-encoding", "upgrade"))
+
+# Backend response headers replaced by our own send_response()
+REPLACED_RESPONSE_HEADERS = frozenset(("server", "date"))
+
+# Per-backend (connect, read) timeouts in seconds for proxied API calls. Ergon
+# streams LLM output, so its reads may legitimately pause for a while.
+BACKEND_TIMEOUTS = {
+    "ergon": (DEFAULT_CONNECT_TIMEOUT, float(os.environ.get("HEPHAESTUS_ERGON_READ_TIMEOUT", "120"))),
+    "hermes": (DEFAULT_CONNECT_TIMEOUT, float(os.environ.get("HEPHAESTUS_HERMES_READ_TIMEOUT", "15"))),
+}
+DEFAULT_BACKEND_TIMEOUTS = (DEFAULT_CONNECT_TIMEOUT, float(os.environ.get("HEPHAESTUS_PROXY_READ_TIMEOUT", "30")))
+
+# Seconds a client refused by the WebSocket connection caps is asked to wait
+WEBSOCKET_RETRY_AFTER = 5
+
+# Proxied API routes: path prefix -> (backend component, prefix rewrite)
+BUILTIN_PROXY_ROUTES = {
+    # Terminal/LLM endpoints: /api/terminal/* is /terminal/* on Ergon
+    "/api/terminal/": ("ergon", "/terminal/"),
+    # Hermes endpoints keep their paths
+    "/api/register": ("hermes", None),
+    "/api/message": ("hermes", None),
+    "/api/query": ("hermes", None),
+    "/api/components": ("hermes", None),
+}
+
+
+def backend_address(name):
+    """Return (host, port) of a Tekton component from GlobalConfig, or <NAME>_PORT"""
+    component = getattr(global_config.config, name, None)
+    port = getattr(component, 'port', None)
+    if port is None:
+        port = int(os.environ.get(f"{name.upper()}_PORT"))
+    return getattr(component, 'host', None) or "localhost", port
+
+
+def build_route_table(config):
+    """Build the request route table
+    
+    Proxied API routes come from BUILTIN_PROXY_ROUTES, then
+    config.hephaestus.proxy_routes (a dict or "PREFIX=BACKEND[:REWRITE],..."
+    string) and HEPHAESTUS_PROXY_ROUTES, so another component's API can be
+    proxied by naming it; its port is looked up in GlobalConfig. A malformed
+    source is logged and ignored, leaving the built-in routes in place.
+    """
+    table = RouteTable()
+    table.add("/health", "handle_health_check", exact=True)
+    table.add("/api/health", "handle_health_check", exact=True)
+    table.add("/stats", "handle_stats_request", exact=True)
+    table.add("/ready", "handle_ready_check", exact=True)
+    table.add("/api/config/ports", "serve_port_configuration")
+    table.add("/api/environment", "handle_environment_request", ("GET", "POST"), pass_method=True)
+    table.add("/api/settings", "handle_settings_request", ("GET", "POST"), pass_method=True)
+    table.add("/api/events/publish", "handle_publish_request", ("POST",), exact=True)
+    table.add("/api/", "send_api_not_found", ("GET", "POST"))
+    
+    proxy_routes = dict(BUILTIN_PROXY_ROUTES)
+    configured = (
+        ("config.hephaestus.proxy_routes", getattr(getattr(config, 'hephaestus', None), 'proxy_routes', None)),
+        ("HEPHAESTUS_PROXY_ROUTES", DEFAULT_PROXY_ROUTES),
+    )
+    for source, spec in configured:
+        try:
+            proxy_routes.update(parse_proxy_routes(spec))
+        except ValueError as e:
+            logger.error(f"Ignoring {source}: {e}")
+    for prefix, (backend, rewrite) in proxy_routes.items():
+        table.add(prefix, "proxy_api_request", ("GET", "POST"), backend=backend, rewrite=rewrite)
+    table.add("/api/status", "proxy_api_request", ("GET", "POST"), exact=True, backend="hermes")
+    
+    # Static files
+    for prefix in ("/components/terma/", "/scripts/terma/", "/styles/terma/"):
+        table.add(prefix, "serve_terma_file")
+    table.add("/terma/ui/", "serve_terma_ui_file")
+    table.add("/images/", "serve_image")
+    table.add("/", "serve_static_request", name="static")
+    return table
+
+# Relay proxied request/response bodies as they arrive instead of buffering
+# them whole ("false" restores buffering)
+DEFAULT_PROXY_STREAMING = os.environ.get("HEPHAESTUS_PROXY_STREAMING", "true").lower() in ("true", "1", "yes")
+
+# Content-hashed bundles never change under the same name
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
 class TektonUIRequestHandler(SimpleHTTPRequestHandler):
     """Handler for serving the Tekton UI"""
     
-    # Configuration for API proxying - using environment variables
-    ERGON_API_HOST = "localhost"
     global_config = GlobalConfig.get_instance()
-    ERGON_API_PORT = global_config.config.ergon.port if hasattr(global_config.config, 'ergon') else int(os.environ.get("ERGON_PORT"))
+    
+    # Method + path -> handler and proxy backend (see build_route_table),
+    # built by create_http_server at startup
+    routes = None
     
     # Add class variable to store the WebSocket server instance
     websocket_server = None
     
+    # Event loop serving every upgraded /ws connection, started by
+    # create_http_server (see websocket_reactor.py)
+    websocket_reactor = None
+    
+    # Runs websocket_server's handlers for the reactor's connections, set up
+    # by run_websocket_server (see websocket_router.py)
+    websocket_router = None
+    
+    # Negotiate permessage-deflate on /ws (see websocket_deflate.py)
+    websocket_deflate = DEFAULT_DEFLATE
+    
+    # Keep-alive connections to the API backends, shared by all handler threads
+    backend_pools = BackendPools()
+    
+    # Fast-fail for backends that keep failing (see circuit_breaker.py)
+    circuit_breakers = CircuitBreakers()
+    
+    # Proxy body handling (see DEFAULT_PROXY_STREAMING) and its TTFB statistics
+    proxy_streaming = DEFAULT_PROXY_STREAMING
+    proxy_timings = ProxyTimings()
+    
+    # Short-TTL cache and request coalescing for polled backend GETs
+    proxy_cache = ResponseCache()
+    
+    # Shared in-memory cache for static assets
+    static_cache = StaticFileCache()
+    
+    # Browser caching policy for static files (see CACHE_MODES)
+    cache_mode = DEFAULT_CACHE_MODE
+    
+    # Send uncached (large) files with socket.sendfile instead of copying
+    # them through Python buffers
+    use_sendfile = True
+    
+    # Bundle manifest written by `python -m hephaestus.assets bundle`, set up
+    # by create_http_server for the served directory
+    asset_manifest = None
+    
+    # Resized/recompressed copies of ui/images built by
+    # `python -m hephaestus.assets images`, set up by create_http_server
+    image_variants = None
+    
+    # Manifest of .gz/.br siblings written by `python -m hephaestus.assets
+    # precompress`, set up by create_http_server
+    precompressed_variants = None
+    
     def __init__(self, *args, directory=None, **kwargs):
         if directory is None:
             directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
@@ -54,7 +224,6 @@ class TektonUIRequestHandler(SimpleHTTPRequestHandler):
     
     def do_GET(self):
         """Handle GET requests"""
-        # Add no-cache headers to force browser to reload content
         self.protocol_version = 'HTTP/1.1'
         
         # Check if this is a WebSocket connection upgrade request
@@ -62,113 +231,373 @@ class TektonUIRequestHandler(SimpleHTTPRequestHandler):
             self.handle_websocket_request()
             return
         
-        # Check if this is an API request that needs to be proxied
-        if self.path == "/health" or self.path == "/api/health":
-            # Handle health check endpoint
-            self.handle_health_check()
+        self.dispatch_request("GET")
+    
+    def dispatch_request(self, method):
+        """Call the handler registered in the route table for this request"""
+        route = self.routes.match(method, self.path)
+        if route is None:
+            self.send_error(404, "Not Found")
             return
-        elif self.path == "/ready":
-            # Handle ready check endpoint
-            self.handle_ready_check()
+        started = time.perf_counter()
+        try:
+            if route.backend is not None:
+                self.proxy_api_request(method, route)
+            elif route.pass_method:
+                getattr(self, route.handler)(method)
+            else:
+                getattr(self, route.handler)()
+        finally:
+            self.routes.record(route, (time.perf_counter() - started) * 1000)
+    
+    def send_api_not_found(self):
+        """Answer an /api/ path no handler or backend is registered for"""
+        self.send_error(404, f"API endpoint not supported: {self.path}")
+    
+    def serve_terma_file(self):
+        """Serve Terma UI files linked into the components/scripts/styles trees"""
+        # We have symlinks now that should handle this, but if there are issues,
+        # we can directly serve from the Terma directory
+        if self.serve_static_file(self.translate_path(self.path)):
             return
-        elif self.path.startswith("/api/config/ports"):
-            # Handle port configuration endpoint
-            self.serve_port_configuration()
+        return SimpleHTTPRequestHandler.do_GET(self)
+    
+    def serve_terma_ui_file(self):
+        """Serve a file from the Terma component's ui directory"""
+        terma_path = self.path[len("/terma/ui/"):]
+        file_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "..", "Terma", "ui", terma_path)
+        
+        if self.serve_static_file(file_path):
             return
-        elif self.path.startswith("/api/environment"):
-            # Handle environment variable endpoints
-            self.handle_environment_request("GET")
+        self.serve_static_request()
+    
+    def serve_image(self):
+        """Serve an image, preferring a variant sized for the requested ?w= width"""
+        parsed_path = urlparse(self.path)
+        image_name = parsed_path.path[8:]  # Remove '/images/' prefix
+        
+        # Prefer a variant sized for the requested ?w= width, in WebP if accepted
+        if self.image_variants is not None:
+            variant = self.image_variants.select(urllib.parse.unquote(image_name),
+                                                 self.headers.get("Accept"),
+                                                 parse_width(urllib.parse.parse_qs(parsed_path.query)))
+            if variant and self.serve_static_file(variant, vary="Accept"):
+                return
+        
+        # Try to serve from Tekton root images directory
+        tekton_images_dir = os.path.abspath(os.path.join(self.directory, "../../..", "images"))
+        file_path = os.path.join(tekton_images_dir, image_name)
+        
+        if self.serve_static_file(file_path):
             return
-        elif self.path.startswith("/api/settings"):
-            # Handle settings endpoints
-            self.handle_settings_request("GET")
+        self.serve_static_request()
+    
+    def serve_static_request(self):
+        """Serve a UI file, falling back to index.html for unknown paths"""
+        if self.path == "/":
+            self.path = "/index.html"
+        file_path = self.resolve_document(self.translate_path(self.path))
+        if self.serve_static_file(file_path):
             return
-        elif self.path.startswith("/api/"):
-            self.proxy_api_request("GET")
+        if not os.path.isdir(file_path):
+            self.path = "/index.html"
+            if self.serve_static_file(self.resolve_document(self.translate_path(self.path))):
+                return
+        
+        # Directories fall back to the standard handler, with our custom headers
+        if self.cache_mode == "no-store":
+            old_end_headers = self.end_headers
+            def new_end_headers():
+                self.send_header("Cache-Control", "no-cache, no-store, must-revalidate")
+                self.send_header("Pragma", "no-cache")
+                self.send_header("Expires", "0")
+                old_end_headers()
+            self.end_headers = new_end_headers
+            
+        return SimpleHTTPRequestHandler.do_GET(self)
+    
+    def do_HEAD(self):
+        """Handle HEAD requests, answering static files like GET would"""
+        self.protocol_version = 'HTTP/1.1'
+        if self.path == "/":
+            self.path = "/index.html"
+        if self.serve_static_file(self.resolve_document(self.translate_path(self.path))):
             return
+        return SimpleHTTPRequestHandler.do_HEAD(self)
+    
+    def resolve_document(self, file_path):
+        """Swap a document for its bundled copy while the bundle manifest is current"""
+        if self.asset_manifest is None:
+            return file_path
+        return self.asset_manifest.document_path(file_path) or file_path
+    
+    def serve_static_file(self, file_path, vary=None):
+        """Serve a static file through the in-memory asset cache
+        
+        Small files are answered from the cache; files too large to cache
+        are sent straight from disk with sendfile. Text assets are sent as a precompressed
+        sibling when one exists and the client accepts its encoding. Range
+        requests are answered with 206 from the uncompressed file.
+        Content-hashed bundles under dist/ are marked immutable.
+        
+        Args:
+            file_path: Absolute path of the file to serve
+            vary: Extra request header the choice of file depended on, sent in Vary
             
-        # Handle requests for Terma UI files
-        if self.path.startswith("/components/terma/") or self.path.startswith("/scripts/terma/") or self.path.startswith("/styles/terma/"):
-            # We have symlinks now that should handle this, but if there are issues,
-            # we can directly serve from the Terma directory
-            return SimpleHTTPRequestHandler.do_GET(self)
+        Returns:
+            True if the file was served, False if it does not exist
+        """
+        asset = self.static_cache.get(file_path)
+        if asset is None:
+            return False
+        
+        immutable = is_hashed_asset(file_path)
+        content_type = self.guess_type(file_path)
+        compressible = content_type.startswith("text/") or content_type in COMPRESSIBLE_TYPES
+        vary_fields = ["Accept-Encoding"] if compressible else []
+        if vary:
+            vary_fields.append(vary)
+        vary_header = ", ".join(vary_fields)
+        range_header = self.headers.get("Range") if self.command == "GET" else None
+        # body is the representation sent: the file itself or a compressed sibling.
+        # Ranges always refer to the uncompressed file.
+        encoding, body = None, asset
+        if compressible and not range_header:
+            encoding, variant = self.select_precompressed_variant(file_path, asset)
+            if variant is not None:
+                body = variant
+        
+        if self.cache_mode == "validate" and self.is_not_modified(body.etag, asset.mtime):
+            self.send_response(304)
+            self.send_static_cache_headers(body.etag, asset.mtime, immutable)
+            if vary_header:
+                self.send_header("Vary", vary_header)
+            self.end_headers()
+            return True
+        
+        if range_header and self.if_range_matches(asset.etag, asset.mtime):
+            if self.serve_byte_ranges(asset, content_type, range_header, vary_header):
+                return True
+        
+        f = None
+        size = body.size
+        if body.data is None:
+            try:
+                f = open(body.path, 'rb')
+            except OSError:
+                return False
+            size = os.fstat(f.fileno()).st_size
+        
+        try:
+            self.send_response(200)
+            self.send_header("Content-type", content_type)
+            self.send_header("Content-Length", str(size))
+            if encoding:
+                self.send_header("Content-Encoding", encoding)
+            else:
+                self.send_header("Accept-Ranges", "bytes")
+            if vary_header:
+                self.send_header("Vary", vary_header)
+            self.send_static_cache_headers(body.etag, asset.mtime, immutable)
+            self.end_headers()
             
-        # Handle direct requests to Terma UI files
-        if self.path.startswith("/terma/ui/"):
-            # Direct path to Terma UI files
-            terma_path = self.path[len("/terma/ui/"):]
-            file_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "..", "Terma", "ui", terma_path)
+            if self.command == "HEAD":
+                pass
+            elif body.data is not None:
+                self.wfile.write(body.data)
+            else:
+                self.send_file_body(f, 0, size)
+        finally:
+            if f is not None:
+                f.close()
+        return True
+    
+    def serve_byte_ranges(self, asset, content_type, range_header, vary_header):
+        """Answer a Range request for a static file with 206 or 416
+        
+        Ranges are always read from the file on disk through send_file_body,
+        never sliced out of the cached copy.
+        
+        Returns:
+            False if the Range header is malformed and the full file should
+            be served instead, True once a response has been sent
+        """
+        try:
+            f = open(asset.path, 'rb')
+        except OSError:
+            return False
+        
+        try:
+            size = os.fstat(f.fileno()).st_size
+            ranges = parse_byte_ranges(range_header, size)
+            if ranges is None:
+                return False
             
-            if os.path.exists(file_path) and os.path.isfile(file_path):
-                self.send_response(200)
-                
-                # Determine content type based on extension
-                ext = os.path.splitext(file_path)[1].lower()
-                content_type = {
-                    '.html': 'text/html',
-                    '.js': 'application/javascript',
-                    '.css': 'text/css',
-                    '.png': 'image/png',
-                    '.jpg': 'image/jpeg',
-                    '.jpeg': 'image/jpeg',
-                    '.gif': 'image/gif',
-                }.get(ext, 'application/octet-stream')
-                
-                self.send_header("Content-type", content_type)
-                self.send_header("Content-Length", str(os.path.getsize(file_path)))
-                self.send_header("Cache-Control", "no-cache, no-store, must-revalidate")
-                self.send_header("Pragma", "no-cache")
-                self.send_header("Expires", "0")
+            if not ranges:
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{size}")
+                self.send_header("Content-Length", "0")
                 self.end_headers()
-                
-                with open(file_path, 'rb') as f:
-                    self.wfile.write(f.read())
-                return
+                return True
             
-        # Handle requests for images directory
-        if self.path.startswith("/images/"):
-            # Try to serve from Tekton root images directory
-            tekton_images_dir = os.path.abspath(os.path.join(self.directory, "../../..", "images"))
-            file_path = os.path.join(tekton_images_dir, self.path[8:])  # Remove '/images/' prefix
+            self.send_response(206)
+            self.send_header("Accept-Ranges", "bytes")
+            if vary_header:
+                self.send_header("Vary", vary_header)
+            self.send_static_cache_headers(asset.etag, asset.mtime, is_hashed_asset(asset.path))
             
-            if os.path.exists(file_path) and os.path.isfile(file_path):
-                # File exists in Tekton images directory
-                with open(file_path, 'rb') as f:
-                    # Determine content type based on extension
-                    ext = os.path.splitext(file_path)[1].lower()
-                    content_type = {
-                        '.png': 'image/png',
-                        '.jpg': 'image/jpeg',
-                        '.jpeg': 'image/jpeg',
-                        '.gif': 'image/gif',
-                        '.ico': 'image/x-icon',
-                    }.get(ext, 'application/octet-stream')
-                    
-                    self.send_response(200)
-                    self.send_header("Content-type", content_type)
-                    self.send_header("Content-Length", str(os.path.getsize(file_path)))
-                    # Add cache control headers
-                    self.send_header("Cache-Control", "no-cache, no-store, must-revalidate")
-                    self.send_header("Pragma", "no-cache")
-                    self.send_header("Expires", "0")
-                    self.end_headers()
-                    self.wfile.write(f.read())
-                return
+            if len(ranges) == 1:
+                start, end = ranges[0]
+                self.send_header("Content-type", content_type)
+                self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+                self.send_header("Content-Length", str(end - start + 1))
+                self.end_headers()
+                self.send_file_body(f, start, end - start + 1)
+                return True
             
-        # Default behavior - serve index.html for root path or if file doesn't exist
-        if self.path == "/" or not os.path.exists(os.path.join(self.directory, self.path[1:])):
-            self.path = "/index.html"
+            # Multiple ranges go out as multipart/byteranges
+            boundary = uuid.uuid4().hex
+            part_headers = [
+                (f"--{boundary}\r\n"
+                 f"Content-Type: {content_type}\r\n"
+                 f"Content-Range: bytes {start}-{end}/{size}\r\n\r\n").encode("latin-1")
+                for start, end in ranges
+            ]
+            closing = f"--{boundary}--\r\n".encode("latin-1")
+            length = sum(len(header) + (end - start + 1) + 2
+                         for header, (start, end) in zip(part_headers, ranges)) + len(closing)
+            
+            self.send_header("Content-type", f"multipart/byteranges; boundary={boundary}")
+            self.send_header("Content-Length", str(length))
+            self.end_headers()
+            for header, (start, end) in zip(part_headers, ranges):
+                self.wfile.write(header)
+                self.send_file_body(f, start, end - start + 1)
+                self.wfile.write(b"\r\n")
+            self.wfile.write(closing)
+            return True
+        finally:
+            f.close()
+    
+    def if_range_matches(self, etag, mtime):
+        """Evaluate If-Range; ranges are only honoured when it matches
         
-        # Add our custom headers by extending the base method behavior
-        old_end_headers = self.end_headers
-        def new_end_headers():
+        An entity tag must match strongly; a date must equal Last-Modified.
+        """
+        if_range = self.headers.get("If-Range")
+        if if_range is None:
+            return True
+        if_range = if_range.strip()
+        if if_range.startswith('"') or if_range.startswith('W/'):
+            return etag is not None and if_range == etag
+        try:
+            since = email.utils.parsedate_to_datetime(if_range)
+        except (TypeError, ValueError, IndexError, OverflowError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return int(mtime) == int(since.timestamp())
+    
+    def send_file_body(self, f, offset, count):
+        """Write count bytes of an open file, starting at offset, to the client
+        
+        Uses socket.sendfile (os.sendfile where the platform has it) so the
+        data goes from the page cache to the socket without passing through
+        Python; otherwise copies in fixed-size chunks. Either way memory use
+        does not grow with the file size.
+        """
+        self.wfile.flush()
+        if self.use_sendfile:
+            self.connection.sendfile(f, offset, count)
+            return
+        f.seek(offset)
+        remaining = count
+        while remaining > 0:
+            chunk = f.read(min(remaining, 64 * 1024))
+            if not chunk:
+                break
+            self.wfile.write(chunk)
+            remaining -= len(chunk)
+    
+    def select_precompressed_variant(self, file_path, asset):
+        """Pick a precompressed sibling of a static file for this client
+        
+        Only variants that precompressed.json records for the source's current
+        size and mtime are used, so a stale .gz never masks an edited file,
+        even one restored with an older mtime.
+        
+        Returns:
+            (content_coding, StaticAsset) or (None, None) to serve identity
+        """
+        accepted = {}
+        for item in self.headers.get("Accept-Encoding", "").split(","):
+            coding, _, params = item.partition(";")
+            coding = coding.strip().lower()
+            if not coding:
+                continue
+            qvalue = 1.0
+            params = params.strip()
+            if params.startswith("q="):
+                try:
+                    qvalue = float(params[2:])
+                except ValueError:
+                    qvalue = 0.0
+            accepted[coding] = qvalue
+        if not accepted or self.precompressed_variants is None:
+            return None, None
+        
+        recorded = self.precompressed_variants.variants(file_path, asset.size, asset.mtime_ns)
+        candidates = []
+        for preference, (coding, suffix) in enumerate(PRECOMPRESSED_ENCODINGS):
+            qvalue = accepted.get(coding, accepted.get("*", 0.0))
+            if qvalue > 0 and suffix in recorded:
+                candidates.append((-qvalue, preference, coding, suffix))
+        
+        for _, _, coding, suffix in sorted(candidates):
+            variant = self.static_cache.get(file_path + suffix)
+            if variant is not None and variant.size == recorded[suffix]:
+                return coding, variant
+        return None, None
+    
+    def send_static_cache_headers(self, etag, mtime, immutable=False):
+        """Send caching headers for a static file according to cache_mode"""
+        if self.cache_mode == "validate":
+            if etag:
+                self.send_header("ETag", etag)
+            self.send_header("Last-Modified", self.date_time_string(mtime))
+            if immutable:
+                self.send_header("Cache-Control", IMMUTABLE_CACHE_CONTROL)
+            else:
+                # Browsers may keep the file but must revalidate it on every use
+                self.send_header("Cache-Control", "no-cache")
+        else:
             self.send_header("Cache-Control", "no-cache, no-store, must-revalidate")
             self.send_header("Pragma", "no-cache")
             self.send_header("Expires", "0")
-            old_end_headers()
-        self.end_headers = new_end_headers
-            
-        return SimpleHTTPRequestHandler.do_GET(self)
+    
+    def is_not_modified(self, etag, mtime):
+        """Evaluate If-None-Match / If-Modified-Since against a static file
+        
+        If-None-Match takes precedence when present (RFC 7232 section 6).
+        """
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match is not None:
+            if not etag:
+                return False
+            tags = [tag.strip() for tag in if_none_match.split(",")]
+            return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
+        
+        if_modified_since = self.headers.get("If-Modified-Since")
+        if if_modified_since:
+            try:
+                since = email.utils.parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError, IndexError, OverflowError):
+                return False
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=timezone.utc)
+            # Last-Modified has one second resolution
+            return int(mtime) <= since.timestamp()
+        return False
         
     def handle_websocket_request(self):
         """Handle WebSocket upgrade request
@@ -179,18 +608,17 @@ class TektonUIRequestHandler(SimpleHTTPRequestHandler):
         For the Single Port Architecture, we handle both HTTP and WebSocket 
         connections on the same port but with different URL paths.
         """
+        reserved = False
         try:
-            # Import needed for WebSocket handling
-            import asyncio
-            import websockets
-            import struct
-            import time
-            import threading
             from http import HTTPStatus
             
             # Log full headers for debugging
             logger.info(f"WebSocket request headers: {dict(self.headers)}")
             
+            if self.websocket_reactor is None:
+                self.send_error(HTTPStatus.SERVICE_UNAVAILABLE, "WebSocket support is not running")
+                return
+            
             # Check for proper WebSocket protocol headers
             connection_header = self.headers.get("Connection", "")
             if not connection_header or "upgrade" not in connection_header.lower():
@@ -222,12 +650,39 @@ class TektonUIRequestHandler(SimpleHTTPRequestHandler):
             # Log handshake details
             logger.info(f"WebSocket handshake - Key: {websocket_key}, Accept: {accept_key}")
             
+            # Refuse the upgrade while the connection caps are reached
+            rejected = self.websocket_reactor.admit(self.client_address)
+            if rejected is not None:
+                logger.warning(f"Rejecting WebSocket from {self.client_address[0]}: {rejected} reached")
+                self.send_response(HTTPStatus.SERVICE_UNAVAILABLE)
+                self.send_header("Content-Type", "text/plain")
+                self.send_header("Content-Length", "0")
+                self.send_header("Retry-After", str(WEBSOCKET_RETRY_AFTER))
+                self.end_headers()
+                return
+            reserved = True
+            
+            # Compress messages if the client offers permessage-deflate
+            upgrade_headers = ""
+            deflate = None
+            if self.websocket_deflate:
+                negotiated = negotiate_deflate(self.headers.get("Sec-WebSocket-Extensions"))
+                if negotiated is not None:
+                    extension, deflate = negotiated
+                    upgrade_headers = f"Sec-WebSocket-Extensions: {extension}\r\n"
+            
+            # Binary message encoding if the client asks for one we speak
+            protocol = negotiate_subprotocol(self.headers.get("Sec-WebSocket-Protocol"))
+            if protocol is not None:
+                upgrade_headers += f"Sec-WebSocket-Protocol: {protocol}\r\n"
+            
             # Send WebSocket upgrade response
             handshake_response = (
                 f"HTTP/1.1 101 Switching Protocols\r\n"
                 f"Upgrade: websocket\r\n"
                 f"Connection: Upgrade\r\n"
                 f"Sec-WebSocket-Accept: {accept_key}\r\n"
+                f"{upgrade_headers}"
                 f"\r\n"
             )
             
@@ -237,218 +692,29 @@ class TektonUIRequestHandler(SimpleHTTPRequestHandler):
             # At this point, the socket is upgraded to WebSocket protocol
             logger.info("WebSocket connection established")
             
-            # Get the client socket
+            # Hand the socket to the reactor and release this handler (and its
+            # worker thread). Bytes the client sent right after the handshake
+            # may already sit in rfile's buffer, so they go along with it.
             client_socket = self.request
-            
-            # Start a separate thread to handle this WebSocket connection
-            ws_thread = threading.Thread(
-                target=self._handle_websocket_connection,
-                args=(client_socket,),
-                daemon=True
-            )
-            ws_thread.start()
-            
-            # Keep the request handler running until the connection is closed
-            # This prevents the HTTP server from closing the connection
-            while ws_thread.is_alive():
-                time.sleep(0.1)
-                
-            logger.info("WebSocket connection handler finished")
+            client_socket.setblocking(False)
+            try:
+                initial = self.rfile.read1(65536) or b""
+            except (BlockingIOError, InterruptedError):
+                initial = b""
+            # Detaching leaves the handler's socket object closed, so the
+            # server's shutdown_request() no longer touches the connection
+            upgraded = socket.socket(fileno=client_socket.detach())
+            # The reactor owns the slot from here on
+            reserved = False
+            self.websocket_reactor.add(upgraded, self.client_address, initial, deflate, protocol, admitted=True)
+            self.close_connection = True
             
         except Exception as e:
             logger.error(f"Error handling WebSocket request: {str(e)}")
+            if reserved:
+                self.websocket_reactor.release(self.client_address)
             self.send_error(HTTPStatus.INTERNAL_SERVER_ERROR, f"WebSocket error: {str(e)}")
     
-    def _handle_websocket_connection(self, client_socket):
-        """Handle the WebSocket connection after upgrade
-        
-        Args:
-            client_socket: The socket connection to the client
-        """
-        import select
-        import json
-        import struct
-        import time
-        
-        try:
-            # Helper function to decode WebSocket frames
-            def decode_websocket_frame(data):
-                """Decode a WebSocket frame"""
-                if len(data) < 2:
-                    return None, None, 0
-                
-                # Parse the first two bytes
-                fin = (data[0] & 0x80) != 0
-                opcode = data[0] & 0x0F
-                masked = (data[1] & 0x80) != 0
-                payload_length = data[1] & 0x7F
-                
-                # Get the index where the header ends
-                header_length = 2
-                
-                # Handle extended payload length
-                if payload_length == 126:
-                    if len(data) < 4:
-                        return None, None, 0
-                    payload_length = struct.unpack("!H", data[2:4])[0]
-                    header_length = 4
-                elif payload_length == 127:
-                    if len(data) < 10:
-                        return None, None, 0
-                    payload_length = struct.unpack("!Q", data[2:10])[0]
-                    header_length = 10
-                
-                # Get the masking key if present
-                mask_key = None
-                if masked:
-                    if len(data) < header_length + 4:
-                        return None, None, 0
-                    mask_key = data[header_length:header_length+4]
-                    header_length += 4
-                
-                # Check if we have enough data
-                if len(data) < header_length + payload_length:
-                    return None, None, 0
-                
-                # Get the payload
-                payload = data[header_length:header_length+payload_length]
-                
-                # Unmask the payload if needed
-                if masked and mask_key:
-                    payload = bytearray(payload)
-                    for i in range(len(payload)):
-                        payload[i] ^= mask_key[i % 4]
-                
-                return opcode, payload, header_length + payload_length
-            
-            # Helper function to encode WebSocket frames
-            def encode_websocket_frame(opcode, payload):
-                """Encode a WebSocket frame"""
-                # First byte: FIN bit set, opcode
-                first_byte = 0x80 | opcode
-                
-                # Determine payload length bytes
-                payload_length = len(payload)
-                if payload_length <= 125:
-                    length_bytes = struct.pack("!B", payload_length)
-                elif payload_length <= 65535:
-                    length_bytes = struct.pack("!BH", 126, payload_length)
-                else:
-                    length_bytes = struct.pack("!BQ", 127, payload_length)
-                
-                # Build frame
-                frame = bytes([first_byte]) + length_bytes + payload
-                return frame
-            
-            # Main connection loop
-            logger.info("Starting WebSocket connection handler")
-            buffer = bytearray()
-            client_socket.setblocking(0)  # Non-blocking mode
-            
-            # Send a welcome message
-            welcome_message = {
-                "type": "SYSTEM",
-                "source": "SERVER",
-                "target": "CLIENT",
-                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
-                "payload": {
-                    "message": "Welcome to Tekton UI WebSocket server"
-                }
-            }
-            welcome_frame = encode_websocket_frame(1, json.dumps(welcome_message).encode())
-            client_socket.sendall(welcome_frame)
-            
-            # Main loop
-            while True:
-                # Check if there's data to read
-                readable, _, _ = select.select([client_socket], [], [], 0.1)
-                
-                if not readable:
-                    continue
-                
-                # Read data
-                try:
-                    data = client_socket.recv(4096)
-                except BlockingIOError:
-                    continue
-                
-                # Check for disconnection
-                if not data:
-                    logger.info("Client disconnected")
-                    break
-                
-                # Add to buffer
-                buffer.extend(data)
-                
-                # Process frames in buffer
-                while buffer:
-                    opcode, payload, consumed = decode_websocket_frame(buffer)
-                    
-                    # If we don't have a complete frame yet
-                    if opcode is None:
-                        break
-                    
-                    # Remove consumed bytes from buffer
-                    buffer = buffer[consumed:]
-                    
-                    # Handle different opcodes
-                    if opcode == 0x1:  # Text frame
-                        try:
-                            message = payload.decode('utf-8')
-                            logger.info(f"Received message: {message[:100]}")
-                            
-                            # Parse as JSON
-                            data = json.loads(message)
-                            
-                            # Forward to WebSocket server if available
-                            if self.websocket_server:
-                                # Simple echo response
-                                response = {
-                                    "type": "RESPONSE",
-                                    "source": "SERVER",
-                                    "target": data.get("source", "CLIENT"),
-                                    "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
-                                    "payload": {
-                                        "message": f"Received: {message[:50]}...",
-                                        "status": "ok"
-                                    }
-                                }
-                                
-                                # Encode and send response
-                                response_frame = encode_websocket_frame(1, json.dumps(response).encode())
-                                client_socket.sendall(response_frame)
-                            
-                        except Exception as e:
-                            logger.error(f"Error processing message: {str(e)}")
-                    
-                    elif opcode == 0x8:  # Close frame
-                        logger.info("Received close frame")
-                        # Send close frame response
-                        close_frame = encode_websocket_frame(0x8, b'')
-                        client_socket.sendall(close_frame)
-                        return
-                    
-                    elif opcode == 0x9:  # Ping frame
-                        logger.info("Received ping frame")
-                        # Send pong frame
-                        pong_frame = encode_websocket_frame(0xA, payload)
-                        client_socket.sendall(pong_frame)
-                    
-                    elif opcode == 0xA:  # Pong frame
-                        logger.info("Received pong frame")
-                    
-                    else:
-                        logger.warning(f"Unsupported opcode: {opcode}")
-            
-        except Exception as e:
-            logger.error(f"WebSocket connection handler error: {str(e)}")
-        finally:
-            logger.info("WebSocket connection handler ending")
-            try:
-                client_socket.close()
-            except:
-                pass
-    
     def _calculate_accept_key(self, key):
         """Calculate the Sec-WebSocket-Accept header value based on the client's key
         
@@ -467,85 +733,240 @@ class TektonUIRequestHandler(SimpleHTTPRequestHandler):
     
     def do_POST(self):
         """Handle POST requests"""
-        # Check if this is an API request that needs to be proxied
-        if self.path.startswith("/api/environment"):
-            # Handle environment variable endpoints
-            self.handle_environment_request("POST")
-            return
-        elif self.path.startswith("/api/settings"):
-            # Handle settings endpoints
-            self.handle_settings_request("POST")
-            return
-        elif self.path.startswith("/api/"):
-            self.proxy_api_request("POST")
-            return
-        
-        # Handle any other POST requests with 404
-        self.send_error(404, "Not Found")
+        self.dispatch_request("POST")
     
-    def proxy_api_request(self, method):
-        """Proxy API requests to the appropriate backend service"""
+    def proxy_api_request(self, method, route=None):
+        """Proxy API requests to the backend service their route names
+        
+        Args:
+            method: HTTP method
+            route: Matched proxied Route; looked up from the path if None
+        """
+        backend = None
         try:
-            # Determine target based on path
-            target_host = self.ERGON_API_HOST
-            target_port = self.ERGON_API_PORT
-            
-            # Terminal/LLM endpoints
-            if self.path.startswith("/api/terminal/"):
-                # Convert /api/terminal/* to /terminal/* for Ergon API
-                target_path = self.path.replace("/api/terminal/", "/terminal/")
-            # Hermes endpoints - proxy to actual Hermes service
-            elif self.path.startswith("/api/register") or \
-                 self.path.startswith("/api/message") or \
-                 self.path == "/api/status" or \
-                 self.path.startswith("/api/query") or \
-                 self.path.startswith("/api/components"):
-                # Proxy to Hermes
-                target_host = "localhost"
-                try:
-                    target_port = self.config.hermes.port
-                except (AttributeError, TypeError):
-                    target_port = int(os.environ.get("HERMES_PORT"))
-                target_path = self.path  # Keep the same path
-            else:
-                # Unknown API endpoint
-                self.send_error(404, f"API endpoint not supported: {self.path}")
+            if route is None:
+                route = self.routes.match(method, self.path)
+            if route is None or route.backend is None:
+                self.send_api_not_found()
                 return
+            backend = route.backend
+            target_host, target_port = backend_address(backend)
+            target_path = route.target_path(self.path)
             
-            # Get content length for POST requests
-            content_length = int(self.headers.get('Content-Length', 0))
-            body = None
-            if content_length > 0:
-                body = self.rfile.read(content_length)
-            
-            # Get all headers to forward
+            # Get all headers to forward; hop-by-hop headers such as the client's
+            # "Connection: close" must not reach the pooled backend connection
             headers = {}
             for header, value in self.headers.items():
-                if header.lower() not in ('host', 'content-length'):
+                if header.lower() not in ('host', 'content-length', 'expect') and header.lower() not in HOP_BY_HOP_HEADERS:
                     headers[header] = value
             
-            # Make request to backend
+            # Make request to backend over a pooled keep-alive connection
             logger.info(f"Proxying {method} request to {target_host}:{target_port}{target_path}")
+            connect_timeout, read_timeout = BACKEND_TIMEOUTS.get(backend, DEFAULT_BACKEND_TIMEOUTS)
+            pool = self.backend_pools.get(target_host, target_port, connect_timeout, read_timeout)
             
-            conn = http.client.HTTPConnection(target_host, target_port)
-            conn.request(method, target_path, body=body, headers=headers)
-            response = conn.getresponse()
+            cache_route = self.proxy_cache.route_for(target_path)
+            if method == "GET" and cache_route is not None and not has_credentials(self.headers):
+                self.serve_cached_proxy_request(backend, pool, cache_route, target_path, headers)
+                return
+            if method not in ("GET", "HEAD"):
+                # Writes such as /api/register change what the cached GETs return
+                self.proxy_cache.invalidate(lambda key: key[:2] == (target_host, target_port))
+            
+            if self.proxy_streaming:
+                self.stream_proxy_request(backend, pool, method, target_path, headers)
+                return
+            
+            # Buffered mode: read the whole request and response before replying
+            content_length = int(self.headers.get('Content-Length', 0))
+            body = None
+            if content_length > 0:
+                body = self.rfile.read(content_length)
+            
+            started = time.perf_counter()
+            pooled, response = self.open_backend_request(backend, pool, method, target_path, body, headers)
+            headers_ms = (time.perf_counter() - started) * 1000
+            try:
+                response_body = response.read()
+            except Exception:
+                pool.release(pooled, reusable=False)
+                raise
+            pool.release(pooled, reusable=not response.will_close)
+            self.proxy_timings.record(headers_ms, (time.perf_counter() - started) * 1000,
+                                      len(response_body), streamed=False)
             
             # Forward response status and headers
             self.send_response(response.status)
             for header, value in response.getheaders():
-                if header.lower() not in ('transfer-encoding',):
+                if header.lower() not in HOP_BY_HOP_HEADERS and header.lower() not in REPLACED_RESPONSE_HEADERS \
+                        and header.lower() != 'content-length':
                     self.send_header(header, value)
+            self.send_header('Content-Length', str(len(response_body)))
+            self.send_header('Server-Timing', f'backend;dur={headers_ms:.1f}')
             self.end_headers()
             
             # Forward response body
-            self.wfile.write(response.read())
-            conn.close()
+            self.wfile.write(response_body)
             
+        except BackendUnavailable as e:
+            self.send_backend_unavailable(e)
+        except ChunkedBodyError as e:
+            logger.warning(f"Malformed chunked request body for {self.path}: {e}")
+            self.send_error(400, f"Malformed chunked request body: {str(e)}")
+        except ClientBodyError as e:
+            # Nobody is left to answer
+            logger.info(f"Client stopped sending the request body for {self.path}: {e}")
+            self.close_connection = True
+        except socket.timeout as e:
+            logger.error(f"Timed out proxying request to {backend}: {e}")
+            self.send_error(504, f"Backend timed out: {str(e)}")
+        except (OSError, http.client.HTTPException) as e:
+            logger.error(f"Error proxying request to {backend}: {e}")
+            self.send_error(502, f"Error proxying request: {str(e)}")
         except Exception as e:
             logger.error(f"Error proxying request: {e}")
             self.send_error(500, f"Error proxying request: {str(e)}")
     
+    @classmethod
+    def open_backend_request(cls, backend, pool, method, target_path, body=None, headers=None):
+        """Send a proxied request through the backend's circuit breaker
+        
+        Returns:
+            (PooledConnection, HTTPResponse) as from ConnectionPool.request
+            
+        Raises:
+            BackendUnavailable: The breaker is open; nothing was sent
+        """
+        breaker = cls.circuit_breakers.get(backend)
+        if not breaker.allow():
+            raise BackendUnavailable(backend, breaker.retry_after())
+        try:
+            result = pool.request(method, target_path, body=body, headers=headers)
+        except (ClientBodyError, ChunkedBodyError):
+            # The client failed while its body was being forwarded, not the backend
+            breaker.abandon()
+            raise
+        except (OSError, http.client.HTTPException):
+            # Refused, timed out or dropped before answering
+            breaker.record_failure()
+            raise
+        except BaseException:
+            breaker.abandon()
+            raise
+        breaker.record_success()
+        return result
+    
+    def send_backend_unavailable(self, error):
+        """Answer 503 for a backend whose circuit breaker is open"""
+        retry_after = max(1, int(error.retry_after + 0.999))
+        body = json.dumps({
+            "error": "backend_unavailable",
+            "backend": error.backend,
+            "message": str(error),
+            "retry_after": retry_after,
+        }).encode('utf-8')
+        self.send_response(503)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Retry-After', str(retry_after))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def serve_cached_proxy_request(self, backend, pool, route, target_path, headers):
+        """Answer a proxied GET from the response cache
+        
+        Concurrent identical requests share one backend call; the backend
+        response is read whole, which is fine for the small polled routes
+        the cache is configured for. Requests with credentials never get
+        here, and responses that differ per client are not shared.
+        """
+        def load():
+            started = time.perf_counter()
+            pooled, response = self.open_backend_request(backend, pool, "GET", target_path, headers=headers)
+            headers_ms = (time.perf_counter() - started) * 1000
+            try:
+                body = response.read()
+            except Exception:
+                pool.release(pooled, reusable=False)
+                raise
+            pool.release(pooled, reusable=not response.will_close)
+            self.proxy_timings.record(headers_ms, (time.perf_counter() - started) * 1000,
+                                      len(body), streamed=False)
+            kept = [(header, value) for header, value in response.getheaders()
+                    if header.lower() not in HOP_BY_HOP_HEADERS
+                    and header.lower() not in REPLACED_RESPONSE_HEADERS
+                    and header.lower() != 'content-length']
+            return CachedResponse(response.status, kept, body)
+        
+        request_directives = parse_cache_control(self.headers.get('Cache-Control'))
+        bypass = 'no-cache' in request_directives or 'no-store' in request_directives
+        key = (pool.host, pool.port, target_path, self.headers.get('Accept-Encoding', ''))
+        cached, outcome = self.proxy_cache.fetch(route, key, load, bypass=bypass)
+        
+        self.send_response(cached.status)
+        for header, value in cached.headers:
+            self.send_header(header, value)
+        self.send_header('Content-Length', str(len(cached.body)))
+        self.send_header('Age', str(cached.age()))
+        self.send_header('X-Cache', outcome)
+        self.end_headers()
+        self.wfile.write(cached.body)
+    
+    def stream_proxy_request(self, backend, pool, method, target_path, headers):
+        """Relay a proxied request and its response without buffering whole bodies
+        
+        The request body is forwarded in bounded pieces (chunked bodies are
+        decoded and re-chunked by http.client). The backend's status and
+        headers are sent as soon as they arrive and its body is copied
+        through as it is produced: with its Content-Length if it has one,
+        re-chunked for HTTP/1.1 clients otherwise, or delimited by closing
+        the connection for HTTP/1.0 clients.
+        
+        Errors before the backend answered propagate so the caller can send
+        an error response; once headers are out the stream is just cut.
+        """
+        body, length = request_body(self.rfile, self.headers)
+        if length is not None:
+            headers['Content-Length'] = str(length)
+        
+        started = time.perf_counter()
+        pooled, response = self.open_backend_request(backend, pool, method, target_path, body, headers)
+        headers_ms = (time.perf_counter() - started) * 1000
+        
+        has_body = method != "HEAD" and response.status not in (204, 304)
+        length_header = None if response.chunked else response.getheader('Content-Length')
+        chunked = has_body and length_header is None and self.request_version == 'HTTP/1.1'
+        size, first_byte, reusable = 0, None, False
+        try:
+            self.protocol_version = 'HTTP/1.1'
+            self.send_response(response.status)
+            for header, value in response.getheaders():
+                if header.lower() in HOP_BY_HOP_HEADERS or header.lower() in REPLACED_RESPONSE_HEADERS:
+                    continue
+                if header.lower() == 'content-length' and length_header is None:
+                    continue
+                self.send_header(header, value)
+            if chunked:
+                self.send_header('Transfer-Encoding', 'chunked')
+            self.send_header('Server-Timing', f'backend;dur={headers_ms:.1f}')
+            self.send_header('Connection', 'close')
+            self.end_headers()
+            
+            if has_body:
+                size, first_byte = relay_body(response, self.wfile.write, chunked)
+            response.read()  # Completes bodiless responses so the connection can be reused
+            reusable = not response.will_close
+        except (BrokenPipeError, ConnectionResetError) as e:
+            logger.info(f"Client disconnected while streaming {target_path}: {e}")
+        except Exception as e:
+            logger.error(f"Error streaming proxied response from {target_path}: {e}")
+        finally:
+            pool.release(pooled, reusable=reusable)
+            self.close_connection = True
+        
+        first_byte_ms = (first_byte - started) * 1000 if first_byte is not None else None
+        self.proxy_timings.record(headers_ms, first_byte_ms, size, streamed=length_header is None)
+    
 
     def handle_health_check(self):
         """Handle health check endpoint for component status monitoring"""
@@ -570,16 +991,38 @@ class TektonUIRequestHandler(SimpleHTTPRequestHandler):
                 "/health",
                 "/api/health",
                 "/ready",
+                "/stats",
                 "/api/config/ports",
                 "/api/environment",
                 "/api/settings",
                 "/ws"
             ],
+            "static_cache": self.static_cache.stats(),
+            "proxy_pools": self.backend_pools.stats(),
+            "proxy_timings": self.proxy_timings.stats(),
             "message": "Hephaestus UI server is running"
         }
 
         self.wfile.write(json.dumps(response).encode('utf-8'))
     
+    def handle_stats_request(self):
+        """Serve cache hit ratios and proxy counters"""
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header("Cache-Control", "no-cache, no-store, must-revalidate")
+        self.end_headers()
+        
+        response = {
+            "static_cache": self.static_cache.stats(),
+            "proxy_cache": self.proxy_cache.stats(),
+            "proxy_pools": self.backend_pools.stats(),
+            "proxy_timings": self.proxy_timings.stats(),
+            "routes": self.routes.stats(),
+            "websocket": self.websocket_reactor.stats() if self.websocket_reactor else None,
+            "websocket_topics": self.websocket_server.topics.stats() if self.websocket_server else None,
+        }
+        self.wfile.write(json.dumps(response).encode('utf-8'))
+    
     def handle_ready_check(self):
         """Handle ready check endpoint following Tekton standards"""
         global server_start_time
@@ -607,7 +1050,9 @@ class TektonUIRequestHandler(SimpleHTTPRequestHandler):
             "component": "hephaestus",
             "version": "0.1.0",
             "uptime": uptime,
-            "checks": checks
+            "checks": checks,
+            # Proxy backends; an open breaker means calls to it fail fast with 503
+            "circuit_breakers": {name: self.circuit_breakers.get(name).stats() for name in self.routes.backends()}
         }
         
         self.wfile.write(json.dumps(response).encode('utf-8'))
@@ -783,6 +1228,31 @@ class TektonUIRequestHandler(SimpleHTTPRequestHandler):
             logger.error(f"Error handling settings request: {e}")
             self.send_error(500, f"Settings request error: {str(e)}")
         
+    def handle_publish_request(self):
+        """Broadcast an event to the /ws clients subscribed to its topic
+        
+        Body: {"topic": ..., "event": ..., "source": ...}; used by Hermes and
+        other components to push updates to every open UI.
+        """
+        try:
+            content_length = int(self.headers.get('Content-Length', 0))
+            body = json.loads(self.rfile.read(content_length).decode('utf-8'))
+            topic = body["topic"]
+        except (ValueError, TypeError, KeyError):
+            self.send_error(400, "Expected a JSON object with a topic")
+            return
+        if self.websocket_server is None:
+            self.send_error(503, "WebSocket server not running")
+            return
+        
+        delivered = self.websocket_server.publish(topic, body.get("event"), body.get("source", "SYSTEM"))
+        response = json.dumps({"topic": topic, "delivered": delivered}).encode('utf-8')
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+        
     def log_message(self, format, *args):
         """Override to use our logger"""
         logger.info(format % args)
@@ -797,6 +1267,11 @@ class WebSocketServer:
         self.port = port or default_port
         self.clients = set()
         self.component_servers = {}
+        # Event topics clients subscribed to (SUBSCRIBE messages)
+        self.topics = Topics()
+        # Threads reading Ergon LLM streams, one per reply in progress
+        self.stream_executor = ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS,
+                                                  thread_name_prefix="hephaestus-llm")
     
     async def register_client(self, websocket):
         """Register a new client connection"""
@@ -809,12 +1284,13 @@ class WebSocketServer:
         except websockets.exceptions.ConnectionClosed:
             logger.info("Client disconnected")
         finally:
-            self.clients.remove(websocket)
+            self.clients.discard(websocket)
+            self.topics.unsubscribe(websocket)
     
     async def handle_message(self, websocket, message):
         """Handle incoming WebSocket messages"""
         try:
-            data = json.loads(message)
+            data = decode_message(getattr(websocket, 'codec', JSON_CODEC), message)
             logger.debug(f"Received message: {data}")
             
             # For demo purposes, echo the message back with a response
@@ -830,7 +1306,7 @@ class WebSocketServer:
                         'status': 'success'
                     }
                 }
-                await websocket.send(json.dumps(response))
+                await self.send_message(websocket, response)
             
             # LLM requests for terminal chats
             elif data.get('type') == 'LLM_REQUEST':
@@ -849,7 +1325,34 @@ class WebSocketServer:
                         'message': 'Client registered successfully'
                     }
                 }
-                await websocket.send(json.dumps(response))
+                await self.send_message(websocket, response)
+            
+            # Topic subscriptions for pushed events
+            elif data.get('type') in ('SUBSCRIBE', 'UNSUBSCRIBE'):
+                topics = data.get('payload', {}).get('topics', [])
+                if isinstance(topics, str):
+                    topics = [topics]
+                if data['type'] == 'SUBSCRIBE':
+                    self.topics.subscribe(websocket, topics)
+                else:
+                    self.topics.unsubscribe(websocket, topics)
+                response = {
+                    'type': 'RESPONSE',
+                    'source': 'SYSTEM',
+                    'target': data.get('source', 'UI'),
+                    'timestamp': self.get_timestamp(),
+                    'payload': {
+                        'status': data['type'].lower() + 'd',
+                        'topics': topics
+                    }
+                }
+                await self.send_message(websocket, response)
+            
+            # Events from a connected component, for every subscriber
+            elif data.get('type') == 'PUBLISH':
+                payload = data.get('payload', {})
+                if payload.get('topic'):
+                    self.publish(payload['topic'], payload.get('event'), data.get('source', 'UNKNOWN'))
         
         except json.JSONDecodeError:
             logger.error(f"Invalid JSON message: {message}")
@@ -857,7 +1360,14 @@ class WebSocketServer:
             logger.error(f"Error handling message: {e}")
             
     async def handle_llm_request(self, websocket, data):
-        """Handle LLM request messages by simulating responses"""
+        """Handle LLM request messages
+        
+        Streamed requests relay Ergon's /terminal/stream reply, or a simulated
+        one when Ergon cannot stream. Either way the text goes through a
+        ChunkCoalescer, and the done message reports frames, bytes per frame
+        and latency.
+        """
+        started = time.perf_counter()
         try:
             # Extract relevant information
             payload = data.get('payload', {})
@@ -880,7 +1390,7 @@ class WebSocketServer:
                     'context': context_id
                 }
             }
-            await websocket.send(json.dumps(typing_response))
+            await self.send_message(websocket, typing_response)
             
             # Get simulation mode
             streaming = payload.get('streaming', True)
@@ -898,39 +1408,51 @@ class WebSocketServer:
             
             # Handle streaming vs non-streaming
             if streaming:
-                # Simulate streaming response
-                chunk_size = 5  # Characters per chunk
-                for i in range(0, len(simulated_response), chunk_size):
-                    chunk = simulated_response[i:i+chunk_size]
-                    
-                    # Send chunk
+                target = data.get('source', 'UI')
+                
+                async def send_chunk(text):
                     chunk_response = {
                         'type': 'UPDATE',
                         'source': context_id,
-                        'target': data.get('source', 'UI'),
+                        'target': target,
                         'timestamp': self.get_timestamp(),
                         'payload': {
-                            'chunk': chunk,
+                            'chunk': text,
                             'context': context_id
                         }
                     }
-                    await websocket.send(json.dumps(chunk_response))
-                    
-                    # Add a short delay between chunks (50-150ms) for realistic effect
-                    await asyncio.sleep(0.05 + (0.1 * random.random()))
+                    return await self.send_message(websocket, chunk_response)
+                
+                coalescer = ChunkCoalescer(send_chunk, started=started)
+                try:
+                    pieces = await self.open_ergon_stream(message, context_id)
+                    stream_source = 'ergon'
+                    if pieces is None:
+                        pieces = simulate_llm_stream(simulated_response)
+                        stream_source = 'simulated'
+                    async for piece in pieces:
+                        await coalescer.add(piece)
+                    stream_stats = await coalescer.close()
+                finally:
+                    coalescer.cancel()
+                stream_stats['source'] = stream_source
+                logger.info(f"Streamed {stream_source} reply for {context_id}: {stream_stats['frames']} frames "
+                            f"for {stream_stats['chunks']} chunks, {stream_stats['bytes_per_frame']} bytes/frame, "
+                            f"first frame {stream_stats['first_frame_ms']} ms, total {stream_stats['total_ms']} ms")
                 
                 # Send done signal
                 done_response = {
                     'type': 'UPDATE',
                     'source': context_id,
-                    'target': data.get('source', 'UI'),
+                    'target': target,
                     'timestamp': self.get_timestamp(),
                     'payload': {
                         'done': True,
-                        'context': context_id
+                        'context': context_id,
+                        'stats': stream_stats
                     }
                 }
-                await websocket.send(json.dumps(done_response))
+                await self.send_message(websocket, done_response)
             else:
                 # Create AI response (non-streaming)
                 ai_response = {
@@ -948,7 +1470,7 @@ class WebSocketServer:
                 await asyncio.sleep(1.0)
                 
                 # Send response
-                await websocket.send(json.dumps(ai_response))
+                await self.send_message(websocket, ai_response)
             
             # Send typing end indicator
             typing_end_response = {
@@ -962,7 +1484,7 @@ class WebSocketServer:
                     'context': context_id
                 }
             }
-            await websocket.send(json.dumps(typing_end_response))
+            await self.send_message(websocket, typing_end_response)
                 
         except Exception as e:
             logger.error(f"Error handling LLM request: {e}")
@@ -978,7 +1500,7 @@ class WebSocketServer:
                     'context': context_id if 'context_id' in locals() else 'unknown'
                 }
             }
-            await websocket.send(json.dumps(error_response))
+            await self.send_message(websocket, error_response)
             
             # End typing indicator if it was started
             if 'context_id' in locals():
@@ -993,7 +1515,92 @@ class WebSocketServer:
                         'context': context_id
                     }
                 }
-                await websocket.send(json.dumps(typing_end_response))
+                await self.send_message(websocket, typing_end_response)
+    
+    async def open_ergon_stream(self, message, context_id):
+        """Start streaming Ergon's reply to an LLM request
+        
+        Returns:
+            Async iterator of text chunks, or None if Ergon cannot stream
+        """
+        loop = asyncio.get_running_loop()
+        opened = await loop.run_in_executor(self.stream_executor, open_ergon_stream, message, context_id)
+        if opened is None:
+            return None
+        return self.relay_ergon_stream(loop, *opened)
+    
+    async def relay_ergon_stream(self, loop, pool, pooled, response):
+        """Yield the chunks of an Ergon event stream read on a worker thread"""
+        queue = asyncio.Queue()
+        
+        def deliver(item):
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, item)
+            except RuntimeError:
+                # The event loop is gone
+                pass
+        
+        def read():
+            reusable = False
+            item = None
+            try:
+                for chunk in read_sse_chunks(response):
+                    deliver(chunk)
+                # Read to the end of the body so the connection can be reused
+                response.read()
+                reusable = not response.will_close
+            except Exception as e:
+                item = e
+            finally:
+                pool.release(pooled, reusable)
+            deliver(item)
+        
+        reader = loop.run_in_executor(self.stream_executor, read)
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            if not reader.done():
+                # The client went away; unblock the reader
+                try:
+                    pooled.connection.sock.shutdown(socket.SHUT_RDWR)
+                except (OSError, AttributeError):
+                    pass
+    
+    def publish(self, topic, event, source='SYSTEM'):
+        """Push an event to the clients subscribed to topic; safe from any thread
+        
+        Returns:
+            Number of clients the event was sent to
+        """
+        message = {
+            'type': 'EVENT',
+            'source': source,
+            'target': 'UI',
+            'timestamp': self.get_timestamp(),
+            'payload': {
+                'topic': topic,
+                'event': event
+            }
+        }
+        return self.topics.publish(topic, message)
+    
+    async def send_message(self, websocket, message):
+        """Send a message object in the client's negotiated encoding
+        
+        Returns:
+            Size of the encoded message in bytes
+        """
+        if hasattr(websocket, 'send_message'):
+            return await websocket.send_message(message)
+        text = json.dumps(message)
+        await websocket.send(text)
+        return len(text)
     
     def get_timestamp(self):
         """Get current ISO timestamp"""
@@ -1009,6 +1616,67 @@ class WebSocketServer:
         # This will be handled by the request handler
         await asyncio.Future()  # Placeholder - actual server is started in the HTTP handler
 
+# Simulated LLM replies stream a 5-character piece every 1-2x this many
+# milliseconds
+SIMULATED_CHUNK_MS = float(os.environ.get("HEPHAESTUS_SIMULATED_CHUNK_MS", "10"))
+
+async def simulate_llm_stream(text, chunk_size=5):
+    """Yield a simulated reply a few characters at a time, like a token stream"""
+    for i in range(0, len(text), chunk_size):
+        yield text[i:i + chunk_size]
+        await asyncio.sleep(SIMULATED_CHUNK_MS / 1000 * (1 + random.random()))
+
+def open_ergon_stream(message, context_id):
+    """Send an LLM request to Ergon's /terminal/stream (blocking)
+    
+    Returns:
+        (ConnectionPool, PooledConnection, HTTPResponse) for an event stream,
+        or None if Ergon is unavailable or does not stream
+    """
+    try:
+        host, port = backend_address("ergon")
+        connect_timeout, read_timeout = BACKEND_TIMEOUTS.get("ergon", DEFAULT_BACKEND_TIMEOUTS)
+        pool = TektonUIRequestHandler.backend_pools.get(host, port, connect_timeout, read_timeout)
+        body = json.dumps({"message": message, "context_id": context_id, "streaming": True}).encode('utf-8')
+        pooled, response = TektonUIRequestHandler.open_backend_request(
+            "ergon", pool, "POST", "/terminal/stream", body,
+            {"Content-Type": "application/json", "Accept": "text/event-stream"})
+    except (BackendUnavailable, OSError, http.client.HTTPException, TypeError, ValueError) as e:
+        logger.info(f"Ergon stream unavailable, simulating the reply: {e}")
+        return None
+    if response.status != 200:
+        logger.info(f"Ergon stream returned {response.status}, simulating the reply")
+        try:
+            response.read()
+            pool.release(pooled, not response.will_close)
+        except (OSError, http.client.HTTPException):
+            pool.release(pooled, reusable=False)
+        return None
+    return pool, pooled, response
+
+def read_sse_chunks(response):
+    """Yield the text chunks of an LLM event stream until its done event
+    
+    Events are "data: {...}" lines carrying "chunk", "done" or "error".
+    
+    Raises:
+        RuntimeError: The stream reported an error
+    """
+    for line in response:
+        line = line.strip()
+        if not line.startswith(b"data:"):
+            continue
+        try:
+            event = json.loads(line[5:])
+        except ValueError:
+            continue
+        if event.get("done"):
+            return
+        if event.get("error"):
+            raise RuntimeError(event["error"])
+        if event.get("chunk"):
+            yield event["chunk"]
+
 def run_websocket_server(port):
     """Initialize the WebSocket server instance
     
@@ -1021,18 +1689,123 @@ def run_websocket_server(port):
     # Store the WebSocket server instance in the request handler class
     TektonUIRequestHandler.websocket_server = ws_server
     
+    # Upgraded /ws connections are served by its handlers on the router's loop
+    if TektonUIRequestHandler.websocket_router is None:
+        TektonUIRequestHandler.websocket_router = WebSocketRouter(ws_server, on_open=send_websocket_welcome).start()
+    else:
+        TektonUIRequestHandler.websocket_router.server = ws_server
+    
     logger.info("WebSocket server initialized for Single Port Architecture")
 
-def run_http_server(directory, port):
-    """Run the HTTP server"""
-    handler = lambda *args, **kwargs: TektonUIRequestHandler(*args, directory=directory, **kwargs)
+def send_websocket_welcome(connection):
+    """Greet a newly upgraded /ws client in its negotiated encoding"""
+    codec = codec_for(connection.protocol)
+    connection.send(codec.opcode, codec.encode({
+        "type": "SYSTEM",
+        "source": "SERVER",
+        "target": "CLIENT",
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "payload": {
+            "message": "Welcome to Tekton UI WebSocket server"
+        }
+    }))
+
+def create_websocket_reactor(**options):
+    """Start the reactor for upgraded /ws connections, routed to websocket_server
     
-    # Create a custom TCPServer that allows address reuse
-    class TektonTCPServer(socketserver.TCPServer):
-        allow_reuse_address = True
+    Args:
+        options: WebSocketReactor limits (max_message, ping_interval, ...)
+    """
+    if TektonUIRequestHandler.websocket_router is None:
+        run_websocket_server(None)
+    return WebSocketReactor(**options, **TektonUIRequestHandler.websocket_router.reactor_callbacks()).start()
+
+# Server engines selectable with --server-mode
+SERVER_MODES = ("threaded", "single")
+DEFAULT_SERVER_MODE = os.environ.get("HEPHAESTUS_SERVER_MODE", "threaded")
+DEFAULT_MAX_WORKERS = int(os.environ.get("HEPHAESTUS_MAX_WORKERS", "64"))
+
+class TektonTCPServer(socketserver.TCPServer):
+    """TCP server that allows address reuse and handles one request at a time"""
+    allow_reuse_address = True
+    # The socketserver default of 5 drops connections when a tab loads the UI
+    request_queue_size = 128
+
+class ThreadPoolTCPServer(TektonTCPServer):
+    """TCP server that handles requests on a bounded pool of worker threads
+    
+    Accepted connections are handed to a fixed-size thread pool. At most
+    max_workers requests run at once and at most max_workers more wait in the
+    pool queue; beyond that the accept loop blocks and further clients wait
+    in the kernel listen backlog instead of piling up in memory.
+    
+    Upgraded /ws connections are handed to the WebSocket reactor and do not
+    occupy a worker.
+    """
     
-    with TektonTCPServer(("", port), handler) as httpd:
-        logger.info(f"Serving at http://localhost:{port}")
+    def __init__(self, server_address, RequestHandlerClass, max_workers=DEFAULT_MAX_WORKERS,
+                 bind_and_activate=True):
+        self.max_workers = max_workers
+        self.executor = ThreadPoolExecutor(max_workers=max_workers,
+                                           thread_name_prefix="hephaestus-http")
+        self._slots = threading.BoundedSemaphore(max_workers * 2)
+        super().__init__(server_address, RequestHandlerClass, bind_and_activate)
+    
+    def process_request(self, request, client_address):
+        """Queue the request on the worker pool"""
+        self._slots.acquire()
+        try:
+            self.executor.submit(self._process_request_worker, request, client_address)
+        except RuntimeError:
+            # Pool is shutting down
+            self._slots.release()
+            self.shutdown_request(request)
+    
+    def _process_request_worker(self, request, client_address):
+        """Run a single request on a pool thread"""
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            self._slots.release()
+    
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+def create_http_server(directory, port, server_mode=DEFAULT_SERVER_MODE, max_workers=DEFAULT_MAX_WORKERS):
+    """Create the HTTP server for the requested serving mode
+    
+    Args:
+        directory: Directory to serve static files from
+        port: Port to listen on
+        server_mode: "threaded" for a bounded worker pool, "single" to handle
+            one request at a time
+        max_workers: Worker thread count for the threaded mode
+    """
+    TektonUIRequestHandler.routes = build_route_table(global_config.config)
+    TektonUIRequestHandler.asset_manifest = AssetManifest(directory)
+    TektonUIRequestHandler.image_variants = ImageVariants(os.path.join(directory, "images"))
+    TektonUIRequestHandler.precompressed_variants = PrecompressedVariants(directory)
+    if TektonUIRequestHandler.websocket_reactor is None:
+        TektonUIRequestHandler.websocket_reactor = create_websocket_reactor()
+    handler = lambda *args, **kwargs: TektonUIRequestHandler(*args, directory=directory, **kwargs)
+    
+    if server_mode == "threaded":
+        return ThreadPoolTCPServer(("", port), handler, max_workers=max_workers)
+    elif server_mode == "single":
+        return TektonTCPServer(("", port), handler)
+    raise ValueError(f"Unknown server mode: {server_mode} (expected one of {', '.join(SERVER_MODES)})")
+
+def run_http_server(directory, port, server_mode=DEFAULT_SERVER_MODE, max_workers=DEFAULT_MAX_WORKERS):
+    """Run the HTTP server"""
+    with create_http_server(directory, port, server_mode, max_workers) as httpd:
+        if server_mode == "threaded":
+            logger.info(f"Serving at http://localhost:{port} ({server_mode}, {max_workers} workers)")
+        else:
+            logger.info(f"Serving at http://localhost:{port} ({server_mode})")
         try:
             httpd.serve_forever()
         except KeyboardInterrupt:
@@ -1050,6 +1823,42 @@ def main():
     parser.add_argument('--port', type=int, default=default_port, 
                       help='HTTP/WebSocket Server port')
     parser.add_argument('--directory', type=str, default=None, help='Directory to serve')
+    parser.add_argument('--server-mode', choices=SERVER_MODES, default=DEFAULT_SERVER_MODE,
+                      help='Request handling: bounded thread pool or one request at a time')
+    parser.add_argument('--max-workers', type=int, default=DEFAULT_MAX_WORKERS,
+                      help='Worker threads for the threaded server mode')
+    parser.add_argument('--static-cache-mb', type=int, default=None,
+                      help='Memory ceiling in MB for the static asset cache')
+    parser.add_argument('--sendfile-threshold-kb', type=int, default=None,
+                      help='Files larger than this are sent with sendfile instead of cached in memory')
+    parser.add_argument('--no-sendfile', action='store_true',
+                      help='Copy large files through Python buffers instead of using sendfile')
+    parser.add_argument('--dev', action='store_true',
+                      help='Development mode: send no-store headers so browsers never cache static files')
+    parser.add_argument('--proxy-pool-size', type=int, default=None,
+                      help='Idle keep-alive connections kept per API backend (0 disables pooling)')
+    parser.add_argument('--proxy-cache-routes', type=str, default=None,
+                      help='Cached proxy GET routes as PREFIX=SECONDS[,...] (empty disables the cache)')
+    parser.add_argument('--buffer-proxy', action='store_true',
+                      help='Read proxied request/response bodies whole instead of streaming them')
+    parser.add_argument('--ws-max-message-kb', type=int, default=None,
+                      help='Largest WebSocket message accepted from a client, in KB')
+    parser.add_argument('--no-ws-deflate', action='store_true',
+                      help='Do not negotiate permessage-deflate compression on /ws')
+    parser.add_argument('--ws-ping-interval', type=float, default=None,
+                      help='Seconds of silence before a /ws connection is pinged (0 disables pings)')
+    parser.add_argument('--ws-pong-timeout', type=float, default=None,
+                      help='Seconds a pinged /ws connection has to answer before it is reaped')
+    parser.add_argument('--ws-idle-timeout', type=float, default=None,
+                      help='Close /ws connections that send no message for this many seconds (0 never)')
+    parser.add_argument('--ws-max-connections', type=int, default=None,
+                      help='Open /ws connections allowed; further upgrades get 503 (0 for no limit)')
+    parser.add_argument('--ws-max-per-ip', type=int, default=None,
+                      help='Open /ws connections allowed per client IP (0 for no limit)')
+    parser.add_argument('--breaker-failures', type=int, default=None,
+                      help='Consecutive backend failures that open its circuit breaker')
+    parser.add_argument('--breaker-reset', type=float, default=None,
+                      help='Seconds an open circuit breaker waits before probing the backend')
     args = parser.parse_args()
     
     # Determine directory to serve
@@ -1061,6 +1870,31 @@ def main():
     
     logger.info(f"Serving files from: {directory}")
     
+    if args.static_cache_mb is not None or args.sendfile_threshold_kb is not None:
+        cache_options = {}
+        if args.static_cache_mb is not None:
+            cache_options["max_bytes"] = args.static_cache_mb * 1024 * 1024
+        if args.sendfile_threshold_kb is not None:
+            cache_options["max_entry_bytes"] = args.sendfile_threshold_kb * 1024
+        TektonUIRequestHandler.static_cache = StaticFileCache(**cache_options)
+    if args.no_sendfile:
+        TektonUIRequestHandler.use_sendfile = False
+    if args.dev:
+        TektonUIRequestHandler.cache_mode = "no-store"
+    if args.proxy_pool_size is not None:
+        TektonUIRequestHandler.backend_pools = BackendPools(max_size=args.proxy_pool_size)
+    if args.buffer_proxy:
+        TektonUIRequestHandler.proxy_streaming = False
+    if args.proxy_cache_routes is not None:
+        TektonUIRequestHandler.proxy_cache = ResponseCache(parse_routes(args.proxy_cache_routes))
+    if args.breaker_failures is not None or args.breaker_reset is not None:
+        breaker_options = {}
+        if args.breaker_failures is not None:
+            breaker_options["failure_threshold"] = args.breaker_failures
+        if args.breaker_reset is not None:
+            breaker_options["reset_timeout"] = args.breaker_reset
+        TektonUIRequestHandler.circuit_breakers = CircuitBreakers(**breaker_options)
+    
     # Note: Hermes registration is handled by HephaestusComponent
     # When running standalone, we skip registration
     
@@ -1068,8 +1902,19 @@ def main():
     # In Single Port Architecture, the same port handles both HTTP and WebSocket
     run_websocket_server(args.port)
     
+    if args.no_ws_deflate:
+        TektonUIRequestHandler.websocket_deflate = False
+    reactor_options = {}
+    if args.ws_max_message_kb is not None:
+        reactor_options["max_message"] = args.ws_max_message_kb * 1024
+    for option in ("ping_interval", "pong_timeout", "idle_timeout", "max_connections", "max_per_ip"):
+        if getattr(args, "ws_" + option) is not None:
+            reactor_options[option] = getattr(args, "ws_" + option)
+    if reactor_options:
+        TektonUIRequestHandler.websocket_reactor = create_websocket_reactor(**reactor_options)
+    
     # Start HTTP server in the main thread (will also handle WebSocket upgrades)
-    run_http_server(directory, args.port)
+    run_http_server(directory, args.port, args.server_mode, args.max_workers)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
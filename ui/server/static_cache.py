@@ -0,0 +1,175 @@
+"""
+In-memory static asset cache for the Tekton UI server
+
+Keeps the bytes of recently served static files in a bounded LRU keyed by
+the resolved file path. Every lookup stats the file and compares mtime,
+size and inode with the cached entry, so edits on disk (including a symlink
+being pointed somewhere else) are picked up on the next request.
+
+Each entry also carries a strong ETag derived from the file contents. Files
+too large to cache keep a metadata-only entry so their ETag is only
+recomputed when the file changes.
+"""
+
+import hashlib
+import os
+import stat
+import threading
+from collections import OrderedDict
+
+# Default memory ceiling for cached file bytes
+DEFAULT_MAX_BYTES = int(os.environ.get("HEPHAESTUS_STATIC_CACHE_MB", "64")) * 1024 * 1024
+
+# Files larger than this are not cached; the server sends them from disk
+# with sendfile instead
+DEFAULT_MAX_ENTRY_BYTES = 1024 * 1024
+
+# Upper bound on entries, including metadata-only entries for large files
+DEFAULT_MAX_ENTRIES = 4096
+
+# Read size used when hashing files that are not cached
+HASH_CHUNK_SIZE = 256 * 1024
+
+
+def content_etag(digest):
+    """Format a content digest as a strong ETag"""
+    return f'"{digest.hexdigest()}"'
+
+
+class StaticAsset:
+    """A static file, its validators and, when cached, its contents"""
+
+    __slots__ = ("path", "size", "mtime", "mtime_ns", "ino", "data", "etag")
+
+    def __init__(self, path, stat_result, data=None, etag=None):
+        self.path = path
+        self.size = stat_result.st_size
+        self.mtime = stat_result.st_mtime
+        self.mtime_ns = stat_result.st_mtime_ns
+        self.ino = stat_result.st_ino
+        self.data = data
+        self.etag = etag
+
+    def matches(self, stat_result):
+        """Check whether this entry still describes the file on disk"""
+        return (self.mtime_ns == stat_result.st_mtime_ns and
+                self.size == stat_result.st_size and
+                self.ino == stat_result.st_ino)
+
+
+class StaticFileCache:
+    """Thread-safe LRU cache of static file contents with a memory ceiling"""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, max_entry_bytes=DEFAULT_MAX_ENTRY_BYTES,
+                 max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = min(max_entry_bytes, max_bytes)
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bypassed = 0
+
+    def get(self, path):
+        """Look up a file, loading it into the cache if needed
+
+        Args:
+            path: Absolute path of the file
+
+        Returns:
+            StaticAsset, or None if the path is missing or not a regular file.
+            The asset's data is None when the file is too large to cache, and
+            its etag is None if the file changed while it was being read.
+        """
+        try:
+            stat_result = os.stat(path)
+        except OSError:
+            return None
+        if not stat.S_ISREG(stat_result.st_mode):
+            return None
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry.matches(stat_result):
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        try:
+            if stat_result.st_size > self.max_entry_bytes:
+                entry = self._load_metadata(path)
+            else:
+                entry = self._load(path)
+        except OSError:
+            return None
+        if entry.etag is None:
+            # File changed while being read; serve it without caching
+            return entry
+
+        with self._lock:
+            if entry.data is None:
+                self.bypassed += 1
+            self._discard(path)
+            self._entries[path] = entry
+            self._total_bytes += entry.size if entry.data is not None else 0
+            while self._entries and (self._total_bytes > self.max_bytes or
+                                     len(self._entries) > self.max_entries):
+                _, evicted = self._entries.popitem(last=False)
+                if evicted.data is not None:
+                    self._total_bytes -= evicted.size
+                self.evictions += 1
+        return entry
+
+    def _load(self, path):
+        """Read a small file and hash its contents"""
+        with open(path, "rb") as f:
+            # Take size and mtime from the open file so they describe the bytes we read
+            stat_result = os.fstat(f.fileno())
+            data = f.read()
+        if len(data) != stat_result.st_size:
+            return StaticAsset(path, stat_result)
+        return StaticAsset(path, stat_result, data, content_etag(hashlib.blake2b(data, digest_size=16)))
+
+    def _load_metadata(self, path):
+        """Hash a large file without keeping its contents"""
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, "rb") as f:
+            stat_result = os.fstat(f.fileno())
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+            if os.fstat(f.fileno()).st_mtime_ns != stat_result.st_mtime_ns:
+                return StaticAsset(path, stat_result)
+        return StaticAsset(path, stat_result, etag=content_etag(digest))
+
+    def _discard(self, path):
+        """Drop an entry; the caller must hold the lock"""
+        entry = self._entries.pop(path, None)
+        if entry is not None and entry.data is not None:
+            self._total_bytes -= entry.size
+
+    def clear(self):
+        """Drop all cached entries"""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def stats(self):
+        """Return cache counters for health reporting"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "max_entry_bytes": self.max_entry_bytes,
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "bypassed": self.bypassed,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
@@ -0,0 +1,114 @@
+"""
+Coalescing of streamed LLM text for /ws clients
+
+LLM replies arrive a few characters at a time. Sending each piece as its own
+UPDATE message means one JSON envelope, timestamp and WebSocket frame per
+token, which is mostly overhead. ChunkCoalescer collects the pieces and
+sends them when the buffer reaches a size or has waited long enough, so
+text still appears promptly while frames carry useful payloads.
+"""
+
+import asyncio
+import os
+import time
+
+# Send buffered text this long after its first piece arrived...
+DEFAULT_FLUSH_MS = float(os.environ.get("HEPHAESTUS_STREAM_FLUSH_MS", "50"))
+
+# ...or as soon as this many characters are buffered
+DEFAULT_FLUSH_CHARS = int(os.environ.get("HEPHAESTUS_STREAM_FLUSH_CHARS", "256"))
+
+
+class ChunkCoalescer:
+    """Joins streamed text into fewer, larger messages
+
+    Used as:
+
+        coalescer = ChunkCoalescer(send_chunk)
+        async for piece in stream:
+            await coalescer.add(piece)
+        stats = await coalescer.close()
+
+    send_chunk is a coroutine function called with each joined text, in
+    order; it is never called concurrently. It may return the size of the
+    message it sent, which bytes_per_frame then reports instead of the
+    text's size.
+    """
+
+    def __init__(self, send, flush_ms=DEFAULT_FLUSH_MS, flush_chars=DEFAULT_FLUSH_CHARS, started=None):
+        """
+        Args:
+            send: Coroutine function sending one joined text
+            flush_ms: Longest a piece waits in the buffer
+            flush_chars: Buffer size that is sent at once
+            started: perf_counter() time the request arrived, for latency
+        """
+        self.send = send
+        self.flush_ms = flush_ms
+        self.flush_chars = flush_chars
+        self._parts = []
+        self._size = 0
+        self._timer = None
+        self._lock = asyncio.Lock()
+        self.started = started if started is not None else time.perf_counter()
+        self.first_frame_ms = None
+        self.chunks = 0
+        self.frames = 0
+        self.chars = 0
+        self.frame_bytes = 0
+
+    async def add(self, text):
+        """Buffer a piece of text, sending the buffer if it is full"""
+        if not text:
+            return
+        self._parts.append(text)
+        self._size += len(text)
+        self.chunks += 1
+        if self._size >= self.flush_chars or self.flush_ms <= 0:
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().create_task(self._flush_later())
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.flush_ms / 1000)
+        self._timer = None
+        await self.flush()
+
+    async def flush(self):
+        """Send whatever is buffered now"""
+        if self._timer is not None and self._timer is not asyncio.current_task():
+            self._timer.cancel()
+            self._timer = None
+        async with self._lock:
+            if not self._parts:
+                return
+            text = "".join(self._parts)
+            self._parts = []
+            self._size = 0
+            self.frames += 1
+            self.chars += len(text)
+            if self.first_frame_ms is None:
+                self.first_frame_ms = (time.perf_counter() - self.started) * 1000
+            sent = await self.send(text)
+            self.frame_bytes += sent if sent is not None else len(text.encode("utf-8"))
+
+    async def close(self):
+        """Send the rest of the buffer and return the stream's statistics"""
+        await self.flush()
+        return self.stats()
+
+    def cancel(self):
+        """Drop the pending timer without sending (the stream failed)"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def stats(self):
+        return {
+            "chunks": self.chunks,
+            "frames": self.frames,
+            "chars": self.chars,
+            "bytes_per_frame": round(self.frame_bytes / self.frames, 1) if self.frames else 0,
+            "first_frame_ms": round(self.first_frame_ms, 1) if self.first_frame_ms is not None else None,
+            "total_ms": round((time.perf_counter() - self.started) * 1000, 1),
+        }
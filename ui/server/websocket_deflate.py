@@ -0,0 +1,183 @@
+"""
+permessage-deflate (RFC 7692) for the Tekton UI server's /ws endpoint
+
+Messages on /ws are small JSON objects repeating the same keys. With context
+takeover each connection keeps its deflate window between messages, so those
+keys compress to back-references after the first message. Without it every
+message is compressed on its own; that costs less memory per connection but
+compresses small messages much less.
+
+negotiate_deflate() picks the first acceptable offer from the client's
+Sec-WebSocket-Extensions header and returns the response value and a
+PerMessageDeflate for the connection.
+"""
+
+import os
+import threading
+import zlib
+
+from websocket_frames import CLOSE_TOO_BIG, FrameError
+
+DEFAULT_DEFLATE = os.environ.get("HEPHAESTUS_WS_DEFLATE", "true").lower() in ("true", "1", "yes")
+
+# Keep the compression window between messages ("false" resets it per message
+# and asks the client to do the same)
+DEFAULT_CONTEXT_TAKEOVER = os.environ.get("HEPHAESTUS_WS_DEFLATE_CONTEXT_TAKEOVER",
+                                          "true").lower() in ("true", "1", "yes")
+
+# LZ77 window for our compressor (and, when the client lets us choose, its
+# compressor). Compressor memory is about 2**(bits + 2) + 2**(MEM_LEVEL + 9)
+# bytes per connection, so the small default keeps 1000 tabs cheap while
+# still covering the repeated JSON keys.
+DEFAULT_WINDOW_BITS = int(os.environ.get("HEPHAESTUS_WS_DEFLATE_WINDOW_BITS", "12"))
+DEFAULT_LEVEL = int(os.environ.get("HEPHAESTUS_WS_DEFLATE_LEVEL", "6"))
+MEM_LEVEL = 5
+
+# Messages shorter than this are sent uncompressed
+DEFAULT_MIN_SIZE = int(os.environ.get("HEPHAESTUS_WS_DEFLATE_MIN_SIZE", "32"))
+
+EXTENSION_NAME = "permessage-deflate"
+
+# Every compressed message ends with an empty stored block, which is
+# stripped on the wire
+_TAIL = b"\x00\x00\xff\xff"
+
+
+def parse_extensions(header):
+    """Parse a Sec-WebSocket-Extensions header
+
+    Returns:
+        [(name, {param: value or None})] in offer order
+    """
+    offers = []
+    for item in (header or "").split(","):
+        parts = [part.strip() for part in item.split(";")]
+        if not parts[0]:
+            continue
+        params = {}
+        for part in parts[1:]:
+            if not part:
+                continue
+            name, _, value = part.partition("=")
+            params[name.strip().lower()] = value.strip().strip('"') if value else None
+        offers.append((parts[0].lower(), params))
+    return offers
+
+
+def _window_bits(value):
+    try:
+        bits = int(value)
+    except (TypeError, ValueError):
+        return None
+    # zlib cannot produce raw deflate streams with an 8-bit window
+    return bits if 9 <= bits <= 15 else None
+
+
+def negotiate_deflate(header, context_takeover=DEFAULT_CONTEXT_TAKEOVER, window_bits=DEFAULT_WINDOW_BITS,
+                      level=DEFAULT_LEVEL, min_size=DEFAULT_MIN_SIZE):
+    """Accept the first permessage-deflate offer we support
+
+    Args:
+        header: The client's Sec-WebSocket-Extensions header, or None
+        context_takeover: Keep compression context between messages
+        window_bits: Largest LZ77 window we use or ask the client to use
+
+    Returns:
+        (Sec-WebSocket-Extensions response value, PerMessageDeflate), or
+        None if nothing acceptable was offered
+    """
+    for name, params in parse_extensions(header):
+        if name != EXTENSION_NAME:
+            continue
+        if set(params) - {"server_no_context_takeover", "client_no_context_takeover",
+                          "server_max_window_bits", "client_max_window_bits"}:
+            continue
+
+        response = [EXTENSION_NAME]
+        server_takeover = context_takeover and "server_no_context_takeover" not in params
+        if not server_takeover:
+            response.append("server_no_context_takeover")
+        client_takeover = context_takeover and "client_no_context_takeover" not in params
+        if not client_takeover:
+            response.append("client_no_context_takeover")
+
+        server_bits = window_bits
+        if "server_max_window_bits" in params:
+            limit = _window_bits(params["server_max_window_bits"])
+            if limit is None:
+                continue
+            server_bits = min(server_bits, limit)
+            response.append(f"server_max_window_bits={server_bits}")
+
+        # The client's window can only be limited if it said it supports that
+        client_bits = 15
+        if "client_max_window_bits" in params:
+            offered = params["client_max_window_bits"]
+            limit = 15 if offered is None else _window_bits(offered)
+            if limit is None:
+                continue
+            client_bits = min(window_bits, limit)
+            response.append(f"client_max_window_bits={client_bits}")
+
+        deflate = PerMessageDeflate(server_takeover, client_takeover, server_bits, client_bits, level, min_size)
+        return "; ".join(response), deflate
+    return None
+
+
+class PerMessageDeflate:
+    """Compression state for one connection"""
+
+    def __init__(self, server_context_takeover=True, client_context_takeover=True,
+                 server_window_bits=DEFAULT_WINDOW_BITS, client_window_bits=15,
+                 level=DEFAULT_LEVEL, min_size=DEFAULT_MIN_SIZE):
+        self.server_context_takeover = server_context_takeover
+        self.client_context_takeover = client_context_takeover
+        self.server_window_bits = server_window_bits
+        self.client_window_bits = client_window_bits
+        self.level = level
+        self.min_size = min_size
+        self._compressor = None
+        self._decompressor = None
+        # Senders on other threads must compress in the order frames are queued
+        self.lock = threading.RLock()
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.raw_bytes_in = 0
+        self.raw_bytes_out = 0
+
+    def compress(self, payload):
+        """Compress an outgoing message, or return None to send it as is
+
+        Callers hold self.lock until the result is queued.
+        """
+        if len(payload) < self.min_size:
+            return None
+        if self._compressor is None or not self.server_context_takeover:
+            self._compressor = zlib.compressobj(self.level, zlib.DEFLATED, -self.server_window_bits, MEM_LEVEL)
+        data = self._compressor.compress(payload) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+        if not self.server_context_takeover:
+            self._compressor = None
+        if data.endswith(_TAIL):
+            data = data[:-4]
+        self.raw_bytes_out += len(payload)
+        self.bytes_out += len(data)
+        return data
+
+    def decompress(self, payload, max_size=None):
+        """Decompress an incoming message
+
+        Raises:
+            FrameError: The data is corrupt, or inflates past max_size
+        """
+        if self._decompressor is None or not self.client_context_takeover:
+            self._decompressor = zlib.decompressobj(-self.client_window_bits)
+        limit = 0 if max_size is None else max_size + 1
+        try:
+            data = self._decompressor.decompress(payload + _TAIL, limit)
+        except zlib.error as e:
+            raise FrameError(f"Invalid compressed message: {e}")
+        if max_size is not None and (len(data) > max_size or self._decompressor.unconsumed_tail):
+            raise FrameError(f"Message exceeds {max_size} bytes", CLOSE_TOO_BIG)
+        self.bytes_in += len(payload)
+        self.raw_bytes_in += len(data)
+        return data
@@ -0,0 +1,239 @@
+"""
+WebSocket frame encoding and decoding (RFC 6455) for the Tekton UI server
+
+Frames are parsed in place from a connection's receive buffer: decode_frame
+takes a read offset and returns the offset after the frame, so a buffer
+holding many frames is never resliced per frame. Client payloads are
+unmasked in bulk, as big-integer XORs over 16 KiB chunks (or with NumPy
+when installed), instead of byte by byte. MessageAssembler joins fragmented
+messages.
+"""
+
+import struct
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Opcodes
+OP_CONTINUATION = 0x0
+OP_TEXT = 0x1
+OP_BINARY = 0x2
+OP_CLOSE = 0x8
+OP_PING = 0x9
+OP_PONG = 0xA
+
+DATA_OPCODES = (OP_TEXT, OP_BINARY)
+
+# Reserved header bit set on the first frame of a compressed message
+# (permessage-deflate, see websocket_deflate.py)
+RSV1 = 0x40
+
+# Close status codes
+CLOSE_NORMAL = 1000
+CLOSE_GOING_AWAY = 1001
+CLOSE_PROTOCOL_ERROR = 1002
+CLOSE_INVALID_DATA = 1007
+CLOSE_POLICY_VIOLATION = 1008
+CLOSE_TOO_BIG = 1009
+
+# Payloads at least this large are unmasked with NumPy when it is available;
+# below it the big-integer XOR is as fast
+NUMPY_UNMASK_MIN = 64 * 1024
+
+# Bytes unmasked per big-integer XOR; larger payloads are split into chunks
+# this size (a multiple of 4, so every chunk starts on the key boundary)
+UNMASK_CHUNK = 16 * 1024
+
+_HEADER_SHORT = struct.Struct("!BB")
+_HEADER_MEDIUM = struct.Struct("!BBH")
+_HEADER_LONG = struct.Struct("!BBQ")
+_LENGTH_16 = struct.Struct("!H")
+_LENGTH_64 = struct.Struct("!Q")
+
+
+class FrameError(ValueError):
+    """Raised for a frame the connection must be closed for"""
+
+    def __init__(self, message, code=CLOSE_PROTOCOL_ERROR):
+        super().__init__(message)
+        self.code = code
+
+
+def unmask(payload, mask):
+    """Return payload XORed with the 4-byte masking key
+
+    Args:
+        payload: Bytes-like masked payload
+        mask: 4-byte masking key
+
+    Returns:
+        bytes
+    """
+    length = len(payload)
+    if not length:
+        return b""
+    if numpy is not None and length >= NUMPY_UNMASK_MIN:
+        data = numpy.frombuffer(payload, dtype=numpy.uint8)
+        key = numpy.frombuffer(bytes(mask) * (length // 4 + 1), dtype=numpy.uint8, count=length)
+        return numpy.bitwise_xor(data, key).tobytes()
+    if length <= UNMASK_CHUNK:
+        # One XOR over the payload as an integer runs word by word in C
+        key = bytes(mask) * (length // 4) + bytes(mask[:length % 4])
+        return (int.from_bytes(payload, "little") ^ int.from_bytes(key, "little")).to_bytes(length, "little")
+    # Larger payloads go in cache-sized chunks that share one key integer
+    key = int.from_bytes(bytes(mask) * (UNMASK_CHUNK // 4), "little")
+    out = bytearray(length)
+    whole = length - length % UNMASK_CHUNK
+    with memoryview(payload) as view:
+        for start in range(0, whole, UNMASK_CHUNK):
+            end = start + UNMASK_CHUNK
+            out[start:end] = (int.from_bytes(view[start:end], "little") ^ key).to_bytes(UNMASK_CHUNK, "little")
+        if whole < length:
+            out[whole:] = unmask(view[whole:], mask)
+    return bytes(out)
+
+
+def decode_frame(data, offset=0, max_payload=None, allowed_rsv=0, require_mask=False):
+    """Decode the frame starting at data[offset]
+
+    Args:
+        data: Receive buffer (bytes, bytearray or memoryview)
+        offset: Where the frame starts
+        max_payload: Largest payload accepted; checked as soon as the header
+            is complete, before the payload has arrived
+        allowed_rsv: Reserved bits a negotiated extension may set
+        require_mask: Reject unmasked frames, as a server must for every
+            frame from a client (RFC 6455 section 5.1)
+
+    Returns:
+        (fin, opcode, payload bytes, offset after the frame, reserved bits),
+        or None if data does not hold the whole frame yet
+
+    Raises:
+        FrameError: The frame is oversized or breaks the protocol
+    """
+    available = len(data) - offset
+    if available < 2:
+        return None
+    with memoryview(data) as view:
+        first, second = _HEADER_SHORT.unpack_from(view, offset)
+        fin = bool(first & 0x80)
+        rsv = first & 0x70
+        opcode = first & 0x0F
+        if rsv & ~allowed_rsv:
+            raise FrameError("Reserved bits set without a negotiated extension")
+        masked = second & 0x80
+        if require_mask and not masked:
+            raise FrameError("Unmasked frame from client")
+        payload_length = second & 0x7F
+        position = offset + 2
+
+        if payload_length == 126:
+            if available < 4:
+                return None
+            payload_length = _LENGTH_16.unpack_from(view, position)[0]
+            position += 2
+        elif payload_length == 127:
+            if available < 10:
+                return None
+            payload_length = _LENGTH_64.unpack_from(view, position)[0]
+            position += 8
+
+        if opcode >= OP_CLOSE and (payload_length > 125 or not fin or rsv):
+            raise FrameError("Invalid control frame")
+        if max_payload is not None and payload_length > max_payload:
+            raise FrameError(f"Frame of {payload_length} bytes exceeds {max_payload}", CLOSE_TOO_BIG)
+
+        mask = None
+        if masked:
+            if len(data) < position + 4:
+                return None
+            mask = bytes(view[position:position + 4])
+            position += 4
+
+        end = position + payload_length
+        if len(data) < end:
+            return None
+        if mask is not None:
+            payload = unmask(view[position:end], mask)
+        else:
+            payload = bytes(view[position:end])
+    return fin, opcode, payload, end, rsv
+
+
+def frame_header(opcode, length, fin=True, rsv=0):
+    """Encode the header of an unmasked server frame"""
+    first = (0x80 if fin else 0) | rsv | opcode
+    if length <= 125:
+        return _HEADER_SHORT.pack(first, length)
+    if length <= 65535:
+        return _HEADER_MEDIUM.pack(first, 126, length)
+    return _HEADER_LONG.pack(first, 127, length)
+
+
+def encode_frame(opcode, payload, fin=True, rsv=0):
+    """Encode an unmasked server frame"""
+    return frame_header(opcode, len(payload), fin, rsv) + payload
+
+
+def encode_close(code, reason=""):
+    """Encode a close frame carrying a status code"""
+    return encode_frame(OP_CLOSE, _LENGTH_16.pack(code) + reason.encode("utf-8")[:123])
+
+
+class MessageAssembler:
+    """Joins fragmented data frames into whole messages for one connection"""
+
+    __slots__ = ("max_message", "opcode", "rsv", "fragments", "size")
+
+    def __init__(self, max_message=None):
+        self.max_message = max_message
+        self.opcode = None
+        self.rsv = 0
+        self.fragments = []
+        self.size = 0
+
+    def add(self, fin, opcode, payload, rsv=0):
+        """Feed one data or continuation frame
+
+        Returns:
+            (opcode, payload, reserved bits of the first frame) when a message
+            is complete, otherwise None
+
+        Raises:
+            FrameError: Out-of-order fragments, or the message is too big
+        """
+        if opcode == OP_CONTINUATION:
+            if self.opcode is None:
+                raise FrameError("Continuation frame without a message to continue")
+            if rsv:
+                raise FrameError("Reserved bits set on a continuation frame")
+        elif self.opcode is not None:
+            raise FrameError("New message started inside a fragmented message")
+        elif fin:
+            return opcode, payload, rsv
+        else:
+            self.opcode = opcode
+            self.rsv = rsv
+
+        self.size += len(payload)
+        if self.max_message is not None and self.size > self.max_message:
+            raise FrameError(f"Message exceeds {self.max_message} bytes", CLOSE_TOO_BIG)
+        self.fragments.append(payload)
+        if not fin:
+            return None
+        message = (self.opcode, b"".join(self.fragments), self.rsv)
+        self.opcode = None
+        self.fragments = []
+        self.size = 0
+        return message
+
+
+def check_text(payload):
+    """Raise FrameError unless a text message payload is valid UTF-8"""
+    try:
+        payload.decode("utf-8")
+    except UnicodeDecodeError:
+        raise FrameError("Text message is not valid UTF-8", CLOSE_INVALID_DATA)
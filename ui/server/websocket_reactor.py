@@ -0,0 +1,641 @@
+"""
+Single-threaded WebSocket reactor for the Tekton UI server
+
+Upgraded /ws connections used to get a thread each, polling its socket with
+a 100 ms select() timeout while also holding the HTTP worker that accepted
+it. The reactor instead multiplexes every upgraded socket on one selector
+(epoll on Linux) in one thread: idle connections cost nothing, and frames are
+answered as soon as they arrive.
+
+Each connection has a bounded read buffer (larger messages close it with
+1009, protocol errors with 1002) and a bounded queue of unsent bytes (a client that stops reading is
+dropped). send() and broadcast() may be called from any thread.
+
+Reading also pauses while a consumer has too many of a client's messages
+still to handle (pause_reading()/resume_reading(), used by the router).
+
+Silent connections are pinged, and reaped when no pong (or anything else)
+arrives in time, so half-open sockets from sleeping laptops do not linger.
+admit() enforces the global and per-IP connection caps before the upgrade.
+"""
+
+import logging
+import os
+import selectors
+import socket
+import threading
+import time
+from collections import deque
+
+from websocket_frames import (DATA_OPCODES, OP_CLOSE, OP_CONTINUATION, OP_PING, OP_PONG, OP_TEXT, RSV1,
+                              CLOSE_GOING_AWAY, CLOSE_NORMAL, CLOSE_TOO_BIG, FrameError, MessageAssembler, check_text,
+                              decode_frame, encode_close, encode_frame)
+
+logger = logging.getLogger("hephaestus")
+
+# Largest message (frame, or fragments joined) accepted from a client
+DEFAULT_MAX_MESSAGE = int(os.environ.get("HEPHAESTUS_WS_MAX_MESSAGE", str(1024 * 1024)))
+
+# Write queue watermarks, in unsent bytes per connection: above the high
+# watermark the reactor stops reading the client's requests until the queue
+# drains below the low one; above max pending (which only pushed messages can
+# reach) the client is dropped as too slow
+DEFAULT_HIGH_WATERMARK = int(os.environ.get("HEPHAESTUS_WS_HIGH_WATERMARK", str(1024 * 1024)))
+DEFAULT_LOW_WATERMARK = int(os.environ.get("HEPHAESTUS_WS_LOW_WATERMARK", str(256 * 1024)))
+DEFAULT_MAX_PENDING = int(os.environ.get("HEPHAESTUS_WS_MAX_PENDING", str(4 * 1024 * 1024)))
+
+# Heartbeat: ping a connection after this many seconds without receiving
+# anything, and reap it when nothing arrives within the pong timeout (0 turns
+# pings off)
+DEFAULT_PING_INTERVAL = float(os.environ.get("HEPHAESTUS_WS_PING_INTERVAL", "20"))
+DEFAULT_PONG_TIMEOUT = float(os.environ.get("HEPHAESTUS_WS_PONG_TIMEOUT", "10"))
+
+# Close connections that sent no message for this many seconds (0 never does)
+DEFAULT_IDLE_TIMEOUT = float(os.environ.get("HEPHAESTUS_WS_IDLE_TIMEOUT", "0"))
+
+# Connection caps checked at upgrade time (0 for no limit)
+DEFAULT_MAX_CONNECTIONS = int(os.environ.get("HEPHAESTUS_WS_MAX_CONNECTIONS", "4096"))
+DEFAULT_MAX_PER_IP = int(os.environ.get("HEPHAESTUS_WS_MAX_PER_IP", "1024"))
+
+# Seconds between heartbeat and idle checks
+LIVENESS_CHECK_INTERVAL = 1.0
+
+# Connections listed individually in stats(), deepest queues first
+STATS_TOP_QUEUES = 10
+
+RECV_SIZE = 65536
+
+
+class WebSocketConnection:
+    """An upgraded client socket owned by a WebSocketReactor"""
+
+    def __init__(self, reactor, sock, address, deflate=None, protocol=None):
+        self.reactor = reactor
+        self.sock = sock
+        self.address = address
+        # PerMessageDeflate when the client negotiated compression
+        self.deflate = deflate
+        # Negotiated Sec-WebSocket-Protocol (see message_encoding.py), or None
+        self.protocol = protocol
+        self.inbuf = bytearray()
+        self.assembler = MessageAssembler(reactor.max_message)
+        self.outbuf = deque()
+        self.pending_bytes = 0
+        self.peak_pending = 0
+        self.paused = False
+        # Set by pause_reading(): the consumer has a backlog of our messages
+        self.read_paused = False
+        self.processing = False
+        self.last_received = time.monotonic()
+        self.last_message = self.last_received
+        # When the outstanding heartbeat ping was sent, or None
+        self.ping_sent = None
+        self.events = selectors.EVENT_READ
+        self.closing = False
+        self.closed = False
+
+    def send(self, opcode, payload):
+        """Queue a message for the client; safe to call from any thread"""
+        if self.deflate is None or opcode not in DATA_OPCODES:
+            self.reactor.send(self, encode_frame(opcode, payload))
+            return
+        # Compressed frames must be queued in the order they were compressed
+        with self.deflate.lock:
+            compressed = self.deflate.compress(payload)
+            if compressed is None:
+                self.reactor.send(self, encode_frame(opcode, payload))
+            else:
+                self.reactor.send(self, encode_frame(opcode, compressed, rsv=RSV1))
+
+    def send_text(self, text):
+        self.send(OP_TEXT, text.encode("utf-8"))
+
+    def close(self, code=CLOSE_NORMAL, reason=""):
+        """Send a close frame and close the socket once it is flushed"""
+        self.reactor.send(self, encode_close(code, reason), close_after=True)
+
+    def queue_stats(self):
+        return {
+            "address": f"{self.address[0]}:{self.address[1]}" if self.address else None,
+            "queued_bytes": self.pending_bytes,
+            "queued_frames": len(self.outbuf),
+            "peak_queued_bytes": self.peak_pending,
+            "paused": self.paused,
+            "read_paused": self.read_paused,
+        }
+
+
+class WebSocketReactor:
+    """Selector loop serving all upgraded WebSocket connections"""
+
+    def __init__(self, on_message=None, on_open=None, on_close=None, max_message=DEFAULT_MAX_MESSAGE,
+                 high_watermark=DEFAULT_HIGH_WATERMARK, low_watermark=DEFAULT_LOW_WATERMARK,
+                 max_pending=DEFAULT_MAX_PENDING, ping_interval=DEFAULT_PING_INTERVAL,
+                 pong_timeout=DEFAULT_PONG_TIMEOUT, idle_timeout=DEFAULT_IDLE_TIMEOUT,
+                 max_connections=DEFAULT_MAX_CONNECTIONS, max_per_ip=DEFAULT_MAX_PER_IP):
+        """
+        Args:
+            on_message: Called as on_message(connection, opcode, payload) for
+                text and binary frames, on the reactor thread
+            on_open: Called with each new connection, on the reactor thread
+            on_close: Called with each connection after its socket is closed
+            max_message: Largest message accepted from a client, in bytes
+            high_watermark: Queued bytes at which reading a client pauses
+            low_watermark: Queued bytes at which reading resumes
+            max_pending: Queued bytes at which a client is dropped
+            ping_interval: Seconds of silence before a heartbeat ping (0: none)
+            pong_timeout: Seconds a pinged connection has to answer
+            idle_timeout: Seconds without a message before closing (0: never)
+            max_connections: Open connections admit() allows (0: no limit)
+            max_per_ip: Open connections admit() allows per client IP
+        """
+        if not low_watermark <= high_watermark <= max_pending:
+            raise ValueError("WebSocket watermarks must satisfy low <= high <= max pending")
+        self.on_message = on_message
+        self.on_open = on_open
+        self.on_close = on_close
+        self.max_message = max_message
+        self.high_watermark = high_watermark
+        self.low_watermark = low_watermark
+        self.max_pending = max_pending
+        self.ping_interval = ping_interval
+        self.pong_timeout = pong_timeout
+        self.idle_timeout = idle_timeout
+        self.max_connections = max_connections
+        self.max_per_ip = max_per_ip
+        self.connections = set()
+        self._selector = selectors.DefaultSelector()
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        self._selector.register(self._wake_r, selectors.EVENT_READ, None)
+        self._lock = threading.Lock()
+        self._incoming = deque()
+        self._woken = False
+        # Connections admitted or open, in total and per client IP (under _lock)
+        self._admitted = 0
+        self._per_ip = {}
+        self._running = False
+        self._thread = None
+        # Counters
+        self.opened = 0
+        self.messages_in = 0
+        self.messages_out = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.oversized = 0
+        self.slow_dropped = 0
+        self.pauses = 0
+        self.read_pauses = 0
+        self.broadcasts = 0
+        self.pings_sent = 0
+        self.reaped = {"ping_timeout": 0, "idle_timeout": 0}
+        self.rejected = {"max_connections": 0, "max_per_ip": 0}
+        # permessage-deflate totals of closed connections
+        self._deflate_totals = [0, 0, 0, 0]
+
+    def start(self):
+        """Run the loop in a daemon thread"""
+        self._running = True
+        self._thread = threading.Thread(target=self.run, name="hephaestus-ws", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._running = False
+        self._wake()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=5)
+
+    def admit(self, address):
+        """Reserve a connection slot for a client about to be upgraded
+
+        Safe from any thread. Pass admitted=True to add() for the upgraded
+        socket, or call release() if the upgrade fails.
+
+        Returns:
+            None, or the cap that is full ("max_connections"/"max_per_ip")
+        """
+        ip = address[0] if address else None
+        with self._lock:
+            if self.max_connections and self._admitted >= self.max_connections:
+                self.rejected["max_connections"] += 1
+                return "max_connections"
+            if self.max_per_ip and self._per_ip.get(ip, 0) >= self.max_per_ip:
+                self.rejected["max_per_ip"] += 1
+                return "max_per_ip"
+            self._admitted += 1
+            self._per_ip[ip] = self._per_ip.get(ip, 0) + 1
+        return None
+
+    def release(self, address):
+        """Give back a slot from admit()"""
+        ip = address[0] if address else None
+        with self._lock:
+            self._admitted -= 1
+            count = self._per_ip.get(ip, 0) - 1
+            if count > 0:
+                self._per_ip[ip] = count
+            else:
+                self._per_ip.pop(ip, None)
+
+    def add(self, sock, address, initial=b"", deflate=None, protocol=None, admitted=False):
+        """Hand an upgraded socket to the reactor
+
+        Args:
+            sock: Connected socket that completed the WebSocket handshake
+            address: Client address, for logging
+            initial: Bytes already read from the socket after the handshake
+            deflate: PerMessageDeflate if compression was negotiated
+            protocol: Subprotocol the handshake selected, if any
+            admitted: A slot was already reserved with admit(); otherwise
+                the connection is counted without checking the caps
+        """
+        if not admitted:
+            ip = address[0] if address else None
+            with self._lock:
+                self._admitted += 1
+                self._per_ip[ip] = self._per_ip.get(ip, 0) + 1
+        sock.setblocking(False)
+        connection = WebSocketConnection(self, sock, address, deflate, protocol)
+        connection.inbuf.extend(initial)
+        self._submit(("add", connection, None))
+        return connection
+
+    def send(self, connection, frame, close_after=False):
+        """Queue an encoded frame for a connection; safe from any thread"""
+        if threading.current_thread() is self._thread:
+            self._queue(connection, frame, close_after)
+        else:
+            self._submit(("send", connection, (frame, close_after)))
+
+    def broadcast(self, connections, opcode, payload):
+        """Send one message to many connections; safe from any thread
+
+        The frame is encoded once and every connection's write queue holds
+        the same bytes. Connections that negotiated compression get their
+        own compressed frame.
+
+        Returns:
+            Number of connections the message was queued for
+        """
+        plain = []
+        for connection in connections:
+            if connection.deflate is not None and opcode in DATA_OPCODES:
+                connection.send(opcode, payload)
+            else:
+                plain.append(connection)
+        if plain:
+            frame = encode_frame(opcode, payload)
+            if threading.current_thread() is self._thread:
+                for connection in plain:
+                    self._queue(connection, frame)
+            else:
+                # One wakeup for the whole fan-out
+                self._submit(("broadcast", None, (plain, frame)))
+        self.broadcasts += 1
+        return len(connections)
+
+    def _submit(self, item):
+        with self._lock:
+            self._incoming.append(item)
+            wake = not self._woken
+            self._woken = True
+        if wake:
+            self._wake()
+
+    def _wake(self):
+        try:
+            self._wake_w.send(b"\0")
+        except (BlockingIOError, OSError):
+            pass
+
+    def run(self):
+        """Serve connections until stop() is called"""
+        self._running = True
+        self._thread = threading.current_thread()
+        checking = bool(self.ping_interval or self.idle_timeout)
+        next_check = time.monotonic() + LIVENESS_CHECK_INTERVAL
+        while self._running:
+            timeout = max(0.0, next_check - time.monotonic()) if checking else None
+            for key, events in self._selector.select(timeout):
+                connection = key.data
+                if connection is None:
+                    self._drain_wakeups()
+                    continue
+                if events & selectors.EVENT_WRITE:
+                    self._flush(connection)
+                if events & selectors.EVENT_READ and not connection.closed:
+                    self._read(connection)
+            if checking and time.monotonic() >= next_check:
+                self._check_liveness()
+                next_check = time.monotonic() + LIVENESS_CHECK_INTERVAL
+        for connection in list(self.connections):
+            self._close(connection)
+
+    def _drain_wakeups(self):
+        try:
+            while self._wake_r.recv(4096):
+                pass
+        except BlockingIOError:
+            pass
+        with self._lock:
+            items = list(self._incoming)
+            self._incoming.clear()
+            self._woken = False
+        for action, connection, args in items:
+            if action == "add":
+                self._register(connection)
+            elif action == "resume":
+                self._resume_reading(connection)
+            elif action == "broadcast":
+                connections, frame = args
+                for connection in connections:
+                    self._queue(connection, frame)
+            elif not connection.closed:
+                self._queue(connection, *args)
+
+    def _register(self, connection):
+        self._selector.register(connection.sock, selectors.EVENT_READ, connection)
+        self.connections.add(connection)
+        self.opened += 1
+        if self.on_open is not None:
+            self._call(self.on_open, connection)
+        # Frames that arrived together with the handshake
+        if connection.inbuf and not connection.closed:
+            self._process(connection)
+
+    def _call(self, callback, *args):
+        try:
+            callback(*args)
+        except Exception as e:
+            logger.error(f"WebSocket callback error: {e}")
+
+    def _read(self, connection):
+        try:
+            data = connection.sock.recv(RECV_SIZE)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            data = b""
+        if not data:
+            self._close(connection)
+            return
+        self.bytes_in += len(data)
+        connection.last_received = time.monotonic()
+        connection.ping_sent = None
+        connection.inbuf.extend(data)
+        self._process(connection)
+
+    def _process(self, connection):
+        """Handle every complete frame in the connection's read buffer"""
+        if connection.processing:
+            # A reply sent from a callback drained the queue and resumed
+            # reading; the outer call carries on with the buffer
+            return
+        connection.processing = True
+        buffer = connection.inbuf
+        offset = 0
+        allowed_rsv = RSV1 if connection.deflate is not None else 0
+        try:
+            while not connection.closed and not connection.paused and not connection.read_paused:
+                frame = decode_frame(buffer, offset, self.max_message, allowed_rsv, require_mask=True)
+                if frame is None:
+                    break
+                fin, opcode, payload, offset, rsv = frame
+                if opcode == OP_CONTINUATION or opcode in DATA_OPCODES:
+                    message = connection.assembler.add(fin, opcode, payload, rsv)
+                    if message is not None:
+                        opcode, payload, rsv = message
+                        if rsv & RSV1:
+                            payload = connection.deflate.decompress(payload, self.max_message)
+                        if opcode == OP_TEXT:
+                            check_text(payload)
+                        self.messages_in += 1
+                        connection.last_message = connection.last_received
+                        if self.on_message is not None:
+                            self._call(self.on_message, connection, opcode, payload)
+                elif opcode == OP_CLOSE:
+                    buffer.clear()
+                    self._queue(connection, encode_frame(OP_CLOSE, payload[:2]), close_after=True)
+                    return
+                elif opcode == OP_PING:
+                    self._queue(connection, encode_frame(OP_PONG, payload))
+                elif opcode != OP_PONG:
+                    raise FrameError(f"Unsupported WebSocket opcode: {opcode}")
+        except FrameError as e:
+            logger.warning(f"Closing WebSocket {connection.address}: {e}")
+            if e.code == CLOSE_TOO_BIG:
+                self.oversized += 1
+            buffer.clear()
+            self._queue(connection, encode_close(e.code, str(e)), close_after=True)
+            return
+        finally:
+            connection.processing = False
+        # Drop the parsed frames with one move per read instead of one per frame
+        if offset:
+            del buffer[:offset]
+
+    def pause_reading(self, connection):
+        """Stop reading a client whose messages are not being consumed
+
+        Call on the reactor thread (from on_message); frames already buffered
+        wait too. resume_reading() undoes it.
+        """
+        if not connection.read_paused:
+            connection.read_paused = True
+            self.read_pauses += 1
+            self._update_events(connection)
+
+    def resume_reading(self, connection):
+        """Undo pause_reading(); safe to call from any thread"""
+        if threading.current_thread() is self._thread:
+            self._resume_reading(connection)
+        else:
+            self._submit(("resume", connection, None))
+
+    def _resume_reading(self, connection):
+        if connection.closed or not connection.read_paused:
+            return
+        connection.read_paused = False
+        # A pong may be waiting unread; the next check pings afresh
+        connection.ping_sent = None
+        self._update_events(connection)
+        # Frames that arrived before the pause
+        if connection.inbuf and not connection.paused:
+            self._process(connection)
+
+    def _check_liveness(self):
+        """Ping silent connections, reap unanswered ones and close idle ones"""
+        now = time.monotonic()
+        for connection in list(self.connections):
+            if connection.read_paused:
+                # Not read while its backlog is handled, so it cannot be judged
+                continue
+            if connection.ping_sent is not None:
+                # Nothing at all arrived since the ping: the peer is gone
+                if now - connection.ping_sent >= self.pong_timeout:
+                    logger.info(f"Reaping WebSocket {connection.address}: no pong in {self.pong_timeout:g}s")
+                    self.reaped["ping_timeout"] += 1
+                    self._close(connection)
+                    continue
+            elif self.ping_interval and not connection.paused and not connection.closing \
+                    and now - connection.last_received >= self.ping_interval:
+                # A paused connection is not read, so it could not answer;
+                # a dead one is dropped by TCP once its unsent bytes time out
+                connection.ping_sent = now
+                self.pings_sent += 1
+                self._queue(connection, encode_frame(OP_PING, b""))
+            if self.idle_timeout and not connection.closing and not connection.closed \
+                    and now - connection.last_message >= self.idle_timeout:
+                self.reaped["idle_timeout"] += 1
+                self._queue(connection, encode_close(CLOSE_GOING_AWAY, "Idle timeout"), close_after=True)
+
+    def _queue(self, connection, frame, close_after=False):
+        if connection.closed or connection.closing:
+            return
+        if connection.pending_bytes + len(frame) > self.max_pending:
+            # The client is not reading; don't buffer without bound
+            self.slow_dropped += 1
+            self._close(connection)
+            return
+        connection.outbuf.append(memoryview(frame))
+        connection.pending_bytes += len(frame)
+        if connection.pending_bytes > connection.peak_pending:
+            connection.peak_pending = connection.pending_bytes
+        if frame[0] & 0x0F not in (OP_CLOSE, OP_PING, OP_PONG):
+            self.messages_out += 1
+        connection.closing = close_after
+        self._flush(connection)
+
+    def _flush(self, connection):
+        """Write queued bytes until the socket would block"""
+        if connection.closed:
+            return
+        outbuf = connection.outbuf
+        while outbuf:
+            try:
+                sent = connection.sock.send(outbuf[0])
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError:
+                self._close(connection)
+                return
+            self.bytes_out += sent
+            connection.pending_bytes -= sent
+            if sent == len(outbuf[0]):
+                outbuf.popleft()
+            else:
+                outbuf[0] = outbuf[0][sent:]
+        if not outbuf and connection.closing:
+            self._close(connection)
+            return
+        if connection.paused:
+            if connection.pending_bytes <= self.low_watermark:
+                connection.paused = False
+                self._update_events(connection)
+                # Requests that arrived before the pause
+                if connection.inbuf and not connection.read_paused:
+                    self._process(connection)
+                return
+        elif connection.pending_bytes > self.high_watermark:
+            # Stop taking requests from a client that does not read replies
+            connection.paused = True
+            self.pauses += 1
+        self._update_events(connection)
+
+    def _update_events(self, connection):
+        events = (0 if connection.paused or connection.read_paused else selectors.EVENT_READ) | \
+            (selectors.EVENT_WRITE if connection.outbuf else 0)
+        if events != connection.events and not connection.closed:
+            connection.events = events
+            self._selector.modify(connection.sock, events, connection)
+
+    def _close(self, connection):
+        if connection.closed:
+            return
+        connection.closed = True
+        self.connections.discard(connection)
+        self.release(connection.address)
+        try:
+            self._selector.unregister(connection.sock)
+        except (KeyError, ValueError):
+            pass
+        try:
+            connection.sock.close()
+        except OSError:
+            pass
+        connection.outbuf.clear()
+        if connection.deflate is not None:
+            deflate = connection.deflate
+            for index, value in enumerate((deflate.raw_bytes_out, deflate.bytes_out,
+                                           deflate.raw_bytes_in, deflate.bytes_in)):
+                self._deflate_totals[index] += value
+        if self.on_close is not None:
+            self._call(self.on_close, connection)
+
+    def stats(self):
+        """Return connection, traffic and write queue counters for the stats endpoint"""
+        connections = list(self.connections)
+        totals = list(self._deflate_totals)
+        compressed = 0
+        for connection in connections:
+            deflate = connection.deflate
+            if deflate is not None:
+                compressed += 1
+                for index, value in enumerate((deflate.raw_bytes_out, deflate.bytes_out,
+                                               deflate.raw_bytes_in, deflate.bytes_in)):
+                    totals[index] += value
+        protocols = {}
+        for connection in connections:
+            name = connection.protocol or "json"
+            protocols[name] = protocols.get(name, 0) + 1
+        queues = sorted((c.queue_stats() for c in connections), key=lambda q: q["queued_bytes"], reverse=True)
+        with self._lock:
+            busiest = max(self._per_ip.items(), key=lambda item: item[1], default=(None, 0))
+        return {
+            "connections": len(connections),
+            "opened": self.opened,
+            "messages_in": self.messages_in,
+            "messages_out": self.messages_out,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "oversized_closed": self.oversized,
+            "slow_dropped": self.slow_dropped,
+            "broadcasts": self.broadcasts,
+            "protocols": protocols,
+            "liveness": {
+                "ping_interval": self.ping_interval,
+                "pong_timeout": self.pong_timeout,
+                "idle_timeout": self.idle_timeout,
+                "pings_sent": self.pings_sent,
+                "awaiting_pong": sum(1 for c in connections if c.ping_sent is not None),
+                "reaped": dict(self.reaped),
+            },
+            "limits": {
+                "max_connections": self.max_connections,
+                "max_per_ip": self.max_per_ip,
+                "busiest_ip": {"ip": busiest[0], "connections": busiest[1]},
+                "rejected": dict(self.rejected),
+            },
+            "deflate": {
+                "connections": compressed,
+                "raw_bytes_out": totals[0],
+                "compressed_bytes_out": totals[1],
+                "ratio_out": round(totals[1] / totals[0], 3) if totals[0] else None,
+                "raw_bytes_in": totals[2],
+                "compressed_bytes_in": totals[3],
+            },
+            "write_queues": {
+                "queued_bytes": sum(q["queued_bytes"] for q in queues),
+                "max_queued_bytes": queues[0]["queued_bytes"] if queues else 0,
+                "paused": sum(1 for q in queues if q["paused"]),
+                "pauses": self.pauses,
+                "read_paused": sum(1 for q in queues if q["read_paused"]),
+                "read_pauses": self.read_pauses,
+                "high_watermark": self.high_watermark,
+                "low_watermark": self.low_watermark,
+                "max_pending": self.max_pending,
+                "deepest": [q for q in queues[:STATS_TOP_QUEUES] if q["queued_bytes"]],
+            },
+        }
@@ -0,0 +1,256 @@
+"""
+Routes reactor /ws connections into the WebSocketServer handlers
+
+The reactor (websocket_reactor.py) owns the sockets and frames; the chat
+handlers in server.WebSocketServer are coroutines written against the
+websockets library. WebSocketRouter runs those handlers on one asyncio loop
+thread and gives each connection a ReactorWebSocket that looks like a
+websockets connection to them: messages arrive through async iteration and
+await send() queues a frame on the reactor. Each connection's inbound queue
+is bounded: when the handler falls behind (a streamed reply is still being
+sent), the reactor stops reading that client until the handler catches up,
+as the websockets library does with max_queue.
+
+Topics keeps the /ws subscriptions used to push Hermes and component events.
+broadcast() serialises an event once per encoding (see message_encoding.py)
+and hands the reactor one frame for every subscriber instead of encoding it
+per client.
+"""
+
+import asyncio
+import os
+import threading
+from collections import defaultdict
+
+from message_encoding import codec_for
+from websocket_frames import OP_BINARY, OP_TEXT
+
+# Subscribing to this topic receives every published event
+ALL_TOPICS = "*"
+
+# Messages from one client waiting for its handler before the reactor stops
+# reading it; reading resumes once half of them are handled
+DEFAULT_MAX_QUEUE = int(os.environ.get("HEPHAESTUS_WS_MAX_QUEUE", "32"))
+
+
+class ReactorWebSocket:
+    """A reactor connection as seen by WebSocketServer's handlers"""
+
+    def __init__(self, connection, max_queue=DEFAULT_MAX_QUEUE):
+        self.connection = connection
+        self.remote_address = connection.address
+        self.subprotocol = connection.protocol
+        # Encoding of the message objects this client sends and receives
+        self.codec = codec_for(connection.protocol)
+        self.task = None
+        self.max_queue = max(1, max_queue)
+        self._messages = asyncio.Queue(self.max_queue)
+        # Messages handed to the loop and not yet taken by the handler; the
+        # reactor thread counts them in, the loop thread counts them out
+        self._queued = 0
+        self._reading_paused = False
+        self._lock = threading.Lock()
+
+    @property
+    def closed(self):
+        return self.connection.closed
+
+    async def send(self, message):
+        """Queue a text (str) or binary (bytes) message; dropped once closed"""
+        if isinstance(message, str):
+            self.connection.send_text(message)
+        else:
+            self.connection.send(OP_BINARY, bytes(message))
+
+    async def send_message(self, message):
+        """Queue a message object in the client's encoding
+
+        Returns:
+            Size of the encoded message in bytes
+        """
+        payload = self.codec.encode(message)
+        self.connection.send(self.codec.opcode, payload)
+        return len(payload)
+
+    async def close(self, code=1000, reason=""):
+        self.connection.close(code, reason)
+
+    def _received(self):
+        """Count a message for the handler; True when reading must pause"""
+        with self._lock:
+            self._queued += 1
+            if self._queued >= self.max_queue and not self._reading_paused:
+                self._reading_paused = True
+                return True
+            return False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        message = await self._messages.get()
+        if message is None:
+            raise StopAsyncIteration
+        with self._lock:
+            self._queued -= 1
+            resume = self._reading_paused and self._queued <= self.max_queue // 2
+            if resume:
+                self._reading_paused = False
+        if resume:
+            self.connection.reactor.resume_reading(self.connection)
+        return message
+
+
+class WebSocketRouter:
+    """Runs WebSocketServer.register_client for every reactor connection
+
+    Pass on_open, on_message and on_close to the WebSocketReactor. They run
+    on the reactor thread and only hand work to the router's event loop, so
+    a slow handler (a streamed LLM reply) never stalls other sockets.
+    Messages from one connection are handled in order, as with websockets.
+    """
+
+    def __init__(self, server, on_open=None, max_queue=DEFAULT_MAX_QUEUE):
+        """
+        Args:
+            server: WebSocketServer whose register_client serves each socket
+            on_open: Called with each new reactor connection before it is
+                handed to the server (the welcome message)
+            max_queue: Unhandled messages per client before reading pauses
+        """
+        self.server = server
+        self.open_callback = on_open
+        self.max_queue = max_queue
+        self.loop = asyncio.new_event_loop()
+        # Reactor connection -> ReactorWebSocket; only touched on the reactor thread
+        self.sockets = {}
+        self._thread = None
+
+    def start(self):
+        """Run the event loop in a daemon thread"""
+        self._thread = threading.Thread(target=self.loop.run_forever, name="hephaestus-ws-router", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def reactor_callbacks(self):
+        """Keyword arguments wiring a WebSocketReactor to this router"""
+        return {"on_open": self.on_open, "on_message": self.on_message, "on_close": self.on_close}
+
+    def on_open(self, connection):
+        if self.open_callback is not None:
+            self.open_callback(connection)
+        websocket = ReactorWebSocket(connection, self.max_queue)
+        self.sockets[connection] = websocket
+        self.loop.call_soon_threadsafe(self._serve, websocket)
+
+    def on_message(self, connection, opcode, payload):
+        websocket = self.sockets.get(connection)
+        if websocket is None:
+            return
+        # websockets hands text messages to handlers as str
+        message = payload.decode("utf-8") if opcode == OP_TEXT else payload
+        # Never more than max_queue: reading stops at that count
+        self.loop.call_soon_threadsafe(websocket._messages.put_nowait, message)
+        if websocket._received():
+            connection.reactor.pause_reading(connection)
+
+    def on_close(self, connection):
+        websocket = self.sockets.pop(connection, None)
+        if websocket is not None:
+            self.loop.call_soon_threadsafe(self._finish, websocket)
+
+    def _serve(self, websocket):
+        websocket.task = self.loop.create_task(self.server.register_client(websocket))
+
+    def _finish(self, websocket):
+        # End the message loop, and stop a reply still streaming to the client
+        try:
+            websocket._messages.put_nowait(None)
+        except asyncio.QueueFull:
+            pass  # The task is cancelled below
+        if websocket.task is not None and not websocket.task.done():
+            websocket.task.cancel()
+
+
+class Topics:
+    """Topic subscriptions of /ws clients; safe to use from any thread"""
+
+    def __init__(self):
+        self._subscribers = defaultdict(set)
+        self._lock = threading.Lock()
+        self.published = 0
+        self.delivered = 0
+
+    def subscribe(self, websocket, topics):
+        with self._lock:
+            for topic in topics:
+                self._subscribers[topic].add(websocket)
+
+    def unsubscribe(self, websocket, topics=None):
+        """Remove some of a client's subscriptions, or all of them"""
+        with self._lock:
+            for topic in list(self._subscribers if topics is None else topics):
+                subscribers = self._subscribers.get(topic)
+                if subscribers is not None:
+                    subscribers.discard(websocket)
+                    if not subscribers:
+                        del self._subscribers[topic]
+
+    def subscribers(self, topic):
+        """Return the clients subscribed to topic or to every topic"""
+        with self._lock:
+            return self._subscribers.get(topic, set()) | self._subscribers.get(ALL_TOPICS, set())
+
+    def publish(self, topic, message):
+        """Broadcast a message object to a topic's subscribers
+
+        Returns:
+            Number of clients the message was queued for
+        """
+        delivered = broadcast(self.subscribers(topic), message)
+        with self._lock:
+            self.published += 1
+            self.delivered += delivered
+        return delivered
+
+    def stats(self):
+        with self._lock:
+            return {
+                "topics": {topic: len(subscribers) for topic, subscribers in self._subscribers.items()},
+                "published": self.published,
+                "delivered": self.delivered,
+            }
+
+
+def broadcast(websockets, message):
+    """Send one message to many /ws clients, serialising it once per encoding
+
+    Reactor clients on the same reactor and with the same encoding share one
+    encoded frame (clients that negotiated compression are still compressed
+    one by one, as their deflate contexts differ).
+
+    Args:
+        websockets: ReactorWebSocket clients
+        message: Message object
+
+    Returns:
+        Number of clients the message was queued for
+    """
+    if not websockets:
+        return 0
+    groups = defaultdict(list)
+    for websocket in websockets:
+        if not websocket.closed:
+            groups[websocket.codec, websocket.connection.reactor].append(websocket.connection)
+    payloads = {}
+    delivered = 0
+    for (codec, reactor), connections in groups.items():
+        if codec not in payloads:
+            payloads[codec] = codec.encode(message)
+        delivered += reactor.broadcast(connections, codec.opcode, payloads[codec])
+    return delivered
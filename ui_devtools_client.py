@@ -165,6 +165,51 @@ class UIDevTools:
             "deep_scan": deep_scan
         })
     
+    async def batch(self, calls: List[Dict[str, Any]], parallel: bool = False,
+                    fail_fast: bool = True, snapshot: bool = False) -> Dict[str, Any]:
+        """
+        Run several tools in one request
+        
+        Args:
+            calls: List of {"tool_name": ..., "arguments": {...}}
+            parallel: Run consecutive read-only calls concurrently
+            fail_fast: Skip the remaining calls after the first error
+            snapshot: Let capture/analyze calls share one read of the page
+            
+        Returns:
+            Batch response: per-call "results" in order and a "summary"
+            
+        Example:
+            await ui.batch([
+                {"tool_name": "ui_capture", "arguments": {"area": "rhetor"}},
+                {"tool_name": "ui_analyze", "arguments": {"area": "rhetor"}}
+            ], parallel=True, snapshot=True)
+        """
+        try:
+            async with httpx.AsyncClient() as client:
+                response = await client.post(
+                    f"{self.mcp_url}/api/mcp/v2/execute_batch",
+                    json={
+                        "calls": calls,
+                        "parallel": parallel,
+                        "fail_fast": fail_fast,
+                        "snapshot": snapshot
+                    },
+                    timeout=30.0 * len(calls)
+                )
+                
+                data = response.json()
+                
+                if response.status_code != 200:
+                    self._last_error = data.get("detail", "Unknown error")
+                    raise Exception(f"UI DevTools error: {self._last_error}")
+                return data
+        except httpx.ConnectError:
+            raise Exception(
+                "Cannot connect to UI DevTools MCP!\n"
+                "💡 Start it with: cd $TEKTON_ROOT/Hephaestus && ./run_mcp.sh"
+            )
+    
     async def _execute(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a UI DevTools command via HTTP API"""
         try: